@@ -11,6 +11,9 @@ sys.path.append(o.abspath(o.join(o.dirname(sys.modules[__name__].__file__), ".."
 # Import random number generator.
 from mrg32k3a.mrg32k3a import MRG32k3a
 
+# Import the marker for models without gradient estimates.
+from simopt.base import NO_GRADIENTS
+
 # Import model.
 
 # from models.<filename> import <model_class_name>
@@ -53,8 +56,11 @@ print("\nFor a single replication:")
 print("\nResponses:")
 for key, value in responses.items():
     print(f"\t {key} is {value}.")
-print("\n Gradients:")
-for outerkey in gradients:
-    print(f"\tFor the response {outerkey}:")
-    for innerkey, value in gradients[outerkey].items():
-        print(f"\t\tThe gradient w.r.t. {innerkey} is {value}.")
+if gradients is NO_GRADIENTS:
+    print("\nThis model does not estimate gradients.")
+else:
+    print("\n Gradients:")
+    for outerkey in gradients:
+        print(f"\tFor the response {outerkey}:")
+        for innerkey, value in gradients[outerkey].items():
+            print(f"\t\tThe gradient w.r.t. {innerkey} is {value}.")
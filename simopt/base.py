@@ -5,10 +5,17 @@ Summary
 Provide base classes for solvers, problems, and models.
 """
 
+import copy
 import numpy as np
-from copy import deepcopy
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from mrg32k3a.mrg32k3a import MRG32k3a
 
+from .rng_streams import copy_rng, advance_substreams, start_subsubstream
+
+# Returned in place of gradient estimates by models that do not estimate gradients.
+NO_GRADIENTS = None
+
 
 class Solver(object):
     """Base class to implement simulation-optimization solvers.
@@ -25,6 +32,9 @@ class Solver(object):
         Description of variable types: "discrete", "continuous", "mixed".
     gradient_needed : bool
         True if gradient of objective function is needed, otherwise False.
+    gradient_used : bool
+        True if the solver uses gradient estimates when the problem provides them,
+        otherwise False; if False, replications are simulated without estimating gradients.
     factors : dict
         Changeable factors (i.e., parameters) of the solver.
     specifications : dict
@@ -183,8 +193,7 @@ class Solver(object):
         if not self.factors["crn_across_solns"]:  # If CRN are not used ...
             # ...advance each rng to start of the substream = current substream + # of model RNGs.
             for rng in self.solution_progenitor_rngs:
-                for _ in range(problem.model.n_rngs):
-                    rng.advance_substream()
+                advance_substreams(rng, problem.model.n_rngs)
         return new_solution
 
     def rebase(self, n_reps):
@@ -197,9 +206,9 @@ class Solver(object):
         """
         new_rngs = []
         for rng in self.solution_progenitor_rngs:
-            stream_index = rng.s_ss_sss_index[0]
-            substream_index = rng.s_ss_sss_index[1]
-            new_rngs.append(MRG32k3a(s_ss_sss_index=[stream_index, substream_index, n_reps]))
+            new_rng = copy_rng(rng)
+            start_subsubstream(new_rng, n_reps)
+            new_rngs.append(new_rng)
         self.solution_progenitor_rngs = new_rngs
 
 
@@ -251,6 +260,17 @@ class Problem(object):
                 Max number of replications (fn evals) for a solver to take.
     specifications : dict
         Details of each factor (for GUI, data validation, and defaults).
+    n_workers : int
+        Number of worker processes among which the replications taken at
+        a solution, or at the solutions passed to ``simulate_up_to``, are
+        split; 1 (default) simulates them serially.
+    replication_cache : ``replication_cache.ReplicationCache``
+        Cache of simulated replications; None (default) disables caching.
+    async_executor : str
+        Executor of the replications requested by ``simulate_async``:
+        "inline" (default) simulates them in the calling process before
+        returning, "thread" in a pool of ``n_workers`` threads, and
+        "process" in a pool of ``n_workers`` worker processes.
 
     Parameters
     ----------
@@ -272,6 +292,12 @@ class Problem(object):
             if key not in model_fixed_factors:
                 model_fixed_factors[key] = self.model_default_factors[key]
         self.model_fixed_factors = model_fixed_factors
+        # Simulate replications serially unless parallelism is requested.
+        self.n_workers = 1
+        # Do not cache replications unless requested.
+        self.replication_cache = None
+        # Simulate asynchronous requests in the calling process unless an executor is requested.
+        self.async_executor = "inline"
         # super().__init__()
 
     def __eq__(self, other):
@@ -513,6 +539,77 @@ class Problem(object):
         stoch_constraints = ()
         return stoch_constraints
 
+    def response_batch_to_objectives(self, responses):
+        """Convert a batch of responses to a matrix of objectives.
+
+        Notes
+        -----
+        The default implementation applies ``response_dict_to_objectives``
+        to one replication at a time. A subclass whose conversion acts
+        elementwise can override this method to convert whole columns at once.
+
+        Parameters
+        ----------
+        responses : numpy structured array
+            Responses with one row per replication and one field per response.
+
+        Returns
+        -------
+        objectives : numpy array
+            Objectives; # replications x # objectives.
+        """
+        objectives = [self.response_dict_to_objectives(response) for response in responses]
+        return np.array(objectives, dtype=float).reshape(len(responses), self.n_objectives)
+
+    def gradient_batch_to_objectives_gradients(self, gradients):
+        """Convert a batch of gradients with respect to model factors to
+        gradients of objectives with respect to decision variables.
+
+        Notes
+        -----
+        The default implementation applies ``factor_dict_to_vector_gradients``
+        and ``response_dict_to_objectives_gradients`` to one replication at a time.
+
+        Parameters
+        ----------
+        gradients : numpy structured array
+            Gradients with one row per replication, one field per response
+            and one subfield per factor.
+
+        Returns
+        -------
+        objectives_gradients : numpy array
+            Gradients of objectives; # replications x # objectives x dimension.
+        """
+        objectives_gradients = []
+        for gradient in gradients:
+            # Convert gradient subdictionaries to vectors mapping to decision variables.
+            vector_gradients = {key: self.factor_dict_to_vector_gradients(gradient[key]) for key in gradients.dtype.names}
+            objectives_gradients.append(self.response_dict_to_objectives_gradients(vector_gradients))
+        return np.array(objectives_gradients, dtype=float).reshape(len(gradients), self.n_objectives, self.dim)
+
+    def response_batch_to_stoch_constraints(self, responses):
+        """Convert a batch of responses to a matrix of left-hand sides
+        of stochastic constraints: E[Y] <= 0.
+
+        Notes
+        -----
+        The default implementation applies ``response_dict_to_stoch_constraints``
+        to one replication at a time.
+
+        Parameters
+        ----------
+        responses : numpy structured array
+            Responses with one row per replication and one field per response.
+
+        Returns
+        -------
+        stoch_constraints : numpy array
+            LHSs of stochastic constraints; # replications x # stochastic constraints.
+        """
+        stoch_constraints = [self.response_dict_to_stoch_constraints(response) for response in responses]
+        return np.array(stoch_constraints, dtype=float).reshape(len(responses), self.n_stochastic_constraints)
+
     def deterministic_objectives_and_gradients(self, x):
         """Compute deterministic components of objectives for a solution `x`.
 
@@ -587,7 +684,7 @@ class Problem(object):
         """
         pass
 
-    def simulate(self, solution, m=1):
+    def simulate(self, solution, m=1, need_gradients=True):
         """Simulate `m` i.i.d. replications at solution `x`.
 
         Notes
@@ -595,65 +692,238 @@ class Problem(object):
         Gradients of objective function and stochastic constraint LHSs
         are temporarily commented out. Under development.
 
+        If ``n_workers`` is greater than 1, the replications are split among
+        that many worker processes. Replication `k` is still simulated with
+        the `k`-th subsubstream from the current one, so the results are
+        identical to those of the serial path.
+
+        If ``replication_cache`` is set, replications already simulated at `x`
+        with the same subsubstreams are copied from the cache instead of
+        being simulated again, and new replications are added to it.
+
+        If `need_gradients` is False, the model may skip estimating gradients
+        and the gradients of the objectives of the new replications are NaN.
+
         Parameters
         ----------
         solution : ``base.Solution``
             Solution to evalaute.
         m : int
             Number of replications to simulate at `x`.
+        need_gradients : bool, default=True
+            True if gradients of the objectives are needed, otherwise False.
         """
         if m < 1:
             print('--* Error: Number of replications must be at least 1. ')
             print('--* Aborting. ')
         else:
-            # Pad numpy arrays if necessary.
-            if solution.n_reps + m > solution.storage_size:
-                solution.pad_storage(m)
-            # Set the decision factors of the model.
-            self.model.factors.update(solution.decision_factors)
-            for _ in range(m):
-                # Generate one replication at x.
-                responses, gradients = self.model.replicate(solution.rng_list)
-                # Convert gradient subdictionaries to vectors mapping to decision variables.
-                if self.gradient_available:
-                    vector_gradients = {keys: self.factor_dict_to_vector_gradients(gradient_dict) for (keys, gradient_dict) in gradients.items()}
-                    # vector_gradients = {keys: self.factor_dict_to_vector(gradient_dict) for (keys, gradient_dict) in gradients.items()}
-                # Convert responses and gradients to objectives and gradients and add
-                # to those of deterministic components of objectives.
-                solution.objectives[solution.n_reps] = [sum(pairs) for pairs in zip(self.response_dict_to_objectives(responses), solution.det_objectives)]
-                if self.gradient_available:
-                    # print(self.response_dict_to_objectives_gradients(vector_gradients))
-                    # print(solution.det_objectives_gradients)
-                    solution.objectives_gradients[solution.n_reps] = [[sum(pairs) for pairs in zip(stoch_obj, det_obj)] for stoch_obj, det_obj in zip(self.response_dict_to_objectives_gradients(vector_gradients), solution.det_objectives_gradients)]
-                    # solution.objectives_gradients[solution.n_reps] = [[sum(pairs) for pairs in zip(stoch_obj, det_obj)] for stoch_obj, det_obj in zip(self.response_dict_to_objectives(vector_gradients), solution.det_objectives_gradients)]
-                if self.n_stochastic_constraints > 0:
-                    # Convert responses and gradients to stochastic constraints and gradients and add
-                    # to those of deterministic components of stochastic constraints.
-                    solution.stoch_constraints[solution.n_reps] = [sum(pairs) for pairs in zip(self.response_dict_to_stoch_constraints(responses), solution.det_stoch_constraints)]
-                    # solution.stoch_constraints_gradients[solution.n_reps] = [[sum(pairs) for pairs in zip(stoch_stoch_cons, det_stoch_cons)] for stoch_stoch_cons, det_stoch_cons in zip(self.response_dict_to_stoch_constraints(vector_gradients), solution.det_stoch_constraints_gradients)]
-                # Increment counter.
-                solution.n_reps += 1
-                # Advance rngs to start of next subsubstream.
-                for rng in solution.rng_list:
-                    rng.advance_subsubstream()
-            # Update summary statistics.
-            solution.recompute_summary_statistics()
+            n_cached, rep_keys = self.prepare_replications(solution, m)
+            need_gradients = need_gradients and self.gradient_available
+            m_new = m - n_cached
+            responses, gradients = None, None
+            if m_new > 0:
+                # Set the decision factors of the model.
+                self.model.factors.update(solution.decision_factors)
+                # Generate the remaining replications at x.
+                # The rngs are left at the start of the next unused subsubstream.
+                n_workers = min(self.n_workers, m_new)
+                if n_workers > 1 and not multiprocessing.current_process().daemon:
+                    responses, gradients = replicate_batch_parallel(self.model, solution.rng_list, m_new, n_workers, need_gradients)
+                else:
+                    responses, gradients = self.model.replicate_batch(solution.rng_list, m_new, need_gradients)
+            self.record_replications(solution, m, n_cached, rep_keys, responses, gradients, need_gradients)
+
+    def prepare_replications(self, solution, m):
+        """Make room for `m` more replications at a solution and copy those
+        already in the cache, if any, skipping their subsubstreams.
 
-    def simulate_up_to(self, solutions, n_reps):
+        Parameters
+        ----------
+        solution : ``base.Solution``
+            Solution to evaluate.
+        m : int
+            Number of replications to take at `x`.
+
+        Returns
+        -------
+        n_cached : int
+            Number of leading replications copied from the cache.
+        rep_keys : list [tuple]
+            Cache keys of the `m` replications; None if not cached.
+        """
+        # Finish replications requested earlier by ``simulate_async``, if any.
+        if solution.pending_simulation is not None:
+            solution.pending_simulation.result()
+        # Pad numpy arrays if necessary.
+        if solution.n_reps + m > solution.storage_size:
+            solution.pad_storage(m)
+        # Copy replications already in the cache, if any, and skip their subsubstreams.
+        n_cached = 0
+        rep_keys = None
+        replication_cache = self.replication_cache
+        if replication_cache is not None:
+            rep_keys = replication_cache.replication_keys(self, solution, m)
+            if rep_keys is not None:
+                n_cached = replication_cache.load(solution, rep_keys)
+                if n_cached > 0:
+                    for rng in solution.rng_list:
+                        start_subsubstream(rng, rng.s_ss_sss_index[2] + n_cached)
+        return n_cached, rep_keys
+
+    def record_replications(self, solution, m, n_cached, rep_keys, responses, gradients, need_gradients):
+        """Store the outputs of `m` replications taken at a solution and
+        update its summary statistics.
+
+        Parameters
+        ----------
+        solution : ``base.Solution``
+            Evaluated solution, as left by ``prepare_replications``.
+        m : int
+            Number of replications taken at `x`.
+        n_cached : int
+            Number of leading replications copied from the cache.
+        rep_keys : list [tuple]
+            Cache keys of the `m` replications; None if not cached.
+        responses : numpy structured array
+            Performance measures of the `m - n_cached` simulated replications.
+        gradients : numpy structured array
+            Gradient estimates of the `m - n_cached` simulated replications.
+        need_gradients : bool
+            True if gradients were estimated, otherwise False.
+        """
+        if m > n_cached:
+            # Convert responses and gradients to objectives and gradients and add
+            # to those of deterministic components of objectives.
+            new_reps = slice(solution.n_reps + n_cached, solution.n_reps + m)
+            solution.objectives[new_reps] = self.response_batch_to_objectives(responses) + np.array(solution.det_objectives)
+            if self.gradient_available:
+                if not need_gradients:
+                    solution.objectives_gradients[new_reps] = np.nan
+                elif gradients is NO_GRADIENTS:
+                    # The objectives' gradients are those of their deterministic components.
+                    solution.objectives_gradients[new_reps] = np.array(solution.det_objectives_gradients)
+                else:
+                    solution.objectives_gradients[new_reps] = self.gradient_batch_to_objectives_gradients(gradients) + np.array(solution.det_objectives_gradients)
+            if self.n_stochastic_constraints > 0:
+                # Convert responses to stochastic constraints and add
+                # to those of deterministic components of stochastic constraints.
+                solution.stoch_constraints[new_reps] = self.response_batch_to_stoch_constraints(responses) + np.array(solution.det_stoch_constraints)
+            # Only cache replications with complete outputs.
+            if rep_keys is not None and need_gradients == self.gradient_available:
+                self.replication_cache.store(solution, rep_keys[n_cached:], solution.n_reps + n_cached)
+        # Increment counter.
+        solution.n_reps += m
+        # Update summary statistics with the new replications.
+        solution.update_summary_statistics(m)
+
+    def simulate_up_to(self, solutions, n_reps, need_gradients=True):
         """Simulate a set of solutions up to a given number of replications.
 
+        Notes
+        -----
+        If ``n_workers`` is greater than 1 and several solutions need more
+        replications, each solution's missing replications are simulated
+        by a worker process and merged back in order. Since every solution
+        has its own RNGs, the results are identical to those of the serial path.
+
         Parameters
         ----------
         solutions : set [``base.Solution``]
             A set of ``base.Solution`` objects.
         n_reps : int
             Common number of replications to simulate each solution up to.
+        need_gradients : bool, default=True
+            True if gradients of the objectives are needed, otherwise False.
         """
+        # Collect the solutions needing more replications, once each.
+        pending = []
         for solution in solutions:
-            # If more replications needed, take them.
-            if solution.n_reps < n_reps:
+            # Count replications requested earlier by ``simulate_async``, if any.
+            if solution.pending_simulation is not None:
+                solution.pending_simulation.result()
+            if solution.n_reps < n_reps and not any(solution is other for other in pending):
+                pending.append(solution)
+        n_workers = self.n_workers
+        if n_workers <= 1 or len(pending) < 2 or multiprocessing.current_process().daemon:
+            for solution in pending:
+                # If more replications needed, take them.
                 n_reps_to_take = n_reps - solution.n_reps
-                self.simulate(solution=solution, m=n_reps_to_take)
+                self.simulate(solution=solution, m=n_reps_to_take, need_gradients=need_gradients)
+            return
+        need_gradients = need_gradients and self.gradient_available
+        pool = get_process_pool(n_workers)
+        tasks = []
+        for solution in pending:
+            m = n_reps - solution.n_reps
+            n_cached, rep_keys = self.prepare_replications(solution, m)
+            m_new = m - n_cached
+            future = None
+            if m_new > 0:
+                # The worker sets the decision factors of its copy of the model.
+                rng_indices = [(rng.ref_seed, tuple(rng.s_ss_sss_index)) for rng in solution.rng_list]
+                future = pool.submit(replicate_chunk, self.model, rng_indices, m_new, need_gradients, solution.decision_factors)
+                # Advance rngs to start of the subsubstream following the last replication.
+                for rng in solution.rng_list:
+                    start_subsubstream(rng, rng.s_ss_sss_index[2] + m_new)
+            tasks.append((solution, m, n_cached, rep_keys, future))
+        for solution, m, n_cached, rep_keys, future in tasks:
+            responses, gradients = (None, None) if future is None else future.result()
+            self.record_replications(solution, m, n_cached, rep_keys, responses, gradients, need_gradients)
+
+    def simulate_async(self, solution, m=1, need_gradients=True):
+        """Request `m` i.i.d. replications at solution `x` without waiting
+        for them to be simulated.
+
+        Notes
+        -----
+        The RNGs of the solution are advanced past the `m` replications
+        immediately, so the requested replications are those ``simulate``
+        would take and the budget they use is known when requesting them.
+        The replications are recorded in the solution when the result of
+        the returned future is requested, e.g., by ``base.wait_all``, or
+        before the solution is simulated again.
+
+        Parameters
+        ----------
+        solution : ``base.Solution``
+            Solution to evalaute.
+        m : int
+            Number of replications to simulate at `x`.
+        need_gradients : bool, default=True
+            True if gradients of the objectives are needed, otherwise False.
+
+        Returns
+        -------
+        ``base.SimulationFuture``
+            Pending replications at the solution.
+        """
+        executor = self.async_executor
+        if executor not in ("inline", "thread", "process"):
+            raise ValueError(f"Unknown executor {executor}; use 'inline', 'thread', or 'process'.")
+        if m < 1 or executor == "inline" or multiprocessing.current_process().daemon:
+            self.simulate(solution, m, need_gradients)
+            return SimulationFuture(self, solution, m=0)
+        n_cached, rep_keys = self.prepare_replications(solution, m)
+        need_gradients = need_gradients and self.gradient_available
+        m_new = m - n_cached
+        if m_new > 0:
+            rng_indices = [(rng.ref_seed, tuple(rng.s_ss_sss_index)) for rng in solution.rng_list]
+            if executor == "thread":
+                # Threads share memory, so each one sets the decision factors of its own copy of the model.
+                model = copy.copy(self.model)
+                model.factors = dict(self.model.factors)
+                pool = get_thread_pool(self.n_workers)
+            else:
+                model = self.model
+                pool = get_process_pool(self.n_workers)
+            future = pool.submit(replicate_chunk, model, rng_indices, m_new, need_gradients, solution.decision_factors)
+            # Advance rngs to start of the subsubstream following the last replication.
+            for rng in solution.rng_list:
+                start_subsubstream(rng, rng.s_ss_sss_index[2] + m_new)
+        else:
+            future = Future()
+            future.set_result((None, None))
+        return SimulationFuture(self, solution, m, n_cached, rep_keys, need_gradients, future)
 
 
 class Model(object):
@@ -769,10 +1039,435 @@ class Model(object):
         responses : dict
             Performance measures of interest.
         gradients : dict [dict]
-            Gradient estimate for each response.
+            Gradient estimate for each response; ``base.NO_GRADIENTS`` if
+            the model does not estimate gradients.
         """
         raise NotImplementedError
 
+    def response_dtype(self):
+        """Return the numpy structured dtype of the responses of a single
+        replication for the current model factors.
+
+        Notes
+        -----
+        The default implementation returns None, in which case
+        ``replicate_batch`` infers the dtype from the first replication.
+
+        Returns
+        -------
+        numpy dtype
+            One field per response, in the order returned by ``replicate``.
+        """
+        return None
+
+    def replicate_batch(self, rng_list, m, need_gradients=True):
+        """Simulate `m` replications for the current model factors.
+
+        Notes
+        -----
+        The default implementation calls ``replicate`` once per replication
+        and advances the RNGs to the start of the next subsubstream after each.
+        The outputs are written directly into arrays allocated once, with
+        the dtype given by ``response_dtype`` (responses) or that of the
+        first replication (gradients).
+        A subclass can override this method with a vectorized implementation,
+        provided that replication `k` uses the `k`-th subsubstream from the
+        current one, exactly as repeated calls to ``replicate`` would.
+
+        Parameters
+        ----------
+        rng_list : list [``mrg32k3a.mrg32k3a.MRG32k3a``]
+            RNGs for model to use when simulating the replications.
+            They are left at the start of the subsubstream following
+            the last replication.
+        m : int
+            Number of replications to simulate.
+        need_gradients : bool, default=True
+            True if gradient estimates are needed, otherwise False.
+
+        Returns
+        -------
+        responses : numpy structured array
+            Performance measures of interest; one row per replication
+            and one field per response.
+        gradients : numpy structured array
+            Gradient estimates for each response; one row per replication,
+            one field per response and one subfield per factor.
+            ``base.NO_GRADIENTS`` if the model does not estimate gradients
+            or if `need_gradients` is False.
+        """
+        response_dtype = self.response_dtype()
+        gradients = NO_GRADIENTS
+        for rep in range(m):
+            response, gradient = self.replicate(rng_list)
+            if rep == 0:
+                # Allocate storage once the shapes of the outputs are known.
+                if response_dtype is None:
+                    response_dtype = record_dtype(response)
+                responses = np.empty(m, dtype=response_dtype)
+                if need_gradients and gradient is not NO_GRADIENTS:
+                    gradients = np.empty(m, dtype=record_dtype(gradient))
+            fill_record(responses, rep, response)
+            if gradients is not NO_GRADIENTS:
+                fill_record(gradients, rep, gradient)
+            # Advance rngs to start of next subsubstream.
+            for rng in rng_list:
+                rng.advance_subsubstream()
+        return responses, gradients
+
+
+def record_dtype(values):
+    """Return the numpy structured dtype of a record holding a (nested)
+    dictionary of outputs of a single replication.
+
+    Parameters
+    ----------
+    values : dict
+        Dictionary of scalars, array-likes, or such dictionaries.
+
+    Returns
+    -------
+    numpy dtype
+        Structured dtype with one (float) field per key of `values`.
+    """
+    return np.dtype([(key, record_dtype(value)) if isinstance(value, dict) else (key, float, np.shape(value))
+                     for key, value in values.items()])
+
+
+def fill_record(records, row, values):
+    """Copy a (nested) dictionary of outputs of a single replication into
+    one row of a numpy structured array.
+
+    Parameters
+    ----------
+    records : numpy structured array
+        Records with one row per replication.
+    row : int
+        Row to fill.
+    values : dict
+        Dictionary with (at least) the fields of `records` as keys.
+    """
+    for key in records.dtype.names:
+        if records.dtype[key].names is None:
+            records[key][row] = values[key]
+        else:
+            fill_record(records[key], row, values[key])
+
+
+def records_from_columns(columns, m):
+    """Pack a (nested) dictionary of columns into a numpy structured array
+    with one row per replication.
+
+    Parameters
+    ----------
+    columns : dict
+        Dictionary of numpy arrays whose first axis has length `m`,
+        of scalars shared by all replications, or of such dictionaries.
+    m : int
+        Number of replications (rows).
+
+    Returns
+    -------
+    records : numpy structured array
+        Array of length `m` with one field per key of `columns`.
+    """
+    def field_dtype(value):
+        if isinstance(value, dict):
+            return np.dtype([(key, field_dtype(subvalue)) for key, subvalue in value.items()])
+        return np.dtype((float, np.shape(value)[1:]))
+
+    def fill(records, value):
+        if isinstance(value, dict):
+            for key, subvalue in value.items():
+                fill(records[key], subvalue)
+        else:
+            records[...] = value
+
+    records = np.empty(m, dtype=field_dtype(columns))
+    fill(records, columns)
+    return records
+
+
+def row_from_columns(columns, row):
+    """Extract the outputs of a single replication from a (nested)
+    dictionary of columns, e.g., to return them from ``replicate``.
+
+    Parameters
+    ----------
+    columns : dict
+        Dictionary of numpy arrays whose first axis has one entry per
+        replication, of scalars shared by all replications, or of such
+        dictionaries.
+    row : int
+        Replication to extract.
+
+    Returns
+    -------
+    values : dict
+        Dictionary with the same keys as `columns` and the values of
+        replication `row`.
+    """
+    return {key: row_from_columns(value, row) if isinstance(value, dict)
+            else value if np.ndim(value) == 0 else value[row]
+            for key, value in columns.items()}
+
+
+# Process pools shared by all problems, keyed by number of workers.
+process_pools = {}
+
+
+def get_process_pool(n_workers):
+    """Return a process pool with `n_workers` workers, creating it on first use.
+
+    Parameters
+    ----------
+    n_workers : int
+        Number of worker processes.
+
+    Returns
+    -------
+    pool : ``concurrent.futures.ProcessPoolExecutor``
+        Process pool with `n_workers` workers.
+    """
+    if n_workers not in process_pools:
+        process_pools[n_workers] = ProcessPoolExecutor(max_workers=n_workers)
+    return process_pools[n_workers]
+
+
+# Thread pools shared by all problems, keyed by number of workers.
+thread_pools = {}
+
+
+def get_thread_pool(n_workers):
+    """Return a thread pool with `n_workers` threads, creating it on first use.
+
+    Parameters
+    ----------
+    n_workers : int
+        Number of threads.
+
+    Returns
+    -------
+    pool : ``concurrent.futures.ThreadPoolExecutor``
+        Thread pool with `n_workers` threads.
+    """
+    if n_workers not in thread_pools:
+        thread_pools[n_workers] = ThreadPoolExecutor(max_workers=n_workers)
+    return thread_pools[n_workers]
+
+
+def replicate_chunk(model, rng_indices, m, need_gradients=True, decision_factors=None):
+    """Simulate `m` replications of a model with RNGs started at given
+    subsubstreams. Used by worker processes.
+
+    Parameters
+    ----------
+    model : ``base.Model``
+        Simulation model with its factors set.
+    rng_indices : list [tuple]
+        Reference seed and stream-substream-subsubstream indices at which
+        to start each RNG.
+    m : int
+        Number of replications to simulate.
+    need_gradients : bool, default=True
+        True if gradient estimates are needed, otherwise False.
+    decision_factors : dict, optional
+        Decision factors to set in the model before simulating.
+
+    Returns
+    -------
+    responses : numpy structured array
+        Performance measures of interest; one row per replication.
+    gradients : numpy structured array
+        Gradient estimates for each response; one row per replication.
+    """
+    if decision_factors is not None:
+        model.factors.update(decision_factors)
+    rng_list = [MRG32k3a(ref_seed=ref_seed, s_ss_sss_index=list(s_ss_sss_index)) for ref_seed, s_ss_sss_index in rng_indices]
+    return model.replicate_batch(rng_list, m, need_gradients)
+
+
+def replicate_batch_parallel(model, rng_list, m, n_workers, need_gradients=True):
+    """Simulate `m` replications of a model split among worker processes.
+
+    Notes
+    -----
+    Each worker jumps its RNGs directly to the subsubstream of its first
+    replication, so replication `k` uses the `k`-th subsubstream from the
+    current one, as in ``base.Model.replicate_batch``. The RNGs are assumed
+    to be at the start of a subsubstream.
+
+    Parameters
+    ----------
+    model : ``base.Model``
+        Simulation model with its factors set.
+    rng_list : list [``mrg32k3a.mrg32k3a.MRG32k3a``]
+        RNGs for model to use when simulating the replications.
+        They are left at the start of the subsubstream following
+        the last replication.
+    m : int
+        Number of replications to simulate.
+    n_workers : int
+        Number of worker processes.
+    need_gradients : bool, default=True
+        True if gradient estimates are needed, otherwise False.
+
+    Returns
+    -------
+    responses : numpy structured array
+        Performance measures of interest; one row per replication.
+    gradients : numpy structured array
+        Gradient estimates for each response; one row per replication.
+    """
+    pool = get_process_pool(n_workers)
+    # Split the replications into contiguous chunks, one per worker.
+    chunk_sizes = [len(chunk) for chunk in np.array_split(np.arange(m), n_workers)]
+    chunk_starts = np.cumsum([0] + chunk_sizes[:-1])
+    futures = []
+    for start, size in zip(chunk_starts, chunk_sizes):
+        rng_indices = [(rng.ref_seed, (rng.s_ss_sss_index[0], rng.s_ss_sss_index[1], rng.s_ss_sss_index[2] + int(start))) for rng in rng_list]
+        futures.append(pool.submit(replicate_chunk, model, rng_indices, size, need_gradients))
+    results = [future.result() for future in futures]
+    # Advance rngs to start of the subsubstream following the last replication.
+    for rng in rng_list:
+        start_subsubstream(rng, rng.s_ss_sss_index[2] + m)
+    responses = np.concatenate([result[0] for result in results])
+    if results[0][1] is NO_GRADIENTS:
+        return responses, NO_GRADIENTS
+    gradients = np.concatenate([result[1] for result in results])
+    return responses, gradients
+
+
+class SimulationFuture(object):
+    """Replications requested at a solution by ``base.Problem.simulate_async``.
+
+    Attributes
+    ----------
+    problem : ``base.Problem``
+        Problem being simulated.
+    solution : ``base.Solution``
+        Solution being simulated.
+    m : int
+        Number of replications requested; 0 if already recorded.
+    n_cached : int
+        Number of leading replications copied from the cache.
+    rep_keys : list [tuple]
+        Cache keys of the replications; None if not cached.
+    need_gradients : bool
+        True if gradients are estimated, otherwise False.
+    future : ``concurrent.futures.Future``
+        Outputs of the simulated replications.
+
+    Parameters
+    ----------
+    problem : ``base.Problem``
+        Problem being simulated.
+    solution : ``base.Solution``
+        Solution being simulated.
+    m : int
+        Number of replications requested; 0 if already recorded.
+    n_cached : int, default=0
+        Number of leading replications copied from the cache.
+    rep_keys : list [tuple], optional
+        Cache keys of the replications; None if not cached.
+    need_gradients : bool, default=True
+        True if gradients are estimated, otherwise False.
+    future : ``concurrent.futures.Future``, optional
+        Outputs of the simulated replications.
+    """
+    def __init__(self, problem, solution, m, n_cached=0, rep_keys=None, need_gradients=True, future=None):
+        self.problem = problem
+        self.solution = solution
+        self.m = m
+        self.n_cached = n_cached
+        self.rep_keys = rep_keys
+        self.need_gradients = need_gradients
+        self.future = future
+        if m > 0:
+            solution.pending_simulation = self
+
+    def done(self):
+        """Check if the replications have been simulated.
+
+        Returns
+        -------
+        bool
+            True if the replications have been simulated, otherwise False.
+        """
+        return self.m == 0 or self.future.done()
+
+    def result(self):
+        """Wait for the replications and record them in the solution.
+
+        Returns
+        -------
+        ``base.Solution``
+            Simulated solution.
+        """
+        if self.m > 0:
+            responses, gradients = self.future.result()
+            m = self.m
+            self.m = 0
+            self.solution.pending_simulation = None
+            self.problem.record_replications(self.solution, m, self.n_cached, self.rep_keys, responses, gradients, self.need_gradients)
+        return self.solution
+
+
+def wait_all(futures):
+    """Wait for replications requested by ``base.Problem.simulate_async``
+    and record them in their solutions, in order.
+
+    Parameters
+    ----------
+    futures : list [``base.SimulationFuture``]
+        Pending replications.
+
+    Returns
+    -------
+    list [``base.Solution``]
+        Simulated solutions.
+    """
+    return [future.result() for future in futures]
+
+
+def update_moments(mean, comoment, n, new_data):
+    """Merge a batch of observations into a running mean and co-moment matrix.
+
+    Notes
+    -----
+    Uses the pairwise update of Chan, Golub, and LeVeque (1979), which
+    reduces to Welford's algorithm when the batch has a single observation.
+
+    Parameters
+    ----------
+    mean : numpy array
+        Mean of the `n` observations merged so far.
+    comoment : numpy array
+        Sum of products of deviations from `mean` of the `n` observations merged so far.
+    n : int
+        Number of observations merged so far.
+    new_data : numpy array
+        New observations; # observations x # variables.
+
+    Returns
+    -------
+    mean : numpy array
+        Mean of all observations.
+    comoment : numpy array
+        Sum of products of deviations from `mean` of all observations.
+    """
+    m = len(new_data)
+    batch_mean = np.mean(new_data, axis=0)
+    deviations = new_data - batch_mean
+    batch_comoment = deviations.T @ deviations
+    if n == 0:
+        return batch_mean, batch_comoment
+    total = n + m
+    delta = batch_mean - mean
+    mean = mean + delta * (m / total)
+    comoment = comoment + batch_comoment + np.outer(delta, delta) * (n * m / total)
+    return mean, comoment
+
 
 class Solution(object):
     """Base class for solutions represented as vectors of decision variables
@@ -808,12 +1503,23 @@ class Solution(object):
     objectives_gradients : numpy array
         Gradient estimates of objective(s) from each replication;
         # replications x # objectives x dimension.
+        None if the problem does not provide gradients.
     stochastic_constraints : numpy array
         Stochastic constraint estimates from each replication;
         # replications x # stochastic constraints.
     stochastic_constraints_gradients : numpy array
         Gradient estimates of stochastic constraints from each replication;
         # replications x # stochastic constraints x dimension.
+        None if the problem does not provide gradients.
+    objectives_comoment : numpy array
+        Running sum of products of deviations of objectives from their means;
+        # objectives x # objectives.
+    stoch_constraints_comoment : numpy array
+        Running sum of products of deviations of stochastic constraints from
+        their means; # stochastic constraints x # stochastic constraints.
+    pending_simulation : ``base.SimulationFuture``
+        Replications requested by ``base.Problem.simulate_async`` and not
+        yet recorded; None if there are none.
 
 
     Parameters
@@ -829,19 +1535,33 @@ class Solution(object):
         self.dim = len(x)
         self.decision_factors = problem.vector_to_factor_dict(x)
         self.n_reps = 0
+        self.pending_simulation = None
         self.det_objectives, self.det_objectives_gradients = problem.deterministic_objectives_and_gradients(self.x)
         self.det_stoch_constraints, self.det_stoch_constraints_gradients = problem.deterministic_stochastic_constraints_and_gradients(self.x)
         init_size = 100  # Initialize numpy arrays to store up to 100 replications.
         self.storage_size = init_size
         # Raw data.
+        # Gradient storage is only allocated if the problem provides gradients.
         self.objectives = np.zeros((init_size, problem.n_objectives))
-        self.objectives_gradients = np.zeros((init_size, problem.n_objectives, problem.dim))
+        if problem.gradient_available:
+            self.objectives_gradients = np.zeros((init_size, problem.n_objectives, problem.dim))
+        else:
+            self.objectives_gradients = None
         if problem.n_stochastic_constraints > 0:
             self.stoch_constraints = np.zeros((init_size, problem.n_stochastic_constraints))
-            self.stoch_constraints_gradients = np.zeros((init_size, problem.n_stochastic_constraints, problem.dim))
+            if problem.gradient_available:
+                self.stoch_constraints_gradients = np.zeros((init_size, problem.n_stochastic_constraints, problem.dim))
+            else:
+                self.stoch_constraints_gradients = None
         else:
             self.stoch_constraints = None
             self.stoch_constraints_gradients = None
+        # Running moments from which summary statistics are derived.
+        self.objectives_comoment = np.zeros((problem.n_objectives, problem.n_objectives))
+        if problem.n_stochastic_constraints > 0:
+            self.stoch_constraints_comoment = np.zeros((problem.n_stochastic_constraints, problem.n_stochastic_constraints))
+        else:
+            self.stoch_constraints_comoment = None
         # Summary statistics
         # self.objectives_mean = np.full((problem.n_objectives), np.nan)
         # self.objectives_var = np.full((problem.n_objectives), np.nan)
@@ -871,56 +1591,113 @@ class Solution(object):
             True if we want to copy the ``mrg32k3a.mrg32k3a.MRG32k3a`` objects, otherwise False.
         """
         if copy:
-            self.rng_list = [deepcopy(rng) for rng in rng_list]
+            self.rng_list = [copy_rng(rng) for rng in rng_list]
         else:
             self.rng_list = rng_list
 
     def pad_storage(self, m):
-        """Append zeros to numpy arrays for summary statistics.
+        """Enlarge numpy arrays for raw data to hold `m` more replications.
+
+        Notes
+        -----
+        Storage at least doubles each time it is enlarged, so the total
+        cost of copying is linear in the number of replications, even
+        when they are simulated one at a time.
 
         Parameters
         ----------
         m : int
             Number of replications to simulate.
         """
-        # Size of data storage.
-        n_objectives = len(self.det_objectives)
-        base_pad_size = 100
-        # Default is to append space for 100 more replications.
-        # If more space needed, append in multiples of 100.
-        pad_size = int(np.ceil(m / base_pad_size)) * base_pad_size
-        self.storage_size += pad_size
-        self.objectives = np.concatenate((self.objectives, np.zeros((pad_size, n_objectives))))
-        self.objectives_gradients = np.concatenate((self.objectives_gradients, np.zeros((pad_size, n_objectives, self.dim))))
+        new_size = max(2 * self.storage_size, self.n_reps + m)
+
+        def grow(data):
+            # Copy recorded replications into a larger zero-filled array.
+            new_data = np.zeros((new_size,) + data.shape[1:])
+            new_data[:self.n_reps] = data[:self.n_reps]
+            return new_data
+
+        self.storage_size = new_size
+        self.objectives = grow(self.objectives)
+        if self.objectives_gradients is not None:
+            self.objectives_gradients = grow(self.objectives_gradients)
         if self.stoch_constraints is not None:
-            n_stochastic_constraints = len(self.det_stoch_constraints)
-            self.stoch_constraints = np.concatenate((self.stoch_constraints, np.zeros((pad_size, n_stochastic_constraints))))
-            self.stoch_constraints_gradients = np.concatenate((self.stoch_constraints_gradients, np.zeros((pad_size, n_stochastic_constraints, self.dim))))
+            self.stoch_constraints = grow(self.stoch_constraints)
+        if self.stoch_constraints_gradients is not None:
+            self.stoch_constraints_gradients = grow(self.stoch_constraints_gradients)
+
+    def update_summary_statistics(self, m):
+        """Update summary statistics of the solution with its last `m` replications.
+
+        Notes
+        -----
+        Means and co-moments are merged batch by batch (Welford's algorithm
+        for a single replication), so the cost does not grow with the number
+        of replications already taken. Variances, standard errors and
+        covariances of gradients are only computed when requested.
+
+        Parameters
+        ----------
+        m : int
+            Number of replications most recently added to the raw data.
+        """
+        n_old = self.n_reps - m
+        new_reps = slice(n_old, self.n_reps)
+        if n_old == 0:
+            self.objectives_mean = np.zeros(self.objectives.shape[1])
+        self.objectives_mean, self.objectives_comoment = update_moments(self.objectives_mean, self.objectives_comoment, n_old, self.objectives[new_reps])
+        if self.n_reps > 1:
+            self.objectives_cov = np.squeeze(self.objectives_comoment / (self.n_reps - 1))
+            self.objectives_var = np.diag(self.objectives_comoment) / (self.n_reps - 1)
+            self.objectives_stderr = np.sqrt(self.objectives_var) / np.sqrt(self.n_reps)
+        if self.objectives_gradients is not None:
+            if n_old == 0:
+                self.objectives_gradients_mean = np.mean(self.objectives_gradients[new_reps], axis=0)
+            else:
+                self.objectives_gradients_mean = self.objectives_gradients_mean + (np.mean(self.objectives_gradients[new_reps], axis=0) - self.objectives_gradients_mean) * (m / self.n_reps)
+        if self.stoch_constraints is not None:
+            if n_old == 0:
+                self.stoch_constraints_mean = np.zeros(self.stoch_constraints.shape[1])
+            self.stoch_constraints_mean, self.stoch_constraints_comoment = update_moments(self.stoch_constraints_mean, self.stoch_constraints_comoment, n_old, self.stoch_constraints[new_reps])
+            if self.n_reps > 1:
+                self.stoch_constraints_cov = np.squeeze(self.stoch_constraints_comoment / (self.n_reps - 1))
+                self.stoch_constraints_var = np.diag(self.stoch_constraints_comoment) / (self.n_reps - 1)
+                self.stoch_constraints_stderr = np.sqrt(self.stoch_constraints_var) / np.sqrt(self.n_reps)
+            else:
+                self.stoch_constraints_cov = np.squeeze(np.full(self.stoch_constraints_comoment.shape, np.nan))
+                self.stoch_constraints_var = np.full(self.stoch_constraints.shape[1], np.nan)
+                self.stoch_constraints_stderr = np.full(self.stoch_constraints.shape[1], np.nan)
 
     def recompute_summary_statistics(self):
-        """Recompute summary statistics of the solution.
+        """Recompute summary statistics of the solution from all of its replications.
 
         Notes
         -----
         Statistics for gradients of objectives and stochastic constraint LHSs
         are temporarily commented out. Under development.
         """
-        self.objectives_mean = np.mean(self.objectives[:self.n_reps], axis=0)
-        if self.n_reps > 1:
-            self.objectives_var = np.var(self.objectives[:self.n_reps], axis=0, ddof=1)
-            self.objectives_stderr = np.std(self.objectives[:self.n_reps], axis=0, ddof=1) / np.sqrt(self.n_reps)
-            self.objectives_cov = np.cov(self.objectives[:self.n_reps], rowvar=False, ddof=1)
-        self.objectives_gradients_mean = np.mean(self.objectives_gradients[:self.n_reps], axis=0)
-        if self.n_reps > 1:
-            self.objectives_gradients_var = np.var(self.objectives_gradients[:self.n_reps], axis=0, ddof=1)
-            self.objectives_gradients_stderr = np.std(self.objectives_gradients[:self.n_reps], axis=0, ddof=1) / np.sqrt(self.n_reps)
-            self.objectives_gradients_cov = np.array([np.cov(self.objectives_gradients[:self.n_reps, obj], rowvar=False, ddof=1) for obj in range(len(self.det_objectives))])
-        if self.stoch_constraints is not None:
-            self.stoch_constraints_mean = np.mean(self.stoch_constraints[:self.n_reps], axis=0)
-            self.stoch_constraints_var = np.var(self.stoch_constraints[:self.n_reps], axis=0, ddof=1)
-            self.stoch_constraints_stderr = np.std(self.stoch_constraints[:self.n_reps], axis=0, ddof=1) / np.sqrt(self.n_reps)
-            self.stoch_constraints_cov = np.cov(self.stoch_constraints[:self.n_reps], rowvar=False, ddof=1)
-            # self.stoch_constraints_gradients_mean = np.mean(self.stoch_constraints_gradients[:self.n_reps], axis=0)
-            # self.stoch_constraints_gradients_var = np.var(self.stoch_constraints_gradients[:self.n_reps], axis=0, ddof=1)
-            # self.stoch_constraints_gradients_stderr = np.std(self.stoch_constraints_gradients[:self.n_reps], axis=0, ddof=1) / np.sqrt(self.n_reps)
-            # self.stoch_constraints_gradients_cov = np.array([np.cov(self.stoch_constraints_gradients[:self.n_reps, stcon], rowvar=False, ddof=1) for stcon in range(len(self.det_stoch_constraints))])
+        self.objectives_comoment = np.zeros_like(self.objectives_comoment)
+        if self.stoch_constraints_comoment is not None:
+            self.stoch_constraints_comoment = np.zeros_like(self.stoch_constraints_comoment)
+        self.update_summary_statistics(self.n_reps)
+
+    @property
+    def objectives_gradients_var(self):
+        """numpy array: Sample variances of gradients of objectives;
+        # objectives x dimension.
+        """
+        return np.var(self.objectives_gradients[:self.n_reps], axis=0, ddof=1)
+
+    @property
+    def objectives_gradients_stderr(self):
+        """numpy array: Standard errors of gradients of objectives;
+        # objectives x dimension.
+        """
+        return np.std(self.objectives_gradients[:self.n_reps], axis=0, ddof=1) / np.sqrt(self.n_reps)
+
+    @property
+    def objectives_gradients_cov(self):
+        """numpy array: Sample covariance matrices of gradients of objectives;
+        # objectives x dimension x dimension.
+        """
+        return np.array([np.cov(self.objectives_gradients[:self.n_reps, obj], rowvar=False, ddof=1) for obj in range(len(self.det_objectives))])
@@ -9,6 +9,8 @@ from mrg32k3a.mrg32k3a import MRG32k3a
 
 from .directory import model_directory, solver_directory
 from .experiment_base import ProblemSolver, post_normalize
+from .base import NO_GRADIENTS
+from .rng_streams import copy_rng, advance_substreams
 
 
 class DesignPoint(object):
@@ -52,7 +54,7 @@ class DesignPoint(object):
             List of random-number generators used to run simulation replications.
         """
         if copy:
-            self.rng_list = [deepcopy(rng) for rng in rng_list]
+            self.rng_list = [copy_rng(rng) for rng in rng_list]
         else:
             self.rng_list = rng_list
 
@@ -71,7 +73,8 @@ class DesignPoint(object):
             # If first replication, set up recording responses and gradients.
             if self.n_reps == 0:
                 self.responses = {response_key: [] for response_key in responses}
-                self.gradients = {response_key: {factor_key: [] for factor_key in gradients[response_key]} for response_key in responses}
+                if gradients is not NO_GRADIENTS:
+                    self.gradients = {response_key: {factor_key: [] for factor_key in gradients[response_key]} for response_key in responses}
             # Append responses and gradients.
             for key in self.responses:
                 self.responses[key].append(responses[key])
@@ -166,8 +169,7 @@ class DataFarmingExperiment(object):
             else:  # If not using CRN...
                 # ...advance rngs to starts of next set of substreams.
                 for rng in main_rng_list:
-                    for _ in range(len(main_rng_list)):
-                        rng.advance_substream()
+                    advance_substreams(rng, len(main_rng_list))
 
     def print_to_csv(self, csv_filename="raw_results"):
         """Extract observed responses from simulated design points and
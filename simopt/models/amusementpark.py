@@ -7,8 +7,12 @@ A detailed description of the model/problem can be found
 """
 import numpy as np
 import math as math
+from bisect import bisect_right
+from itertools import accumulate
 
-from ..base import Model, Problem
+from ..base import Model, Problem, NO_GRADIENTS
+from ..event_calendar import EventCalendar
+from ..rng_streams import buffered_copy
 
 
 class AmusementPark(Model):
@@ -176,6 +180,20 @@ class AmusementPark(Model):
     def check_simulatable_factors(self):
         return sum(self.factors["queue_capacities"]) <= self.factors["park_capacity"]
 
+    def response_dtype(self):
+        """
+        Return the numpy structured dtype of the responses of a single replication.
+
+        Returns
+        -------
+        numpy dtype
+            one field per response
+        """
+        return np.dtype([("total_departed", float),
+                         ("percent_departed", float),
+                         ("average_number_in_system", float),
+                         ("attraction_utilization_percentages", float, (self.factors["number_attractions"],))])
+
     def replicate(self, rng_list):
         """
         Simulate a single replication for the current model factors.
@@ -194,106 +212,118 @@ class AmusementPark(Model):
             "percent_departed_tourists": The percentage of tourists to leave the park due
                 to full queues
         """
-        # Designate random number generators.
-        arrival_rng = rng_list[0]
-        transition_rng = rng_list[1]
-        time_rng = rng_list[2]
+        # Designate random number generators, drawing their uniforms in blocks.
+        arrival_rng = buffered_copy(rng_list[0])
+        transition_rng = buffered_copy(rng_list[1])
+        time_rng = buffered_copy(rng_list[2])
+        number_attractions = self.factors["number_attractions"]
+        time_open = self.factors["time_open"]
+        erlang_shape = self.factors["erlang_shape"]
+        erlang_scale = self.factors["erlang_scale"]
+        queue_capacities = self.factors["queue_capacities"]
+        arrival_rate = sum(self.factors["arrival_gammas"])
 
         # Initiate clock variables for statistics tracking and event handling.
         clock = 0
         previous_clock = 0
-        next_arrival = arrival_rng.expovariate(sum(self.factors["arrival_gammas"]))
+        next_arrival = arrival_rng.expovariate(arrival_rate)
 
-        # initialize list of attractions to be selected upon arrival.
-        potential_attractions = range(self.factors["number_attractions"])
-
-        # create list of each attraction's next completion time and initialize to infinity.
-        completion_times = [math.inf for _ in range(self.factors["number_attractions"])]
+        # Create calendar of each attraction's next completion; an attraction
+        # with no completion scheduled is available.
+        completions = EventCalendar()
 
         # initialize actual queues.
-        queues = [0 for _ in range(self.factors["number_attractions"])]
+        queues = [0 for _ in range(number_attractions)]
 
         # create external arrival probabilities for each attraction.
         arrival_probabalities = [self.factors["arrival_gammas"][i] / sum(self.factors["arrival_gammas"]) for i in
                                  self.factors["arrival_gammas"]]
+        # Selecting with cumulative weights draws the same choices as ``rng.choices`` with the weights.
+        arrival_table = choice_table(arrival_probabalities)
+        transition_tables = [choice_table(self.factors["transition_probabilities"][i] + [self.factors["depart_probabilities"][i]])
+                             for i in range(number_attractions)]
 
         # Initialize quantities to track:
         total_visitors = 0
         total_departed = 0
         # initialize time average and utilization quantities.
-        in_system = 0
+        total_queued = 0
         time_average = 0
-        cumulative_util = [0 for _ in range(self.factors["number_attractions"])]
+        cumulative_util = [0 for _ in range(number_attractions)]
+        # Time at which each busy attraction became busy.
+        busy_since = [0 for _ in range(number_attractions)]
 
         # Run simulation over time horizon.
-        while min(next_arrival, min(completion_times)) < self.factors["time_open"]:
+        next_completion, finished_attraction = completions.next_event()
+        while min(next_arrival, next_completion) < time_open:
             # Count number of tourists on attractions and in queues.
-            clock = min(next_arrival, min(completion_times))
-            riders = 0
-            for i in range(self.factors["number_attractions"]):
-                if completion_times[i] != math.inf:
-                    riders += 1
-                    cumulative_util[i] += (clock - previous_clock)
-            in_system = sum(queues) + riders
+            clock = min(next_arrival, next_completion)
+            in_system = total_queued + len(completions)
             time_average += in_system * (clock - previous_clock)
 
             previous_clock = clock
-            if next_arrival < min(completion_times):  # Next event is external tourist arrival.
+            if next_arrival < next_completion:  # Next event is external tourist arrival.
                 total_visitors += 1
                 # Select attraction.
-                attraction_selection = arrival_rng.choices(population=potential_attractions,
-                                                           weights=arrival_probabalities)[0]
+                attraction_selection = choose(arrival_rng, arrival_table)
                 # Check if attraction is currently available.
                 # If available, arrive at that attraction. Otherwise check queue.
-                if completion_times[attraction_selection] == math.inf:
+                if attraction_selection not in completions:
                     # Generate completion time if attraction available.
-                    completion_times[attraction_selection] = next_arrival + time_rng.gammavariate(alpha=self.factors["erlang_shape"][attraction_selection],
-                                                                                                  beta=self.factors["erlang_scale"][attraction_selection])
+                    completions.schedule(attraction_selection, next_arrival + time_rng.gammavariate(alpha=erlang_shape[attraction_selection],
+                                                                                                     beta=erlang_scale[attraction_selection]))
+                    busy_since[attraction_selection] = clock
                 # If unavailable, check if current queue is less than capacity. If queue is not full, join queue.
-                elif queues[attraction_selection] < self.factors["queue_capacities"][attraction_selection]:
+                elif queues[attraction_selection] < queue_capacities[attraction_selection]:
                     queues[attraction_selection] += 1
+                    total_queued += 1
                 # If queue is full, leave park + 1.
                 else:
                     total_departed += 1
                 # Use superposition of Poisson processes to generate next arrival time.
-                next_arrival += arrival_rng.expovariate(sum(self.factors["arrival_gammas"]))
+                next_arrival += arrival_rng.expovariate(arrival_rate)
 
             else:  # Next event is the completion of an attraction.
-                finished_attraction = completion_times.index(min(completion_times))  # Identify finished attraction.
                 # Check if there is a queue for that attraction.
                 # If so then start new completion time and subtract 1 from queue.
                 if queues[finished_attraction] > 0:
-                    completion_times[finished_attraction] = min(completion_times) + time_rng.gammavariate(alpha=self.factors["erlang_shape"][finished_attraction],
-                                                                                                          beta=self.factors["erlang_scale"][finished_attraction])
+                    completions.schedule(finished_attraction, next_completion + time_rng.gammavariate(alpha=erlang_shape[finished_attraction],
+                                                                                                       beta=erlang_scale[finished_attraction]))
                     queues[finished_attraction] -= 1
-                else:  # If no one in queue, set next completion of that attraction to infinity.
-                    completion_times[finished_attraction] = math.inf
+                    total_queued -= 1
+                else:  # If no one in queue, the attraction becomes available.
+                    completions.cancel(finished_attraction)
+                    cumulative_util[finished_attraction] += clock - busy_since[finished_attraction]
 
                 # Check if that person will leave the park.
-                potential_destinations = range(self.factors["number_attractions"] + 1)
-                next_destination = transition_rng.choices(population=potential_destinations,
-                                                          weights=self.factors["transition_probabilities"][finished_attraction] + [self.factors["depart_probabilities"][finished_attraction]]
-                                                          )[0]
+                next_destination = choose(transition_rng, transition_tables[finished_attraction])
 
                 # Check if tourist leaves park.
-                if next_destination != potential_destinations[-1]:
+                if next_destination != number_attractions:
                     # Check if attraction is currently available.
                     # If available, arrive at that attraction. Otherwise check queue.
-                    if completion_times[next_destination] == math.inf:
+                    if next_destination not in completions:
                         # Generate completion time if attraction available.
-                        completion_times[next_destination] = min(completion_times) + time_rng.gammavariate(alpha=self.factors["erlang_shape"][finished_attraction],
-                                                                                                           beta=self.factors["erlang_scale"][finished_attraction])
+                        # The ride starts at the earliest scheduled completion, if any.
+                        completions.schedule(next_destination, completions.next_event()[0] + time_rng.gammavariate(alpha=erlang_shape[finished_attraction],
+                                                                                                                    beta=erlang_scale[finished_attraction]))
+                        busy_since[next_destination] = clock
                     # if unavailable, check if current queue is less than capacity. If queue is not full, join queue.
-                    elif queues[next_destination] < self.factors["queue_capacities"][next_destination]:
+                    elif queues[next_destination] < queue_capacities[next_destination]:
                         queues[next_destination] += 1
+                        total_queued += 1
                     # If queue is full, leave park + 1.
                     else:
                         total_departed += 1
+            next_completion, finished_attraction = completions.next_event()
         # End of simulation.
 
-        # Calculate overall percent utilization calculation for each attraction.
-        for i in range(self.factors["number_attractions"]):
-            cumulative_util[i] = cumulative_util[i] / self.factors["time_open"]
+        # Calculate overall percent utilization calculation for each attraction,
+        # counting attractions still busy until the last event.
+        for i in range(number_attractions):
+            if i in completions:
+                cumulative_util[i] += previous_clock - busy_since[i]
+            cumulative_util[i] = cumulative_util[i] / time_open
 
         # Calculate responses from simulation data.
         responses = {"total_departed": total_departed,
@@ -301,9 +331,53 @@ class AmusementPark(Model):
                      "average_number_in_system": time_average / self.factors["time_open"],
                      "attraction_utilization_percentages": cumulative_util
                      }
-        gradients = {response_key: {factor_key: np.nan for factor_key in self.specifications} for response_key in
-                     responses}
-        return responses, gradients
+        return responses, NO_GRADIENTS
+
+
+def choice_table(weights):
+    """
+    Precompute the cumulative weights used by ``random.Random.choices``.
+
+    Arguments
+    ---------
+    weights : list of float
+        relative weights of each choice
+
+    Returns
+    -------
+    cum_weights : list of float
+        cumulative weights of the choices
+    total : float
+        total weight
+    """
+    cum_weights = list(accumulate(weights))
+    total = cum_weights[-1] + 0.0
+    if total <= 0.0:
+        raise ValueError("Total of weights must be greater than zero")
+    if not math.isfinite(total):
+        raise ValueError("Total of weights must be finite")
+    return cum_weights, total
+
+
+def choose(rng, table):
+    """
+    Select a choice with a table of cumulative weights, as
+    ``rng.choices(population=range(len(cum_weights)), cum_weights=cum_weights)[0]``.
+
+    Arguments
+    ---------
+    rng : mrg32k3a.mrg32k3a.MRG32k3a object
+        rng to draw the choice with
+    table : tuple
+        cumulative weights and total weight, from `choice_table`
+
+    Returns
+    -------
+    int
+        index of the choice
+    """
+    cum_weights, total = table
+    return bisect_right(cum_weights, rng.random() * total, 0, len(cum_weights) - 1)
 
 
 """
@@ -6,9 +6,12 @@ A detailed description of the model/problem can be found
 `here <https://simopt.readthedocs.io/en/latest/chessmm.html>`_.
 """
 import numpy as np
+from bisect import bisect_left, bisect_right
+from itertools import islice
 from scipy import special
 
-from ..base import Model, Problem
+from ..base import Model, Problem, NO_GRADIENTS
+from ..rng_streams import poissonvariates
 
 
 class ChessMatchmaking(Model):
@@ -99,6 +102,18 @@ class ChessMatchmaking(Model):
     def check_allowable_diff(self):
         return self.factors["allowable_diff"] > 0
 
+    def response_dtype(self):
+        """
+        Return the numpy structured dtype of the responses of a single replication.
+
+        Returns
+        -------
+        numpy dtype
+            one field per response
+        """
+        return np.dtype([("avg_diff", float),
+                         ("avg_wait_time", float)])
+
     def replicate(self, rng_list):
         """
         Simulate a single replication for the current model factors.
@@ -114,45 +129,83 @@ class ChessMatchmaking(Model):
             performance measures of interest
             "avg_diff" = the average Elo difference between all pairs
             "avg_wait_time" = the average waiting time
-        gradients : dict of dicts
-            gradient estimates for each response
+        gradients : NoneType
+            ``base.NO_GRADIENTS``, as gradients are not estimated
         """
         # Designate separate random number generators.
         elo_rng = rng_list[0]
         arrival_rng = rng_list[1]
+        num_players = self.factors["num_players"]
+        allowable_diff = self.factors["allowable_diff"]
+        # Generate interarrival times of the players.
+        times = list(islice(poissonvariates(arrival_rng, self.factors["poisson_rate"]), num_players))
+        # Generate ratings of the players via acceptance/rejection (not truncation).
+        ratings = []
+        for _ in range(num_players):
+            player_rating = elo_rng.normalvariate(self.factors["elo_mean"], self.factors["elo_sd"])
+            while player_rating < 0 or player_rating > 2400:
+                player_rating = elo_rng.normalvariate(self.factors["elo_mean"], self.factors["elo_sd"])
+            ratings.append(player_rating)
         # Initialize statistics.
-        # Incoming players are initialized with a wait time of 0.
-        wait_times = np.zeros(self.factors["num_players"])
-        waiting_players = []
+        # Waiting players are kept sorted by rating, along with their order of arrival.
+        pool_ratings = []
+        pool_players = []
+        # Fenwick tree counting waiting players by order of arrival, to find
+        # the position of a player in the FIFO list of waiting players.
+        waiting_tree = [0] * (num_players + 1)
+        # Total interarrival time charged to waiting players, by the number
+        # of positions at the front of the FIFO list that were charged.
+        charged_time = [0] * (num_players + 1)
         total_diff = 0
         elo_diffs = []
         # Simulate arrival and matching and players.
-        for player in range(self.factors["num_players"]):
-            # Generate interarrival time of the player.
-            time = arrival_rng.poissonvariate(self.factors["poisson_rate"])
-            # Generate rating of the player via acceptance/rejection (not truncation).
-            player_rating = elo_rng.normalvariate(self.factors["elo_mean"], self.factors["elo_sd"])
-            while player_rating < 0 or player_rating > 2400:
-                player_rating = elo_rng.normalvariate(self.factors["elo_mean"], self.factors["elo_sd"])
+        for player in range(num_players):
+            time = times[player]
+            player_rating = ratings[player]
+            # Waiting players within the allowable difference are contiguous in rating order.
+            low = high = bisect_left(pool_ratings, player_rating)
+            while low > 0 and abs(player_rating - pool_ratings[low - 1]) <= allowable_diff:
+                low -= 1
+            while high < len(pool_ratings) and abs(player_rating - pool_ratings[high]) <= allowable_diff:
+                high += 1
             # Attempt to match the incoming player with waiting players in FIFO manner.
             old_total = total_diff
-            for p in range(len(waiting_players)):
-                if abs(player_rating - waiting_players[p]) <= self.factors["allowable_diff"]:
-                    total_diff += abs(player_rating - waiting_players[p])
-                    elo_diffs.append(abs(player_rating - waiting_players[p]))
-                    del waiting_players[p]
-                    break
-                else:
-                    wait_times[p] += time
+            if low < high:
+                index = min(range(low, high), key=pool_players.__getitem__)
+                opponent = pool_players[index]
+                total_diff += abs(player_rating - pool_ratings[index])
+                elo_diffs.append(abs(player_rating - pool_ratings[index]))
+                del pool_ratings[index]
+                del pool_players[index]
+                # Players ahead of the opponent in the FIFO list wait for this arrival.
+                position = 0
+                node = opponent
+                while node > 0:
+                    position += waiting_tree[node]
+                    node -= node & -node
+                node = opponent + 1
+                while node <= num_players:
+                    waiting_tree[node] -= 1
+                    node += node & -node
+            else:
+                position = len(pool_players)
+            charged_time[position] += time
             # If incoming player is not matched, add them to the waiting pool.
             if old_total == total_diff:
-                waiting_players.append(player_rating)
-        # Compose responses and gradients.
+                index = bisect_right(pool_ratings, player_rating)
+                pool_ratings.insert(index, player_rating)
+                pool_players.insert(index, player)
+                node = player + 1
+                while node <= num_players:
+                    waiting_tree[node] += 1
+                    node += node & -node
+        # Each position of the FIFO list waited for every arrival that charged a longer front of the list.
+        wait_times = np.cumsum(charged_time[::-1])[::-1][1:].astype(float)
+        # Compose responses.
         responses = {"avg_diff": np.mean(elo_diffs),
                      "avg_wait_time": np.mean(wait_times)
                      }
-        gradients = {response_key: {factor_key: np.nan for factor_key in self.specifications} for response_key in responses}
-        return responses, gradients
+        return responses, NO_GRADIENTS
 
 
 """
@@ -5,8 +5,10 @@ Simulate a day's worth of sales for a newsvendor.
 A detailed description of the model/problem can be found `here <https://simopt.readthedocs.io/en/latest/cntnv.html>`_.
 """
 import numpy as np
+from scipy import integrate, special
 
-from ..base import Model, Problem
+from ..base import Model, Problem, records_from_columns, row_from_columns, NO_GRADIENTS
+from ..rng_streams import random_by_subsubstream
 
 
 class CntNV(Model):
@@ -112,6 +114,19 @@ class CntNV(Model):
                 < self.factors["purchase_price"]
                 < self.factors["sales_price"])
 
+    def response_dtype(self):
+        """
+        Return the numpy structured dtype of the responses of a single replication.
+
+        Returns
+        -------
+        numpy dtype
+            one field per response
+        """
+        return np.dtype([("profit", float),
+                         ("stockout_qty", float),
+                         ("stockout", float)])
+
     def replicate(self, rng_list):
         """
         Simulate a single replication for the current model factors.
@@ -131,33 +146,86 @@ class CntNV(Model):
         """
         # Designate random number generator for demand variability.
         demand_rng = rng_list[0]
-        # Generate random demand according to Burr Type XII distribution.
+        responses, gradients = self.simulate_demands(np.array([demand_rng.random()]))
+        return row_from_columns(responses, 0), row_from_columns(gradients, 0)
+
+    def replicate_batch(self, rng_list, m, need_gradients=True):
+        """
+        Simulate `m` replications for the current model factors.
+
+        Arguments
+        ---------
+        rng_list : list of mrg32k3a.mrg32k3a.MRG32k3a objects
+            rngs for model to use when simulating the replications
+        m : int
+            number of replications to simulate
+        need_gradients : bool, default=True
+            True if gradient estimates are needed, otherwise False
+
+        Returns
+        -------
+        responses : numpy structured array
+            performance measures of interest, one row per replication
+            (see `replicate`)
+        gradients : numpy structured array
+            gradient estimates for each response, one row per replication;
+            ``base.NO_GRADIENTS`` if `need_gradients` is False
+        """
+        # Designate random number generator for demand variability.
+        demand_rng = rng_list[0]
+        # Draw the uniform for each replication from its own subsubstream.
+        uniforms = random_by_subsubstream(demand_rng, m)[:, 0]
+        responses, gradients = self.simulate_demands(uniforms, need_gradients)
+        if gradients is NO_GRADIENTS:
+            return records_from_columns(responses, m), NO_GRADIENTS
+        return records_from_columns(responses, m), records_from_columns(gradients, m)
+
+    def simulate_demands(self, uniforms, need_gradients=True):
+        """
+        Compute the responses and gradients of one or more replications
+        from the uniforms that determine their demands.
+
+        Arguments
+        ---------
+        uniforms : numpy array
+            uniform random variate of each replication
+        need_gradients : bool, default=True
+            True if gradient estimates are needed, otherwise False
+
+        Returns
+        -------
+        responses : dict
+            performance measures of interest of each replication (see `replicate`)
+        gradients : dict of dicts
+            gradient estimates for each response of each replication;
+            ``base.NO_GRADIENTS`` if `need_gradients` is False
+        """
+        # Generate random demands according to Burr Type XII distribution.
         # If U ~ Uniform(0,1) and the Burr Type XII has parameters c and k,
         #   X = ((1-U)**(-1/k - 1))**(1/c) has the desired distribution.
-        base = ((1 - demand_rng.random())**(-1 / self.factors["Burr_k"]) - 1)
+        base = ((1 - uniforms)**(-1 / self.factors["Burr_k"]) - 1)
         exponent = (1 / self.factors["Burr_c"])
         demand = base**exponent
-        # Calculate profit.
+        # Calculate profits.
         order_cost = (self.factors["purchase_price"]
                       * self.factors["order_quantity"])
-        sales_revenue = (min(demand, self.factors["order_quantity"])
+        sales_revenue = (np.minimum(demand, self.factors["order_quantity"])
                          * self.factors["sales_price"])
-        salvage_revenue = (max(0, self.factors["order_quantity"] - demand)
+        salvage_revenue = (np.maximum(0, self.factors["order_quantity"] - demand)
                            * self.factors["salvage_price"])
         profit = sales_revenue + salvage_revenue - order_cost
-        stockout_qty = max(demand - self.factors["order_quantity"], 0)
-        stockout = int(stockout_qty > 0)
-        # Calculate gradient of profit w.r.t. order quantity.
-        if demand > self.factors["order_quantity"]:
-            grad_profit_order_quantity = (self.factors["sales_price"]
-                                          - self.factors["purchase_price"])
-        elif demand < self.factors["order_quantity"]:
-            grad_profit_order_quantity = (self.factors["salvage_price"]
-                                          - self.factors["purchase_price"])
-        else:
-            grad_profit_order_quantity = np.nan
-        # Compose responses and gradients.
+        stockout_qty = np.maximum(demand - self.factors["order_quantity"], 0)
+        stockout = (stockout_qty > 0).astype(int)
         responses = {"profit": profit, "stockout_qty": stockout_qty, "stockout": stockout}
+        if not need_gradients:
+            return responses, NO_GRADIENTS
+        # Calculate gradients of profit w.r.t. order quantity.
+        grad_profit_order_quantity = np.where(demand > self.factors["order_quantity"],
+                                              self.factors["sales_price"] - self.factors["purchase_price"],
+                                              np.where(demand < self.factors["order_quantity"],
+                                                       self.factors["salvage_price"] - self.factors["purchase_price"],
+                                                       np.nan))
+        # Compose gradients.
         gradients = {response_key:
                      {factor_key: np.nan for factor_key in self.specifications}
                      for response_key in responses
@@ -165,6 +233,53 @@ class CntNV(Model):
         gradients["profit"]["order_quantity"] = grad_profit_order_quantity
         return responses, gradients
 
+    def expected_responses(self):
+        """
+        Compute the exact expected responses for the current model factors.
+
+        Notes
+        -----
+        With F(x) = 1 - (1 + x^c)^(-k) the Burr Type XII cdf and q the order
+        quantity, E[min(demand, q)] is the integral of 1 - F(x) over [0, q].
+        If ck > 1, it equals B(t; 1/c, k - 1/c) / c, where t = q^c / (1 + q^c)
+        and B is the incomplete beta function; otherwise it is integrated
+        numerically and the expected stockout quantity is infinite.
+
+        Returns
+        -------
+        responses : dict
+            expected values of the performance measures (see `replicate`)
+        gradients : dict of dicts
+            gradients of the expected values of the performance measures
+        """
+        c = self.factors["Burr_c"]
+        k = self.factors["Burr_k"]
+        q = self.factors["order_quantity"]
+        # Probability that demand exceeds the order quantity.
+        survival = (1 + q**c)**(-k)
+        if c * k > 1:
+            expected_sales = (special.betainc(1 / c, k - 1 / c, q**c / (1 + q**c))
+                              * special.beta(1 / c, k - 1 / c) / c)
+            expected_demand = k * special.beta(k - 1 / c, 1 + 1 / c)
+        else:
+            expected_sales = integrate.quad(lambda x: (1 + x**c)**(-k), 0, q)[0]
+            expected_demand = np.inf
+        order_cost = self.factors["purchase_price"] * q
+        sales_revenue = self.factors["sales_price"] * expected_sales
+        salvage_revenue = self.factors["salvage_price"] * (q - expected_sales)
+        responses = {"profit": sales_revenue + salvage_revenue - order_cost,
+                     "stockout_qty": expected_demand - expected_sales,
+                     "stockout": survival}
+        gradients = {response_key:
+                     {factor_key: np.nan for factor_key in self.specifications}
+                     for response_key in responses
+                     }
+        gradients["profit"]["order_quantity"] = ((self.factors["sales_price"] - self.factors["salvage_price"]) * survival
+                                                 + self.factors["salvage_price"] - self.factors["purchase_price"])
+        gradients["stockout_qty"]["order_quantity"] = -survival
+        gradients["stockout"]["order_quantity"] = -k * c * q**(c - 1) * (1 + q**c)**(-k - 1)
+        return responses, gradients
+
 
 """
 Summary
@@ -339,6 +454,63 @@ class CntNVMaxProfit(Problem):
         objectives = (response_dict["profit"],)
         return objectives
 
+    def response_batch_to_objectives(self, responses):
+        """
+        Convert a batch of responses to a matrix of objectives.
+
+        Arguments
+        ---------
+        responses : numpy structured array
+            responses with one row per replication and one field per response
+
+        Returns
+        -------
+        objectives : numpy array
+            matrix of objectives, one row per replication
+        """
+        objectives = np.column_stack((responses["profit"],))
+        return objectives
+
+    def gradient_batch_to_objectives_gradients(self, gradients):
+        """
+        Convert a batch of gradients w.r.t. model factors to gradients
+        of objectives w.r.t. decision variables.
+
+        Arguments
+        ---------
+        gradients : numpy structured array
+            gradients with one row per replication, one field per response
+            and one subfield per factor
+
+        Returns
+        -------
+        objectives_gradients : numpy array
+            gradients of objectives, one row per replication
+        """
+        objectives_gradients = gradients["profit"]["order_quantity"].reshape(-1, 1, 1)
+        return objectives_gradients
+
+    def expected_objectives(self, x):
+        """
+        Compute the exact expected objectives at a solution `x`, e.g., as a
+        zero-variance proxy for f(x0) or f(x*) in ``experiment_base.post_normalize``.
+
+        Arguments
+        ---------
+        x : tuple
+            vector of decision variables
+
+        Returns
+        -------
+        objectives : tuple
+            vector of expected objectives
+        """
+        self.model.factors.update(self.vector_to_factor_dict(x))
+        responses, _ = self.model.expected_responses()
+        det_objectives, _ = self.deterministic_objectives_and_gradients(x)
+        objectives = tuple(np.add(self.response_dict_to_objectives(responses), det_objectives))
+        return objectives
+
     def response_dict_to_stoch_constraints(self, response_dict):
         """
         Convert a dictionary with response keys to a vector
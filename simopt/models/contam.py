@@ -7,7 +7,9 @@ A detailed description of the model/problem can be found
 """
 import numpy as np
 
-from ..base import Model, Problem
+from ..base import Model, Problem, NO_GRADIENTS, records_from_columns
+from ..lockstep import lockstep_ops
+from ..rng_streams import buffered_copies_by_subsubstream
 
 
 class Contamination(Model):
@@ -136,6 +138,17 @@ class Contamination(Model):
         else:
             return True
 
+    def response_dtype(self):
+        """
+        Return the numpy structured dtype of the responses of a single replication.
+
+        Returns
+        -------
+        numpy dtype
+            one field per response
+        """
+        return np.dtype([("level", float, (self.factors["stages"],))])
+
     def replicate(self, rng_list):
         """
         Simulate a single replication for the current model factors.
@@ -150,25 +163,113 @@ class Contamination(Model):
         responses : dict
             performance measures of interest
             "level" = a list of contamination levels over time
-        gradients : dict of dicts
-            gradient estimates for each response
+        gradients : NoneType
+            ``base.NO_GRADIENTS``, as gradients are not estimated
         """
         # Designate separate random number generators.
         # Outputs will be coupled when generating demand.
         contam_rng = rng_list[0]
         restore_rng = rng_list[1]
         # Generate rates with beta distribution.
-        X = np.zeros(self.factors["stages"])
-        X[0] = restore_rng.betavariate(alpha=self.factors["initial_rate_alpha"], beta=self.factors["initial_rate_beta"])
+        contam_rates, restore_rates = self.draw_rates(contam_rng, restore_rng)
+        X = self.contamination_levels(contam_rates[np.newaxis], restore_rates[np.newaxis])[0]
+        # Compose responses.
+        responses = {'level': X}
+        return responses, NO_GRADIENTS
+
+    def replicate_batch(self, rng_list, m, need_gradients=True):
+        """
+        Simulate `m` replications for the current model factors, running
+        the contamination recursion for all replications one stage at a time.
+
+        Arguments
+        ---------
+        rng_list : list of mrg32k3a.mrg32k3a.MRG32k3a objects
+            rngs for model to use when simulating the replications
+        m : int
+            number of replications to simulate
+        need_gradients : bool, default=True
+            True if IPA gradient estimates are needed, otherwise False
+
+        Returns
+        -------
+        responses : numpy structured array
+            performance measures of interest, one row per replication
+            (see `replicate`)
+        gradients : ``base.NO_GRADIENTS``
+            gradient estimates are not available
+        """
+        contam_rng = rng_list[0]
+        restore_rng = rng_list[1]
+        # Draw the rates of each replication from its own subsubstreams,
+        # drawing the first uniforms of all replications together.
+        contam_rngs = buffered_copies_by_subsubstream(contam_rng, m, 4 * self.factors["stages"])
+        restore_rngs = buffered_copies_by_subsubstream(restore_rng, m, 4 * self.factors["stages"])
+        contam_rates = np.zeros((m, self.factors["stages"]))
+        restore_rates = np.zeros((m, self.factors["stages"]))
+        for rep in range(m):
+            contam_rates[rep], restore_rates[rep] = self.draw_rates(contam_rngs[rep], restore_rngs[rep])
+        responses = {"level": self.contamination_levels(contam_rates, restore_rates)}
+        return records_from_columns(responses, m), NO_GRADIENTS
+
+    def draw_rates(self, contam_rng, restore_rng):
+        """
+        Generate the contamination and restoration rates of a replication.
+
+        Notes
+        -----
+        Beta variates are drawn by rejection, using a random number of
+        uniforms, so a batch of replications draws from buffered copies of
+        the rngs (see ``rng_streams.buffered_copies_by_subsubstream``).
+
+        Arguments
+        ---------
+        contam_rng : mrg32k3a.mrg32k3a.MRG32k3a object
+            rng for contamination rates
+        restore_rng : mrg32k3a.mrg32k3a.MRG32k3a object
+            rng for the initial contamination level and restoration rates
+
+        Returns
+        -------
+        contam_rates : numpy array
+            contamination rate at each stage (0 at the first stage)
+        restore_rates : numpy array
+            initial contamination level at the first stage, then restoration rate at each stage
+        """
+        contam_rates = np.zeros(self.factors["stages"])
+        restore_rates = np.zeros(self.factors["stages"])
+        restore_rates[0] = restore_rng.betavariate(alpha=self.factors["initial_rate_alpha"], beta=self.factors["initial_rate_beta"])
+        for i in range(1, self.factors["stages"]):
+            contam_rates[i] = contam_rng.betavariate(alpha=self.factors["contam_rate_alpha"], beta=self.factors["contam_rate_beta"])
+            restore_rates[i] = restore_rng.betavariate(alpha=self.factors["restore_rate_alpha"], beta=self.factors["restore_rate_beta"])
+        return contam_rates, restore_rates
+
+    def contamination_levels(self, contam_rates, restore_rates):
+        """
+        Run the contamination recursion for one or more replications.
+
+        Arguments
+        ---------
+        contam_rates : numpy array
+            contamination rates of each replication, m x stages (see `draw_rates`)
+        restore_rates : numpy array
+            initial contamination levels and restoration rates of each
+            replication, m x stages (see `draw_rates`)
+
+        Returns
+        -------
+        X : numpy array
+            contamination level of each replication at each stage, m x stages
+        """
         u = self.factors["prev_decision"]
+        ops = lockstep_ops(contam_rates.shape[0])
+        c = ops.by_step(contam_rates)
+        r = ops.by_step(restore_rates)
+        X = ops.new_records(self.factors["stages"], contam_rates.shape[0])
+        X[0] = r[0]
         for i in range(1, self.factors["stages"]):
-            c = contam_rng.betavariate(alpha=self.factors["contam_rate_alpha"], beta=self.factors["contam_rate_beta"])
-            r = restore_rng.betavariate(alpha=self.factors["restore_rate_alpha"], beta=self.factors["restore_rate_beta"])
-            X[i] = c * (1 - u[i]) * (1 - X[i - 1]) + (1 - r * u[i]) * X[i - 1]
-        # Compose responses and gradients.
-        responses = {'level': X}
-        gradients = {response_key: {factor_key: np.nan for factor_key in self.specifications} for response_key in responses}
-        return responses, gradients
+            X[i] = c[i] * (1 - u[i]) * (1 - X[i - 1]) + (1 - r[i] * u[i]) * X[i - 1]
+        return ops.by_replication(X)
 
 
 """
@@ -440,6 +541,42 @@ class ContaminationTotalCostDisc(Problem):
         stoch_constraints = tuple([-1 * z for z in under_control])
         return stoch_constraints
 
+    def response_batch_to_objectives(self, responses):
+        """
+        Convert a batch of responses to a matrix of objectives.
+
+        Arguments
+        ---------
+        responses : numpy structured array
+            responses with one row per replication and one field per response
+
+        Returns
+        -------
+        objectives : numpy array
+            matrix of objectives, one row per replication
+        """
+        objectives = np.zeros((len(responses), 1))
+        return objectives
+
+    def response_batch_to_stoch_constraints(self, responses):
+        """
+        Convert a batch of responses to a matrix of left-hand sides
+        of stochastic constraints: E[Y] <= 0
+
+        Arguments
+        ---------
+        responses : numpy structured array
+            responses with one row per replication and one field per response
+
+        Returns
+        -------
+        stoch_constraints : numpy array
+            matrix of LHSs of stochastic constraints, one row per replication
+        """
+        under_control = responses["level"] <= np.array(self.factors["upper_thres"])
+        stoch_constraints = (-1 * under_control).astype(float)
+        return stoch_constraints
+
     def deterministic_stochastic_constraints_and_gradients(self, x):
         """
         Compute deterministic components of stochastic constraints for a solution `x`.
@@ -795,6 +932,42 @@ class ContaminationTotalCostCont(Problem):
         stoch_constraints = tuple([-1 * z for z in under_control])
         return stoch_constraints
 
+    def response_batch_to_objectives(self, responses):
+        """
+        Convert a batch of responses to a matrix of objectives.
+
+        Arguments
+        ---------
+        responses : numpy structured array
+            responses with one row per replication and one field per response
+
+        Returns
+        -------
+        objectives : numpy array
+            matrix of objectives, one row per replication
+        """
+        objectives = np.zeros((len(responses), 1))
+        return objectives
+
+    def response_batch_to_stoch_constraints(self, responses):
+        """
+        Convert a batch of responses to a matrix of left-hand sides
+        of stochastic constraints: E[Y] <= 0
+
+        Arguments
+        ---------
+        responses : numpy structured array
+            responses with one row per replication and one field per response
+
+        Returns
+        -------
+        stoch_constraints : numpy array
+            matrix of LHSs of stochastic constraints, one row per replication
+        """
+        under_control = responses["level"] <= np.array(self.factors["upper_thres"])
+        stoch_constraints = (-1 * under_control).astype(float)
+        return stoch_constraints
+
     def deterministic_stochastic_constraints_and_gradients(self, x):
         """
         Compute deterministic components of stochastic constraints for a solution `x`.
@@ -7,7 +7,9 @@ A detailed description of the model/problem can be found
 """
 import numpy as np
 
-from ..base import Model, Problem
+from ..base import Model, Problem, NO_GRADIENTS, records_from_columns
+from ..lockstep import lockstep_ops
+from ..rng_streams import bsm_block, normalvariate_block, random_by_subsubstream
 
 
 class DualSourcing(Model):
@@ -192,6 +194,19 @@ class DualSourcing(Model):
     def check_simulatable_factors(self):
         return (self.factors["lead_exp"] < self.factors["lead_reg"]) & (self.factors["cost_exp"] > self.factors["cost_reg"])
 
+    def response_dtype(self):
+        """
+        Return the numpy structured dtype of the responses of a single replication.
+
+        Returns
+        -------
+        numpy dtype
+            one field per response
+        """
+        return np.dtype([("average_ordering_cost", float),
+                         ("average_penalty_cost", float),
+                         ("average_holding_cost", float)])
+
     def replicate(self, rng_list):
         """
         Simulate a single replication for the current model factors.
@@ -215,49 +230,123 @@ class DualSourcing(Model):
         """
         # Designate random number generators.
         demand_rng = rng_list[0]
-        # Vectors of regular orders to be received in periods n through n + lr - 1.
-        orders_reg = np.zeros(self.factors["lead_reg"])
-        # Vectors of expedited orders to be received in periods n through n + le - 1.
-        orders_exp = np.zeros(self.factors["lead_exp"])
-
         # Generate demand.
-        demand = [round(max(0, demand_rng.normalvariate(mu=self.factors["mu"], sigma=self.factors["st_dev"]))) for _ in range(self.factors["n_days"])]
+        demand = np.round(np.maximum(0, normalvariate_block(demand_rng, mu=self.factors["mu"], sigma=self.factors["st_dev"], n=self.factors["n_days"])))
+        # Run simulation over time horizon.
+        ordering_cost, penalty_cost, holding_cost = self.simulate_days(demand[np.newaxis])
+        # Calculate responses from simulation data.
+        responses = {"average_ordering_cost": np.mean(ordering_cost[0]),
+                     "average_penalty_cost": np.mean(penalty_cost[0]),
+                     "average_holding_cost": np.mean(holding_cost[0])
+                     }
+        return responses, NO_GRADIENTS
 
-        # Track total expenses.
-        total_holding_cost = np.zeros(self.factors["n_days"])
-        total_penalty_cost = np.zeros(self.factors["n_days"])
-        total_ordering_cost = np.zeros(self.factors["n_days"])
-        inv = self.factors["initial_inv"]
+    def replicate_batch(self, rng_list, m, need_gradients=True):
+        """
+        Simulate `m` replications for the current model factors, advancing
+        the replications in lockstep one day at a time.
 
-        # Run simulation over time horizon.
-        for day in range(self.factors["n_days"]):
+        Arguments
+        ---------
+        rng_list : list of mrg32k3a.mrg32k3a.MRG32k3a objects
+            rngs for model to use when simulating the replications
+        m : int
+            number of replications to simulate
+        need_gradients : bool, default=True
+            True if IPA gradient estimates are needed, otherwise False
+
+        Returns
+        -------
+        responses : numpy structured array
+            performance measures of interest, one row per replication
+            (see `replicate`)
+        gradients : ``base.NO_GRADIENTS``
+            gradient estimates are not available
+        """
+        demand_rng = rng_list[0]
+        # Draw the demands of each replication from its own subsubstream.
+        demand = self.factors["mu"] + self.factors["st_dev"] * bsm_block(random_by_subsubstream(demand_rng, m, self.factors["n_days"]))
+        demand = np.round(np.maximum(0, demand))
+        ordering_cost, penalty_cost, holding_cost = self.simulate_days(demand)
+        responses = {"average_ordering_cost": np.mean(ordering_cost, axis=1),
+                     "average_penalty_cost": np.mean(penalty_cost, axis=1),
+                     "average_holding_cost": np.mean(holding_cost, axis=1)
+                     }
+        return records_from_columns(responses, m), NO_GRADIENTS
+
+    def simulate_days(self, demand):
+        """
+        Simulate the orders and inventory of one or more replications over
+        the time horizon.
+
+        Notes
+        -----
+        Outstanding orders are kept in ring buffers indexed by the day they
+        arrive, and the inventory positions are computed from running sums
+        of the buffers, so each day takes constant time.
+
+        Arguments
+        ---------
+        demand : numpy array
+            demand of each replication on each day, m x n_days
+
+        Returns
+        -------
+        ordering_cost : numpy array
+            ordering cost of each replication on each day, m x n_days
+        penalty_cost : numpy array
+            penalty cost of each replication on each day, m x n_days
+        holding_cost : numpy array
+            holding cost of each replication on each day, m x n_days
+        """
+        lead_reg = self.factors["lead_reg"]
+        lead_exp = self.factors["lead_exp"]
+        order_level_reg = self.factors["order_level_reg"]
+        order_level_exp = self.factors["order_level_exp"]
+        cost_reg = self.factors["cost_reg"]
+        cost_exp = self.factors["cost_exp"]
+        penalty_cost = self.factors["penalty_cost"]
+        holding_cost = self.factors["holding_cost"]
+        m, n_days = demand.shape
+        ops = lockstep_ops(m)
+        ordering_by_day = ops.new_records(n_days, m)
+        penalty_by_day = ops.new_records(n_days, m)
+        holding_by_day = ops.new_records(n_days, m)
+        # Regular and expedited orders to be received on each day, at index day % lead time.
+        orders_reg = ops.new_records(lead_reg, m)
+        orders_exp = ops.new_records(lead_exp, m)
+        # Outstanding expedited orders, and regular orders in total and within the expedited lead time.
+        pipeline_exp = ops.full(m, 0.0)
+        pipeline_reg = ops.full(m, 0.0)
+        pipeline_reg_exp = ops.full(m, 0.0)
+        inv = ops.full(m, float(self.factors["initial_inv"]))
+        for day, dn in enumerate(ops.by_step(demand)):
             # Calculate inventory positions.
-            inv_position_exp = round(inv + np.sum(orders_exp) + np.sum(orders_reg[:self.factors["lead_exp"]]))
-            inv_position_reg = round(inv + np.sum(orders_exp) + np.sum(orders_reg))
+            inv_position_exp = ops.round(inv + pipeline_exp + pipeline_reg_exp)
+            inv_position_reg = ops.round(inv + pipeline_exp + pipeline_reg)
             # Place orders if needed.
-            orders_exp = np.append(orders_exp, max(0, round(self.factors["order_level_exp"] - inv_position_exp - orders_reg[self.factors["lead_exp"]])))
-            orders_reg = np.append(orders_reg, (self.factors["order_level_reg"] - inv_position_reg - orders_exp[self.factors["lead_exp"]]))
+            reg_at_lead_exp = orders_reg[(day + lead_exp) % lead_reg]
+            order_exp = ops.maximum(0, ops.round(order_level_exp - inv_position_exp - reg_at_lead_exp))
+            order_reg = order_level_reg - inv_position_reg - order_exp
             # Charge ordering cost.
-            total_ordering_cost[day] = self.factors["cost_exp"] * orders_exp[self.factors["lead_exp"]] + self.factors["cost_reg"] * orders_reg[self.factors["lead_reg"]]
+            ordering_by_day[day] = cost_exp * order_exp + cost_reg * order_reg
             # Orders arrive, update on-hand inventory.
-            inv = inv + orders_exp[0] + orders_reg[0]
-            orders_exp = np.delete(orders_exp, 0)
-            orders_reg = np.delete(orders_reg, 0)
+            arrival_exp = orders_exp[day % lead_exp] if lead_exp > 0 else order_exp
+            arrival_reg = orders_reg[day % lead_reg]
+            inv = inv + arrival_exp + arrival_reg
+            # Update the pipelines before the arrivals are overwritten by today's orders.
+            if lead_exp > 0:
+                pipeline_exp += order_exp - arrival_exp
+                pipeline_reg_exp += reg_at_lead_exp - arrival_reg
+                orders_exp[day % lead_exp] = order_exp
+            pipeline_reg += order_reg - arrival_reg
+            orders_reg[day % lead_reg] = order_reg
             # Satisfy or backorder demand.
-            # dn = max(0, demand[day]) THIS IS DONE TWICE
-            # inv = inv - dn
-            inv = inv - demand[day]
-            total_penalty_cost[day] = -1 * self.factors["penalty_cost"] * min(0, inv)
+            inv = inv - dn
+            penalty_by_day[day] = -1 * penalty_cost * ops.minimum(0, inv)
             # Charge holding cost.
-            total_holding_cost[day] = self.factors["holding_cost"] * max(0, inv)
-
-        # Calculate responses from simulation data.
-        responses = {"average_ordering_cost": np.mean(total_ordering_cost),
-                     "average_penalty_cost": np.mean(total_penalty_cost),
-                     "average_holding_cost": np.mean(total_holding_cost)
-                     }
-        gradients = {response_key: {factor_key: np.nan for factor_key in self.specifications} for response_key in responses}
-        return responses, gradients
+            holding_by_day[day] = holding_cost * ops.maximum(0, inv)
+        return ops.by_replication(ordering_by_day), ops.by_replication(penalty_by_day), ops.by_replication(holding_by_day)
 
 
 """
@@ -7,7 +7,8 @@ A detailed description of the model/problem can be found
 """
 import numpy as np
 
-from ..base import Model, Problem
+from ..base import Model, Problem, NO_GRADIENTS
+from ..rng_streams import gumbelvariate_block
 
 
 class DynamNews(Model):
@@ -120,6 +121,20 @@ class DynamNews(Model):
     def check_simulatable_factors(self):
         return all(np.subtract(self.factors["price"], self.factors["cost"]) >= 0)
 
+    def response_dtype(self):
+        """
+        Return the numpy structured dtype of the responses of a single replication.
+
+        Returns
+        -------
+        numpy dtype
+            one field per response
+        """
+        return np.dtype([("profit", float),
+                         ("n_prod_stockout", float),
+                         ("n_missed_orders", float),
+                         ("fill_rate", float)])
+
     def replicate(self, rng_list):
         """
         Simulate a single replication for the current model factors.
@@ -141,35 +156,28 @@ class DynamNews(Model):
         # Designate random number generator for generating a Gumbel random variable.
         Gumbel_rng = rng_list[0]
         # Compute Gumbel rvs for the utility of the products.
-        gumbel = np.zeros(((self.factors["num_customer"], self.factors["num_prod"])))
-        for t in range(self.factors["num_customer"]):
-            for j in range(self.factors["num_prod"]):
-                gumbel[t][j] = Gumbel_rng.gumbelvariate(-self.factors["mu"] * np.euler_gamma, self.factors["mu"])
-        # Compute utility for each product and each customer.
+        gumbel = gumbelvariate_block(Gumbel_rng, -self.factors["mu"] * np.euler_gamma, self.factors["mu"],
+                                     self.factors["num_customer"] * self.factors["num_prod"])
+        gumbel = gumbel.reshape((self.factors["num_customer"], self.factors["num_prod"]))
+        # Compute utility for each product and each customer, with the
+        # no-purchase option (utility 0) in the first column.
         utility = np.zeros((self.factors["num_customer"], self.factors["num_prod"] + 1))
-        for t in range(self.factors["num_customer"]):
-            for j in range(self.factors["num_prod"] + 1):
-                if j == 0:
-                    utility[t][j] = 0
-                else:
-                    utility[t][j] = self.factors["c_utility"][j - 1] + gumbel[t][j - 1]
+        utility[:, 1:] = np.array(self.factors["c_utility"]) + gumbel
 
         # Initialize inventory.
         inventory = np.copy(self.factors["init_level"])
-        itembought = np.zeros(self.factors["num_customer"])
+        # Products that are out of stock cannot be chosen by any later customer.
+        utility[:, 1:][:, inventory <= 0] = -np.inf
 
-        # Loop through customers
+        # Loop through customers.
         for t in range(self.factors["num_customer"]):
-            instock = np.where(inventory > 0)[0]
-            # Initialize the purchase option to be no-purchase.
-            itembought[t] = 0
-            # Assign the purchase option to be the product that maximizes the utility.
-            for j in instock:
-                if utility[t][j + 1] > utility[t][int(itembought[t])]:
-                    itembought[t] = j + 1
-            # print("item bought", int(itembought[t]))
-            if itembought[t] != 0:
-                inventory[int(itembought[t] - 1)] -= 1
+            # Choose the option that maximizes the utility; ties go to the
+            # lowest option, so no-purchase wins ties with products.
+            item = int(np.argmax(utility[t]))
+            if item != 0:
+                inventory[item - 1] -= 1
+                if inventory[item - 1] <= 0:
+                    utility[t + 1:, item] = -np.inf
 
         # Calculate profit.
         numsold = self.factors["init_level"] - inventory
@@ -179,13 +187,9 @@ class DynamNews(Model):
         unmet_demand = self.factors["num_customer"] - sum(numsold)
         order_fill_rate = sum(numsold) / self.factors["num_customer"]
 
-        # Compose responses and gradients.
+        # Compose responses.
         responses = {"profit": np.sum(profit), "n_prod_stockout": np.sum(inventory == 0), "n_missed_orders": unmet_demand, "fill_rate": order_fill_rate}
-        gradients = {response_key:
-                     {factor_key: np.nan for factor_key in self.specifications}
-                     for response_key in responses
-                     }
-        return responses, gradients
+        return responses, NO_GRADIENTS
 
 
 """
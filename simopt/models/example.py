@@ -89,6 +89,17 @@ class ExampleModel(Model):
         gradients = {"est_f(x)": {"x": tuple(2 * x)}}
         return responses, gradients
 
+    def response_dtype(self):
+        """
+        Return the numpy structured dtype of the responses of a single replication.
+
+        Returns
+        -------
+        numpy dtype
+            one field per response
+        """
+        return np.dtype([("est_f(x)", float)])
+
 
 """
 Summary
@@ -355,3 +366,39 @@ class ExampleProblem(Problem):
         # x = tuple([rand_sol_rng.uniform(-2, 2) for _ in range(self.dim)])
         x = tuple(rand_sol_rng.mvnormalvariate(mean_vec=np.zeros(self.dim), cov=np.eye(self.dim), factorized=False))
         return x
+
+    def response_batch_to_objectives(self, responses):
+        """
+        Convert a batch of responses to a matrix of objectives.
+
+        Arguments
+        ---------
+        responses : numpy structured array
+            responses with one row per replication and one field per response
+
+        Returns
+        -------
+        objectives : numpy array
+            matrix of objectives, one row per replication
+        """
+        objectives = np.column_stack((responses["est_f(x)"],))
+        return objectives
+
+    def gradient_batch_to_objectives_gradients(self, gradients):
+        """
+        Convert a batch of gradients w.r.t. model factors to gradients
+        of objectives w.r.t. decision variables.
+
+        Arguments
+        ---------
+        gradients : numpy structured array
+            gradients with one row per replication, one field per response
+            and one subfield per factor
+
+        Returns
+        -------
+        objectives_gradients : numpy array
+            gradients of objectives, one row per replication
+        """
+        objectives_gradients = gradients["est_f(x)"]["x"][:, np.newaxis, :]
+        return objectives_gradients
@@ -7,7 +7,8 @@ A detailed description of the model/problem can be found
 """
 import numpy as np
 
-from ..base import Model, Problem
+from ..base import Model, Problem, NO_GRADIENTS, records_from_columns
+from ..rng_streams import truncated_mvnormalvariate, truncated_mvnormal_by_subsubstream
 
 
 class FacilitySize(Model):
@@ -30,6 +31,8 @@ class FacilitySize(Model):
         details of each factor (for GUI and data validation)
     check_factor_list : dict
         switch case for checking factor simulatability
+    cholesky_cache : tuple
+        covariance matrix and its Cholesky factor, from the last call to `cholesky_factor`
 
     Arguments
     ---------
@@ -44,6 +47,7 @@ class FacilitySize(Model):
         if fixed_factors is None:
             fixed_factors = {}
         self.name = "FACSIZE"
+        self.cholesky_cache = (None, None)
         self.n_rngs = 1
         self.n_responses = 3
         self.specifications = {
@@ -109,6 +113,36 @@ class FacilitySize(Model):
         else:
             return True
 
+    def response_dtype(self):
+        """
+        Return the numpy structured dtype of the responses of a single replication.
+
+        Returns
+        -------
+        numpy dtype
+            one field per response
+        """
+        return np.dtype([("stockout_flag", float),
+                         ("n_fac_stockout", float),
+                         ("n_cut", float)])
+
+    def cholesky_factor(self):
+        """
+        Return the lower Cholesky factor of the covariance matrix of demands,
+        computed once for each covariance matrix.
+
+        Returns
+        -------
+        chol : numpy array
+            lower Cholesky factor of the covariance matrix
+        """
+        key = tuple(tuple(row) for row in self.factors["cov"])
+        if self.cholesky_cache[0] == key:
+            return self.cholesky_cache[1]
+        chol = np.linalg.cholesky(self.factors["cov"])
+        self.cholesky_cache = (key, chol)
+        return chol
+
     def replicate(self, rng_list):
         """
         Simulate a single replication for the current model factors.
@@ -127,8 +161,8 @@ class FacilitySize(Model):
                  1 : at least one of the facilities did not satisfy the demand
             "n_fac_stockout" = the number of facilities which cannot satisfy the demand
             "n_cut" = the number of toal demand which cannot be satisfied
-        gradients : dict of dicts
-            gradient estimates for each response
+        gradients : NoneType
+            ``base.NO_GRADIENTS``, as gradients are not estimated
         """
         # Designate RNG for demands.
         demand_rng = rng_list[0]
@@ -136,21 +170,52 @@ class FacilitySize(Model):
         n_fac_stockout = 0
         n_cut = 0
         # Generate random demands at facilities from truncated multivariate normal distribution.
-        demand = demand_rng.mvnormalvariate(self.factors["mean_vec"], self.factors["cov"], factorized=False)
-        while np.any(demand < 0):
-            demand = demand_rng.mvnormalvariate(self.factors["mean_vec"], self.factors["cov"], factorized=False)
+        demand = truncated_mvnormalvariate(demand_rng, np.array(self.factors["mean_vec"]), self.cholesky_factor())
         # Check for stockouts.
         for i in range(self.factors["n_fac"]):
             if demand[i] > self.factors["capacity"][i]:
                 n_fac_stockout = n_fac_stockout + 1
                 stockout_flag = 1
                 n_cut += demand[i] - self.factors["capacity"][i]
-        # Compose responses and gradients.
+        # Compose responses.
         responses = {'stockout_flag': stockout_flag,
                      'n_fac_stockout': n_fac_stockout,
                      'n_cut': n_cut}
-        gradients = {response_key: {factor_key: np.nan for factor_key in self.specifications} for response_key in responses}
-        return responses, gradients
+        return responses, NO_GRADIENTS
+
+    def replicate_batch(self, rng_list, m, need_gradients=True):
+        """
+        Simulate `m` replications for the current model factors, drawing
+        the demands of all replications together.
+
+        Arguments
+        ---------
+        rng_list : list of mrg32k3a.mrg32k3a.MRG32k3a objects
+            rngs for model to use when simulating the replications
+        m : int
+            number of replications to simulate
+        need_gradients : bool, default=True
+            True if IPA gradient estimates are needed, otherwise False
+
+        Returns
+        -------
+        responses : numpy structured array
+            performance measures of interest, one row per replication
+            (see `replicate`)
+        gradients : ``base.NO_GRADIENTS``
+            gradient estimates are not available
+        """
+        demand_rng = rng_list[0]
+        demand = truncated_mvnormal_by_subsubstream(demand_rng, np.array(self.factors["mean_vec"]), self.cholesky_factor(), m)
+        # Check for stockouts.
+        shortfall = demand - np.array(self.factors["capacity"])
+        stockout = shortfall > 0
+        n_fac_stockout = np.sum(stockout, axis=1)
+        # Compose responses.
+        responses = {"stockout_flag": (n_fac_stockout > 0).astype(float),
+                     "n_fac_stockout": n_fac_stockout,
+                     "n_cut": np.sum(np.where(stockout, shortfall, 0), axis=1)}
+        return records_from_columns(responses, m), NO_GRADIENTS
 
 
 """
@@ -366,6 +431,23 @@ class FacilitySizingTotalCost(Problem):
         objectives = (0,)
         return objectives
 
+    def response_batch_to_objectives(self, responses):
+        """
+        Convert a batch of responses to a matrix of objectives.
+
+        Arguments
+        ---------
+        responses : numpy structured array
+            responses with one row per replication and one field per response
+
+        Returns
+        -------
+        objectives : numpy array
+            matrix of objectives, one row per replication
+        """
+        objectives = np.zeros((len(responses), 1))
+        return objectives
+
     def response_dict_to_objectives_gradients(self, response_dict):
         """Convert a dictionary with response keys to a vector
         of gradients.
@@ -406,6 +488,24 @@ class FacilitySizingTotalCost(Problem):
         stoch_constraints = (response_dict["stockout_flag"],)
         return stoch_constraints
 
+    def response_batch_to_stoch_constraints(self, responses):
+        """
+        Convert a batch of responses to a matrix of left-hand sides
+        of stochastic constraints: E[Y] <= 0
+
+        Arguments
+        ---------
+        responses : numpy structured array
+            responses with one row per replication and one field per response
+
+        Returns
+        -------
+        stoch_constraints : numpy array
+            matrix of LHSs of stochastic constraints, one row per replication
+        """
+        stoch_constraints = responses["stockout_flag"].reshape(-1, 1).astype(float)
+        return stoch_constraints
+
     def deterministic_stochastic_constraints_and_gradients(self, x):
         """
         Compute deterministic components of stochastic constraints for a solution `x`.
@@ -478,10 +578,9 @@ class FacilitySizingTotalCost(Problem):
         x : tuple
             vector of decision variables
         """
-        cov_matrix = np.diag([x**2 for x in self.factors["initial_solution"]])
-        x = rand_sol_rng.mvnormalvariate(self.factors["initial_solution"], cov_matrix, factorized=False)
-        while np.any(x < 0):
-            x = rand_sol_rng.mvnormalvariate(self.factors["initial_solution"], cov_matrix, factorized=False)
+        # The covariance matrix is diag(x0**2), so its Cholesky factor is diag(|x0|).
+        chol = np.diag(np.abs(self.factors["initial_solution"]).astype(float))
+        x = truncated_mvnormalvariate(rand_sol_rng, np.array(self.factors["initial_solution"]), chol)
         return tuple(x)
 
 
@@ -676,6 +775,23 @@ class FacilitySizingMaxService(Problem):
         objectives = (1 - response_dict["stockout_flag"],)
         return objectives
 
+    def response_batch_to_objectives(self, responses):
+        """
+        Convert a batch of responses to a matrix of objectives.
+
+        Arguments
+        ---------
+        responses : numpy structured array
+            responses with one row per replication and one field per response
+
+        Returns
+        -------
+        objectives : numpy array
+            matrix of objectives, one row per replication
+        """
+        objectives = (1 - responses["stockout_flag"]).reshape(-1, 1).astype(float)
+        return objectives
+
     def response_dict_to_stoch_constraints(self, response_dict):
         """
         Convert a dictionary with response keys to a vector
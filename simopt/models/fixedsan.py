@@ -7,7 +7,8 @@ A detailed description of the model/problem can be found
 """
 import numpy as np
 
-from ..base import Model, Problem
+from ..base import Model, Problem, records_from_columns, NO_GRADIENTS
+from ..rng_streams import expovariate_block, expovariate_by_subsubstream
 
 
 class FixedSAN(Model):
@@ -83,6 +84,89 @@ class FixedSAN(Model):
             positive = positive & x > 0
         return (len(self.factors["arc_means"]) != self.factors["num_arcs"]) & positive
 
+    def response_dtype(self):
+        """
+        Return the numpy structured dtype of the responses of a single replication.
+
+        Returns
+        -------
+        numpy dtype
+            one field per response
+        """
+        return np.dtype([("longest_path_length", float)])
+
+    def longest_paths(self, arcs, need_gradients=True):
+        """
+        Compute the longest paths and their IPA gradients for a batch of
+        replications.
+
+        Notes
+        -----
+        The recurrences of the fixed network are evaluated for all
+        replications at once. The gradient of the longest path to each node
+        is that of the longest path to the chosen predecessor plus the
+        contribution of the connecting arc, selected row by row.
+
+        Arguments
+        ---------
+        arcs : numpy array
+            lengths of the arcs; # replications x # arcs
+        need_gradients : bool, default=True
+            True if IPA gradient estimates are needed, otherwise False
+
+        Returns
+        -------
+        longest_path : numpy array
+            length of the longest path of each replication
+        longest_path_gradient : numpy array
+            IPA gradient of the longest path length w.r.t. arc means;
+            # replications x # arcs; None if `need_gradients` is False
+        """
+        m = arcs.shape[0]
+        rows = np.arange(m)
+        thetas = np.array(self.factors["arc_means"])
+        T = np.zeros((m, self.factors["num_nodes"]))
+        if need_gradients:
+            Tderiv = np.zeros((m, self.factors["num_nodes"], self.factors["num_arcs"]))
+            contributions = arcs / thetas
+
+        def reach(node, pred, arc):
+            # Extend the longest path to the predecessor by the connecting arc.
+            T[:, node] = T[:, pred] + arcs[:, arc]
+            if need_gradients:
+                Tderiv[:, node] = Tderiv[:, pred]
+                Tderiv[:, node, arc] = Tderiv[:, node, arc] + contributions[:, arc]
+
+        def reach_either(node, first, pred1, arc1, pred2, arc2):
+            # Extend the longest path to the first predecessor where `first` holds, else to the second.
+            T[:, node] = np.where(first, T[:, pred1] + arcs[:, arc1], T[:, pred2] + arcs[:, arc2])
+            if need_gradients:
+                Tderiv[:, node] = np.where(first[:, np.newaxis], Tderiv[:, pred1], Tderiv[:, pred2])
+                Tderiv[:, node, arc1] = np.where(first, Tderiv[:, node, arc1] + contributions[:, arc1], Tderiv[:, node, arc1])
+                Tderiv[:, node, arc2] = np.where(first, Tderiv[:, node, arc2], Tderiv[:, node, arc2] + contributions[:, arc2])
+
+        reach(1, 0, 0)
+        reach_either(2, T[:, 0] + arcs[:, 1] > T[:, 1] + arcs[:, 2], 0, 1, 1, 2)
+        reach(3, 1, 3)
+        reach(4, 3, 6)
+        candidates = np.column_stack((T[:, 1] + arcs[:, 4], T[:, 2] + arcs[:, 5], T[:, 4] + arcs[:, 8]))
+        ind = np.argmax(candidates, axis=1)
+        T[:, 5] = candidates[rows, ind]
+        if need_gradients:
+            # The derivative row follows the Matlab code's indexing of the three candidates.
+            preds = np.array([4, 1, 2])[ind]
+            arc_ids = np.array([8, 4, 5])[ind]
+            Tderiv[:, 5] = Tderiv[rows, preds]
+            Tderiv[rows, 5, arc_ids] = Tderiv[rows, 5, arc_ids] + contributions[rows, arc_ids]
+        reach(6, 3, 7)
+        reach_either(7, T[:, 6] + arcs[:, 11] > T[:, 4] + arcs[:, 9], 6, 11, 4, 9)
+        reach_either(8, T[:, 5] + arcs[:, 10] > T[:, 7] + arcs[:, 12], 5, 10, 7, 12)
+        longest_path = T[:, 8]
+        if not need_gradients:
+            return longest_path, None
+        longest_path_gradient = Tderiv[:, 8, :]
+        return longest_path, longest_path_gradient
+
     def replicate(self, rng_list):
         """
         Simulate a single replication for the current model factors.
@@ -102,80 +186,49 @@ class FixedSAN(Model):
         """
         # Designate separate random number generators.
         exp_rng = rng_list[0]
-
         # Generate arc lengths.
-        T = np.zeros(self.factors["num_nodes"])
-        Tderiv = np.zeros((self.factors["num_nodes"], self.factors["num_arcs"]))
-        thetas = list(self.factors["arc_means"])
-        arcs = [exp_rng.expovariate(1 / x) for x in thetas]
-
-        # Brute force calculation like in Matlab code
-        T[1] = T[0] + arcs[0]
-        Tderiv[1, :] = Tderiv[0, :]
-        Tderiv[1, 0] = Tderiv[1, 0] + arcs[0] / thetas[0]
-
-        T[2] = max(T[0] + arcs[1], T[1] + arcs[2])
-        if T[0] + arcs[1] > T[1] + arcs[2]:
-            T[2] = T[0] + arcs[1]
-            Tderiv[2, :] = Tderiv[0, :]
-            Tderiv[2, 1] = Tderiv[2, 1] + arcs[1] / thetas[1]
-        else:
-            T[2] = T[1] + arcs[2]
-            Tderiv[2, :] = Tderiv[1, :]
-            Tderiv[2, 2] = Tderiv[2, 2] + arcs[2] / thetas[2]
-
-        T[3] = T[1] + arcs[3]
-        Tderiv[3, :] = Tderiv[1, :]
-        Tderiv[3, 3] = Tderiv[3, 3] + arcs[3] / thetas[3]
-
-        T[4] = T[3] + arcs[6]
-        Tderiv[4, :] = Tderiv[3, :]
-        Tderiv[4, 6] = Tderiv[4, 6] + arcs[6] / thetas[6]
-
-        T[5] = max([T[1] + arcs[4], T[2] + arcs[5], T[4] + arcs[8]])
-        ind = np.argmax([T[1] + arcs[4], T[2] + arcs[5], T[4] + arcs[8]])
-
-        if ind == 1:
-            Tderiv[5, :] = Tderiv[1, :]
-            Tderiv[5, 4] = Tderiv[5, 4] + arcs[4] / thetas[4]
-        elif ind == 2:
-            Tderiv[5, :] = Tderiv[2, :]
-            Tderiv[5, 5] = Tderiv[5, 5] + arcs[5] / thetas[5]
-        else:
-            Tderiv[5, :] = Tderiv[4, :]
-            Tderiv[5, 8] = Tderiv[5, 8] + arcs[8] / thetas[8]
-
-        T[6] = T[3] + arcs[7]
-        Tderiv[6, :] = Tderiv[3, :]
-        Tderiv[6, 7] = Tderiv[6, 7] + arcs[7] / thetas[7]
-
-        if T[6] + arcs[11] > T[4] + arcs[9]:
-            T[7] = T[6] + arcs[11]
-            Tderiv[7, :] = Tderiv[6, :]
-            Tderiv[7, 11] = Tderiv[7, 11] + arcs[11] / thetas[11]
-        else:
-            T[7] = T[4] + arcs[9]
-            Tderiv[7, :] = Tderiv[4, :]
-            Tderiv[7, 9] = Tderiv[7, 9] + arcs[9] / thetas[9]
-
-        if T[5] + arcs[10] > T[7] + arcs[12]:
-            T[8] = T[5] + arcs[10]
-            Tderiv[8, :] = Tderiv[5, :]
-            Tderiv[8, 10] = Tderiv[8, 10] + arcs[10] / thetas[10]
-        else:
-            T[8] = T[7] + arcs[12]
-            Tderiv[8, :] = Tderiv[7, :]
-            Tderiv[8, 12] = Tderiv[8, 12] + arcs[12] / thetas[12]
-
-        longest_path = T[8]
-        longest_path_gradient = Tderiv[8, :]
-
+        thetas = np.array(self.factors["arc_means"])
+        arcs = expovariate_block(exp_rng, 1 / thetas, len(thetas))
+        longest_path, longest_path_gradient = self.longest_paths(arcs[np.newaxis])
         # Compose responses and gradients.
+        responses = {"longest_path_length": longest_path[0]}
+        gradients = {response_key: {factor_key: np.nan for factor_key in self.specifications} for response_key in responses}
+        gradients["longest_path_length"]["arc_means"] = longest_path_gradient[0]
+        return responses, gradients
+
+    def replicate_batch(self, rng_list, m, need_gradients=True):
+        """
+        Simulate `m` replications for the current model factors.
+
+        Arguments
+        ---------
+        rng_list : list of mrg32k3a.mrg32k3a.MRG32k3a objects
+            rngs for model to use when simulating the replications
+        m : int
+            number of replications to simulate
+        need_gradients : bool, default=True
+            True if gradient estimates are needed, otherwise False
+
+        Returns
+        -------
+        responses : numpy structured array
+            performance measures of interest, one row per replication
+            (see `replicate`)
+        gradients : numpy structured array
+            gradient estimates for each response, one row per replication;
+            ``base.NO_GRADIENTS`` if `need_gradients` is False
+        """
+        exp_rng = rng_list[0]
+        thetas = np.array(self.factors["arc_means"])
+        # Draw the arc lengths of each replication from its own subsubstream.
+        arcs = expovariate_by_subsubstream(exp_rng, 1 / thetas, m, len(thetas))
+        longest_path, longest_path_gradient = self.longest_paths(arcs, need_gradients)
         responses = {"longest_path_length": longest_path}
+        if not need_gradients:
+            return records_from_columns(responses, m), NO_GRADIENTS
         gradients = {response_key: {factor_key: np.nan for factor_key in self.specifications} for response_key in responses}
         gradients["longest_path_length"]["arc_means"] = longest_path_gradient
-
-        return responses, gradients
+        return records_from_columns(responses, m), records_from_columns(gradients, m)
 
 
 """
@@ -357,6 +410,42 @@ class FixedSANLongestPath(Problem):
         objectives = (response_dict["longest_path_length"],)
         return objectives
 
+    def response_batch_to_objectives(self, responses):
+        """
+        Convert a batch of responses to a matrix of objectives.
+
+        Arguments
+        ---------
+        responses : numpy structured array
+            responses with one row per replication and one field per response
+
+        Returns
+        -------
+        objectives : numpy array
+            matrix of objectives, one row per replication
+        """
+        objectives = np.column_stack((responses["longest_path_length"],))
+        return objectives
+
+    def gradient_batch_to_objectives_gradients(self, gradients):
+        """
+        Convert a batch of gradients w.r.t. model factors to gradients
+        of objectives w.r.t. decision variables.
+
+        Arguments
+        ---------
+        gradients : numpy structured array
+            gradients with one row per replication, one field per response
+            and one subfield per factor
+
+        Returns
+        -------
+        objectives_gradients : numpy array
+            gradients of objectives, one row per replication
+        """
+        objectives_gradients = gradients["longest_path_length"]["arc_means"].reshape(len(gradients), 1, self.dim)
+        return objectives_gradients
+
     def response_dict_to_stoch_constraints(self, response_dict):
         """
         Convert a dictionary with response keys to a vector
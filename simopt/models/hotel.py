@@ -5,9 +5,11 @@ Simulate expected revenue for a hotel.
 A detailed description of the model/problem can be found
 `here <https://simopt.readthedocs.io/en/latest/hotel.html>`_.
 """
+import heapq
 import numpy as np
 
-from ..base import Model, Problem
+from ..base import Model, Problem, NO_GRADIENTS
+from ..rng_streams import advance_state, copy_rng, expovariate_block
 
 
 class Hotel(Model):
@@ -28,6 +30,10 @@ class Hotel(Model):
         details of each factor (for GUI and data validation)
     check_factor_list : dict
         switch case for checking factor simulatability
+    product_cache : tuple
+        product incidence, rates, and number of products for which the
+        products' revenues and overlaps were last computed, and those
+        revenues and overlaps (see `product_structure`)
 
     Arguments
     ---------
@@ -41,6 +47,7 @@ class Hotel(Model):
     def __init__(self, fixed_factors=None):
         if fixed_factors is None:
             fixed_factors = {}
+        self.product_cache = (None, None)
         self.name = "HOTEL"
         self.n_rngs = 1
         self.n_responses = 1
@@ -164,6 +171,47 @@ class Hotel(Model):
                 return False
         return len(self.factors["booking_limits"]) == self.factors["num_products"]
 
+    def response_dtype(self):
+        """
+        Return the numpy structured dtype of the responses of a single replication.
+
+        Returns
+        -------
+        numpy dtype
+            one field per response
+        """
+        return np.dtype([("revenue", float)])
+
+    def product_structure(self):
+        """
+        Return the revenue of each product and the products sharing a
+        resource with each product, computed once for each product
+        incidence matrix and pair of rates.
+
+        Returns
+        -------
+        revenues : list
+            revenue of booking each product, at the rack rate for even-numbered
+            products and at the discount rate for odd-numbered products
+        overlaps : list of list of int
+            indices of the products sharing at least one resource with each product
+        """
+        key = (tuple(tuple(row) for row in self.factors["product_incidence"]),
+               self.factors["rack_rate"], self.factors["discount_rate"], self.factors["num_products"])
+        if self.product_cache[0] == key:
+            return self.product_cache[1]
+        A = np.array(self.factors["product_incidence"])
+        revenues = []
+        for j in range(self.factors["num_products"]):
+            if j % 2 == 0:  # Rack_rate.
+                revenues.append(sum(self.factors["rack_rate"] * A[:, j]))
+            else:  # Discount_rate.
+                revenues.append(sum(self.factors["discount_rate"] * A[:, j]))
+        overlaps = [[i for i in range(self.factors["num_products"]) if np.dot(A[:, i].T, A[:, j]) >= 1]
+                    for j in range(self.factors["num_products"])]
+        self.product_cache = (key, (revenues, overlaps))
+        return revenues, overlaps
+
     def replicate(self, rng_list):
         """
         Simulate a single replication for the current model factors.
@@ -178,55 +226,81 @@ class Hotel(Model):
         responses : dict
             performance measures of interest
             "revenue" = expected revenue
-        gradients : dict of dicts
-            gradient estimates for each response
+        gradients : NoneType
+            ``base.NO_GRADIENTS``, as gradients are not estimated
         """
         # Designate separate random number generators.
         arr_rng = rng_list[0]
-
+        num_products = self.factors["num_products"]
+        runlength = self.factors["runlength"]
+        time_limit = self.factors["time_limit"]
+        revenues, overlaps = self.product_structure()
         total_revenue = 0
         b = list(self.factors["booking_limits"])
-        A = np.array(self.factors["product_incidence"])
-        # Vector of next arrival time per product.
-        # (Starts at time = -1*time_before, e.g., t = -168.)
-        arrival = np.zeros(self.factors["num_products"]) - self.factors["time_before"]
-        # Upper bound on number of arrivals over the time period.
+        # Interarrival times of product i are the (i * arr_bound)-th and following draws,
+        # where arr_bound is an upper bound on the number of arrivals of a product.
+        # Each product draws its interarrival times lazily from its own copy of the rng.
         arr_bound = 10 * round(168 * np.sum(self.factors["lambda"]))
-        arr_time = np.zeros((self.factors["num_products"], arr_bound))
+        product_rngs = [copy_rng(arr_rng) for _ in range(num_products)]
+        for i in range(1, num_products):
+            product_rngs[i].seed(advance_state(product_rngs[i - 1].get_current_state(), arr_bound))
+        arr_times = [[] for _ in range(num_products)]
         # Index of which arrival time to use next for each product.
-        a = np.zeros(self.factors["num_products"], dtype=int)
-        # Generate all interarrival times in advance.
-        for i in range(self.factors["num_products"]):
-            arr_time[i] = np.array([arr_rng.expovariate(self.factors["lambda"][i]) for _ in range(arr_bound)])
-        # Extract first arrivals.
-        for i in range(self.factors["num_products"]):
-            arrival[i] = arrival[i] + arr_time[i, a[i]]
+        a = [0] * num_products
+        # Calendar of next arrival time per product, ignoring arrivals after the product's time limit.
+        # (Starts at time = -1*time_before, e.g., t = -168.)
+        calendar = []
+        for i in range(num_products):
+            arrival = -self.factors["time_before"] + self.next_interarrival_time(product_rngs[i], self.factors["lambda"][i], arr_times[i], a[i])
             a[i] = 1
-        min_time = 0  # Keeps track of minimum time of the orders not yet received.
-        while min_time <= self.factors["runlength"]:
-            min_time = self.factors["runlength"] + 1
-            for i in range(self.factors["num_products"]):
-                if ((arrival[i] < min_time) and (arrival[i] <= self.factors["time_limit"][i])):
-                    min_time = arrival[i]
-                    min_idx = i
-            if min_time > self.factors["runlength"]:
+            if arrival <= time_limit[i]:
+                calendar.append((arrival, i))
+        heapq.heapify(calendar)
+        while calendar:
+            min_time, min_idx = calendar[0]
+            if min_time > runlength:
                 break
             if b[min_idx] > 0:
-                if min_idx % 2 == 0:  # Rack_rate.
-                    total_revenue += sum(self.factors["rack_rate"] * A[:, min_idx])
-                else:  # Discount_rate.
-                    total_revenue += sum(self.factors["discount_rate"] * A[:, min_idx])
+                total_revenue += revenues[min_idx]
                 # Reduce the inventory of products sharing the same resource.
-                for i in range(self.factors["num_products"]):
-                    if np.dot(A[:, i].T, A[:, min_idx]) >= 1:
-                        if b[i] != 0:
-                            b[i] -= 1
-            arrival[min_idx] += arr_time[min_idx, a[min_idx]]
+                for i in overlaps[min_idx]:
+                    if b[i] != 0:
+                        b[i] -= 1
+            arrival = min_time + self.next_interarrival_time(product_rngs[min_idx], self.factors["lambda"][min_idx], arr_times[min_idx], a[min_idx])
             a[min_idx] = a[min_idx] + 1
-        # Compose responses and gradients.
+            if arrival <= time_limit[min_idx]:
+                heapq.heapreplace(calendar, (arrival, min_idx))
+            else:
+                heapq.heappop(calendar)
+        # Compose responses.
         responses = {"revenue": total_revenue}
-        gradients = {response_key: {factor_key: np.nan for factor_key in self.specifications} for response_key in responses}
-        return responses, gradients
+        return responses, NO_GRADIENTS
+
+    def next_interarrival_time(self, product_rng, rate, arr_times, index):
+        """
+        Return an interarrival time of a product, drawing a new block of
+        interarrival times when those drawn so far are used up.
+
+        Arguments
+        ---------
+        product_rng : mrg32k3a.mrg32k3a.MRG32k3a object
+            rng for interarrival times of the product
+        rate : float
+            arrival rate of the product
+        arr_times : list of float
+            interarrival times of the product drawn so far; extended in place
+        index : int
+            index of the interarrival time
+
+        Returns
+        -------
+        float
+            interarrival time
+        """
+        if index == len(arr_times):
+            # Double the number drawn, so few blocks are needed.
+            arr_times.extend(expovariate_block(product_rng, rate, max(8, len(arr_times))).tolist())
+        return arr_times[index]
 
 
 """
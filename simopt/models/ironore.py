@@ -10,9 +10,10 @@ Changed get_random_solution quantiles
     to 10 and 1000 => mean=199.384, sd=343.925, p(X>100)=0.5
 """
 import numpy as np
-from math import sqrt, copysign
 
-from ..base import Model, Problem
+from ..base import Model, Problem, NO_GRADIENTS, records_from_columns
+from ..lockstep import lockstep_ops
+from ..rng_streams import bsm_block, normalvariate_block, random_by_subsubstream
 
 
 class IronOre(Model):
@@ -182,6 +183,19 @@ class IronOre(Model):
     def check_simulatable_factors(self):
         return (self.factors["min_price"] <= self.factors["mean_price"]) & (self.factors["mean_price"] <= self.factors["max_price"])
 
+    def response_dtype(self):
+        """
+        Return the numpy structured dtype of the responses of a single replication.
+
+        Returns
+        -------
+        numpy dtype
+            one field per response
+        """
+        return np.dtype([("total_profit", float),
+                         ("frac_producing", float),
+                         ("mean_stock", float)])
+
     def replicate(self, rng_list):
         """
         Simulate a single replication for the current model factors.
@@ -201,64 +215,114 @@ class IronOre(Model):
         """
         # Designate random number generators.
         price_rng = rng_list[0]
-        # Initialize quantities to track:
-        #   - Market price in each period (Pt).
-        #   - Starting stock in each period.
-        #   - Ending stock in each period.
-        #   - Profit in each period.
-        #   - Whether producing or not in each period.
-        #   - Production in each period.
-        mkt_price = np.zeros(self.factors["n_days"])
-        mkt_price[0] = self.factors["mean_price"]
-        stock = np.zeros(self.factors["n_days"])
-        profit = np.zeros(self.factors["n_days"])
-        producing = np.zeros(self.factors["n_days"])
-        prod = np.zeros(self.factors["n_days"])
-
+        # Generate the standard normal shocks to the price on each day after the first.
+        shocks = normalvariate_block(price_rng, 0, 1, self.factors["n_days"] - 1)
         # Run simulation over time horizon.
-        for day in range(1, self.factors["n_days"]):
+        total_profit, producing, stock = self.simulate_days(shocks[np.newaxis])
+        # Calculate responses from simulation data.
+        responses = {"total_profit": total_profit[0],
+                     "frac_producing": np.mean(producing[0]),
+                     "mean_stock": np.mean(stock[0])
+                     }
+        return responses, NO_GRADIENTS
+
+    def replicate_batch(self, rng_list, m, need_gradients=True):
+        """
+        Simulate `m` replications for the current model factors, advancing
+        the replications in lockstep one day at a time.
+
+        Arguments
+        ---------
+        rng_list : list of mrg32k3a.mrg32k3a.MRG32k3a objects
+            rngs for model to use when simulating the replications
+        m : int
+            number of replications to simulate
+        need_gradients : bool, default=True
+            True if IPA gradient estimates are needed, otherwise False
+
+        Returns
+        -------
+        responses : numpy structured array
+            performance measures of interest, one row per replication
+            (see `replicate`)
+        gradients : ``base.NO_GRADIENTS``
+            gradient estimates are not available
+        """
+        price_rng = rng_list[0]
+        # Draw the shocks of each replication from its own subsubstream.
+        shocks = bsm_block(random_by_subsubstream(price_rng, m, self.factors["n_days"] - 1))
+        total_profit, producing, stock = self.simulate_days(shocks)
+        responses = {"total_profit": total_profit,
+                     "frac_producing": np.mean(producing, axis=1),
+                     "mean_stock": np.mean(stock, axis=1)
+                     }
+        return records_from_columns(responses, m), NO_GRADIENTS
+
+    def simulate_days(self, shocks):
+        """
+        Simulate the price, production, and sales of one or more replications
+        over the time horizon.
+
+        Arguments
+        ---------
+        shocks : numpy array
+            standard normal shocks to the price of each replication on each
+            day after the first, m x (n_days - 1)
+
+        Returns
+        -------
+        total_profit : numpy array
+            total profit of each replication over the time horizon
+        producing : numpy array
+            whether each replication is producing on each day, m x n_days
+        stock : numpy array
+            stock of each replication at the end of each day, m x n_days
+        """
+        mean_price = self.factors["mean_price"]
+        max_price = self.factors["max_price"]
+        min_price = self.factors["min_price"]
+        st_dev = self.factors["st_dev"]
+        capacity = self.factors["capacity"]
+        max_prod_perday = self.factors["max_prod_perday"]
+        prod_cost = self.factors["prod_cost"]
+        holding_cost = self.factors["holding_cost"]
+        price_prod = self.factors["price_prod"]
+        price_stop = self.factors["price_stop"]
+        price_sell = self.factors["price_sell"]
+        inven_stop = self.factors["inven_stop"]
+        m, n_moves = shocks.shape
+        ops = lockstep_ops(m)
+        producing_by_day = ops.new_records(n_moves + 1, m)
+        stock_by_day = ops.new_records(n_moves + 1, m)
+        price = ops.full(m, float(mean_price))
+        # The mean move on the first day is taken relative to a price of 0.
+        prev_price = ops.full(m, 0.0)
+        producing = ops.full(m, False)
+        stock = ops.full(m, 0.0)
+        profit = ops.full(m, 0.0)
+        for day, shock in enumerate(ops.by_step(shocks), start=1):
             # Determine new price, mean-reverting random walk, Pt = trunc(Pt−1 + Nt(μt,σ)).
             # Run μt, mean at period t, where μt = sgn(μ0 − Pt−1) ∗ |μ0 − Pt−1|^(1/4).
-            mean_val = sqrt(sqrt(abs(self.factors["mean_price"] - mkt_price[day])))
-            mean_dir = copysign(1, self.factors["mean_price"] - mkt_price[day])
-            mean_move = mean_val * mean_dir
-            move = price_rng.normalvariate(mean_move, self.factors["st_dev"])
-            mkt_price[day] = max(min(mkt_price[day - 1] + move, self.factors["max_price"]), self.factors["min_price"])
-            # If production is underway...
-            if producing[day] == 1:
-                # ... cease production if price goes too low or inventory is too high.
-                if ((mkt_price[day] <= self.factors["price_stop"]) | (stock[day] >= self.factors["inven_stop"])):
-                    producing[day] = 0
-                else:
-                    prod[day] = min(self.factors["max_prod_perday"], self.factors["capacity"] - stock[day])
-                    stock[day] = stock[day] + prod[day]
-                    profit[day] = profit[day] - prod[day] * self.factors["prod_cost"]
-            # If production is not currently underway...
-            else:
-                if ((mkt_price[day] >= self.factors["price_prod"]) & (stock[day] < self.factors["inven_stop"])):
-                    producing[day] = 1
-                    prod[day] = min(self.factors["max_prod_perday"], self.factors["capacity"] - stock[day])
-                    stock[day] = stock[day] + prod[day]
-                    profit[day] = profit[day] - prod[day] * self.factors["prod_cost"]
+            mean_move = ops.sqrt(ops.sqrt(abs(mean_price - prev_price))) * ops.copysign(1, mean_price - prev_price)
+            price = ops.maximum(ops.minimum(price + (mean_move + st_dev * shock), max_price), min_price)
+            prev_price = price
+            # Continue production while price and inventory allow it,
+            # or start production if price is high enough and inventory is low enough.
+            producing = ops.where(producing,
+                                  (price > price_stop) & (stock < inven_stop),
+                                  (price >= price_prod) & (stock < inven_stop))
+            prod = ops.minimum(max_prod_perday, capacity - stock)
+            stock = ops.where(producing, stock + prod, stock)
+            profit = ops.where(producing, profit - prod * prod_cost, profit)
             # Sell if price is high enough.
-            if (mkt_price[day] >= self.factors["price_sell"]):
-                profit[day] = profit[day] + stock[day] * mkt_price[day]
-                stock[day] = 0
+            selling = price >= price_sell
+            profit = ops.where(selling, profit + stock * price, profit)
+            stock = ops.where(selling, 0.0, stock)
             # Charge holding cost.
-            profit[day] = profit[day] - stock[day] * self.factors["holding_cost"]
-            # Calculate starting quantities for next period.
-            if day < self.factors["n_days"] - 1:
-                profit[day + 1] = profit[day]
-                stock[day + 1] = stock[day]
-                mkt_price[day + 1] = mkt_price[day]
-                producing[day + 1] = producing[day]
-        # Calculate responses from simulation data.
-        responses = {"total_profit": profit[self.factors["n_days"] - 1],
-                     "frac_producing": np.mean(producing),
-                     "mean_stock": np.mean(stock)
-                     }
-        gradients = {response_key: {factor_key: np.nan for factor_key in self.specifications} for response_key in responses}
-        return responses, gradients
+            profit = profit - stock * holding_cost
+            producing_by_day[day] = ops.where(producing, 1.0, 0.0)
+            stock_by_day[day] = stock
+        return np.atleast_1d(profit), ops.by_replication(producing_by_day), ops.by_replication(stock_by_day)
 
 
 """
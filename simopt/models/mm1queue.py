@@ -7,7 +7,8 @@ A detailed description of the model/problem can be found
 """
 import numpy as np
 
-from ..base import Model, Problem
+from ..base import Model, Problem, NO_GRADIENTS, records_from_columns
+from ..rng_streams import expovariate_block
 
 
 class MM1Queue(Model):
@@ -98,7 +99,97 @@ class MM1Queue(Model):
         # return self.factors["mu"] > self.factors["lambda"]
         return True
 
-    def replicate(self, rng_list):
+    def response_dtype(self):
+        """
+        Return the numpy structured dtype of the responses of a single replication.
+
+        Returns
+        -------
+        numpy dtype
+            one field per response
+        """
+        return np.dtype([("avg_sojourn_time", float),
+                         ("avg_waiting_time", float),
+                         ("frac_cust_wait", float)])
+
+    def simulate_customers(self, arrival_times, service_times, need_gradients=True):
+        """
+        Compute the customers' statistics for a batch of replications.
+
+        Notes
+        -----
+        Service completion times follow the Lindley recursion
+        c_i = max(a_i, c_{i-1}) + s_i, which is solved in closed form:
+        with w_i = s_1 + ... + s_i the cumulative work,
+        c_i = w_i + max_{j <= i} (a_j - w_{j-1}). Since completion times are nondecreasing,
+        the number of customers in system when customer i arrives is i
+        minus the number of completion times not exceeding a_i. The IPA
+        gradients w.r.t. mu sum the service times of the customers in
+        system, which are read off cumulative service times restarted at
+        the beginning of each busy period.
+
+        Arguments
+        ---------
+        arrival_times : numpy array
+            arrival times of the customers; # replications x # customers
+        service_times : numpy array
+            service times of the customers; # replications x # customers
+        need_gradients : bool, default=True
+            True if IPA gradient estimates are needed, otherwise False
+
+        Returns
+        -------
+        statistics : dict
+            "avg_sojourn_time", "avg_waiting_time" and "frac_cust_wait"
+            of each replication (see `replicate`)
+        gradients_mu : dict
+            IPA gradients of "avg_sojourn_time" and "avg_waiting_time"
+            w.r.t. mu of each replication; None if `need_gradients` is False
+        """
+        m, total = arrival_times.shape
+        warmup = self.factors["warmup"]
+        # Solve the Lindley recursion for all customers at once.
+        work = np.cumsum(service_times, axis=1)
+        work_before = work - service_times
+        completion_times = work + np.maximum.accumulate(arrival_times - work_before, axis=1)
+        # Track the cumulative service time since the start of the current busy period.
+        starts_busy = np.empty((m, total), dtype=bool)
+        starts_busy[:, 0] = True
+        starts_busy[:, 1:] = arrival_times[:, 1:] >= completion_times[:, :-1]
+        busy_start = np.maximum.accumulate(np.where(starts_busy, np.arange(total), 0), axis=1)
+        busy_service = work - np.take_along_axis(work_before, busy_start, axis=1)
+        sojourn_times = completion_times - arrival_times
+        waiting_times = sojourn_times - service_times
+        # The first customer never waits.
+        sojourn_times[:, 0] = service_times[:, 0]
+        waiting_times[:, 0] = 0
+        # Count customers in system at each arrival.
+        customer_index = np.arange(total)
+        n_departed = np.empty((m, total), dtype=int)
+        for rep in range(m):
+            n_departed[rep] = np.searchsorted(completion_times[rep], arrival_times[rep], side="right")
+        n_in_system = customer_index - np.minimum(n_departed, customer_index)
+        statistics = {
+            "avg_sojourn_time": np.mean(sojourn_times[:, warmup:], axis=1),
+            "avg_waiting_time": np.mean(waiting_times[:, warmup:], axis=1),
+            "frac_cust_wait": np.mean(n_in_system[:, warmup:] > 0, axis=1)
+        }
+        if not need_gradients:
+            return statistics, None
+        # Sum service times of the customers in system at each arrival and of the arriving customer.
+        first_in_system = customer_index - n_in_system
+        rows = np.arange(m)[:, np.newaxis]
+        before_first = np.where(starts_busy[rows, first_in_system], 0, busy_service[rows, np.maximum(first_in_system - 1, 0)])
+        service_in_system = busy_service - before_first
+        service_ahead = np.where(n_in_system > 0, service_in_system - service_times, 0)
+        service_ahead[:, 0] = 0
+        gradients_mu = {
+            "avg_sojourn_time": np.mean(-service_in_system[:, warmup:] / self.factors["mu"], axis=1),
+            "avg_waiting_time": np.mean(-service_ahead[:, warmup:] / self.factors["mu"], axis=1)
+        }
+        return statistics, gradients_mu
+
+    def replicate(self, rng_list, need_gradients=True):
         """
         Simulate a single replication for the current model factors.
 
@@ -106,6 +197,8 @@ class MM1Queue(Model):
         ---------
         rng_list : list of mrg32k3a.mrg32k3a.MRG32k3a objects
             rngs for model to use when simulating a replication
+        need_gradients : bool, default=True
+            True if IPA gradient estimates are needed, otherwise False
 
         Returns
         -------
@@ -115,7 +208,8 @@ class MM1Queue(Model):
             "avg_waiting_time" = average waiting time
             "frac_cust_wait" = fraction of customers who wait
         gradients : dict of dicts
-            gradient estimates for each response
+            gradient estimates for each response;
+            ``base.NO_GRADIENTS`` if `need_gradients` is False
         """
         # Calculate total number of arrivals to simulate.
         total = self.factors["warmup"] + self.factors["people"]
@@ -123,73 +217,66 @@ class MM1Queue(Model):
         arrival_rng = rng_list[0]
         service_rng = rng_list[1]
         # Generate all interarrival and service times up front.
-        arrival_times = ([arrival_rng.expovariate(self.factors["lambda"])
-                         for _ in range(total)])
-        service_times = ([service_rng.expovariate(self.factors["mu"])
-                         for _ in range(total)])
-        # Create matrix storing times and metrics for each customer:
-        #     column 0 : arrival time to queue;
-        #     column 1 : service time;
-        #     column 2 : service completion time;
-        #     column 3 : sojourn time;
-        #     column 4 : waiting time;
-        #     column 5 : number of customers in system at arrival;
-        #     column 6 : IPA gradient of sojourn time w.r.t. mu;
-        #     column 7 : IPA gradient of waiting time w.r.t. mu;
-        #     column 8 : IPA gradient of sojourn time w.r.t. lambda;
-        #     column 9 : IPA gradient of waiting time w.r.t. lambda.
-        cust_mat = np.zeros((total, 10))
-        cust_mat[:, 0] = np.cumsum(arrival_times)
-        cust_mat[:, 1] = service_times
-        # Input entries for first customer's queueing experience.
-        cust_mat[0, 2] = cust_mat[0, 0] + cust_mat[0, 1]
-        cust_mat[0, 3] = cust_mat[0, 1]
-        cust_mat[0, 4] = 0
-        cust_mat[0, 5] = 0
-        cust_mat[0, 6] = -cust_mat[0, 1] / self.factors["mu"]
-        cust_mat[0, 7] = 0
-        cust_mat[0, 8] = 0
-        cust_mat[0, 9] = 0
-        # Fill in entries for remaining customers' experiences.
-        for i in range(1, total):
-            cust_mat[i, 2] = (max(cust_mat[i, 0], cust_mat[i - 1, 2])
-                              + cust_mat[i, 1])
-            cust_mat[i, 3] = cust_mat[i, 2] - cust_mat[i, 0]
-            cust_mat[i, 4] = cust_mat[i, 3] - cust_mat[i, 1]
-            cust_mat[i, 5] = (sum(cust_mat[i - int(cust_mat[i - 1, 5]) - 1:i, 2]
-                                  > cust_mat[i, 0]))
-            cust_mat[i, 6] = (-sum(cust_mat[i - int(cust_mat[i, 5]):i + 1, 1])
-                              / self.factors["mu"])
-            cust_mat[i, 7] = (-sum(cust_mat[i - int(cust_mat[i, 5]):i, 1])
-                              / self.factors["mu"])
-            cust_mat[i, 8] = np.nan  # ... to be derived
-            cust_mat[i, 9] = np.nan  # ... to be derived
-        # Compute average sojourn time and its gradient.
-        mean_sojourn_time = np.mean(cust_mat[self.factors["warmup"]:, 3])
-        grad_mean_sojourn_time_mu = np.mean(cust_mat[self.factors["warmup"]:, 6])
-        grad_mean_sojourn_time_lambda = np.mean(cust_mat[self.factors["warmup"]:, 8])
-        # Compute average waiting time and its gradient.
-        mean_waiting_time = np.mean(cust_mat[self.factors["warmup"]:, 4])
-        grad_mean_waiting_time_mu = np.mean(cust_mat[self.factors["warmup"]:, 7])
-        grad_mean_waiting_time_lambda = np.mean(cust_mat[self.factors["warmup"]:, 9])
-        # Compute fraction of customers who wait.
-        fraction_wait = np.mean(cust_mat[self.factors["warmup"]:, 5] > 0)
+        arrival_times = np.cumsum(expovariate_block(arrival_rng, self.factors["lambda"], total))
+        service_times = expovariate_block(service_rng, self.factors["mu"], total)
+        statistics, gradients_mu = self.simulate_customers(arrival_times[np.newaxis], service_times[np.newaxis], need_gradients)
         # Compose responses and gradients.
-        responses = {
-            "avg_sojourn_time": mean_sojourn_time,
-            "avg_waiting_time": mean_waiting_time,
-            "frac_cust_wait": fraction_wait
-        }
+        responses = {response_key: statistics[response_key][0] for response_key in statistics}
+        if not need_gradients:
+            return responses, NO_GRADIENTS
         gradients = {response_key:
                      {factor_key: np.nan for factor_key in self.specifications}
                      for response_key in responses
                      }
-        gradients["avg_sojourn_time"]["mu"] = grad_mean_sojourn_time_mu
-        gradients["avg_sojourn_time"]["lambda"] = grad_mean_sojourn_time_lambda
-        gradients["avg_waiting_time"]["mu"] = grad_mean_waiting_time_mu
-        gradients["avg_waiting_time"]["lambda"] = grad_mean_waiting_time_lambda
+        gradients["avg_sojourn_time"]["mu"] = gradients_mu["avg_sojourn_time"][0]
+        gradients["avg_waiting_time"]["mu"] = gradients_mu["avg_waiting_time"][0]
+        # IPA gradients w.r.t. lambda are yet to be derived.
         return responses, gradients
 
+    def replicate_batch(self, rng_list, m, need_gradients=True):
+        """
+        Simulate `m` replications for the current model factors.
+
+        Arguments
+        ---------
+        rng_list : list of mrg32k3a.mrg32k3a.MRG32k3a objects
+            rngs for model to use when simulating the replications
+        m : int
+            number of replications to simulate
+        need_gradients : bool, default=True
+            True if IPA gradient estimates are needed, otherwise False
+
+        Returns
+        -------
+        responses : numpy structured array
+            performance measures of interest, one row per replication
+            (see `replicate`)
+        gradients : numpy structured array
+            gradient estimates for each response, one row per replication;
+            ``base.NO_GRADIENTS`` if `need_gradients` is False
+        """
+        total = self.factors["warmup"] + self.factors["people"]
+        arrival_rng = rng_list[0]
+        service_rng = rng_list[1]
+        # Draw the times of each replication from its own subsubstreams.
+        interarrival_times = np.empty((m, total))
+        service_times = np.empty((m, total))
+        for rep in range(m):
+            interarrival_times[rep] = expovariate_block(arrival_rng, self.factors["lambda"], total)
+            service_times[rep] = expovariate_block(service_rng, self.factors["mu"], total)
+            arrival_rng.advance_subsubstream()
+            service_rng.advance_subsubstream()
+        statistics, gradients_mu = self.simulate_customers(np.cumsum(interarrival_times, axis=1), service_times, need_gradients)
+        if not need_gradients:
+            return records_from_columns(statistics, m), NO_GRADIENTS
+        gradients = {response_key:
+                     {factor_key: np.nan for factor_key in self.specifications}
+                     for response_key in statistics
+                     }
+        gradients["avg_sojourn_time"]["mu"] = gradients_mu["avg_sojourn_time"]
+        gradients["avg_waiting_time"]["mu"] = gradients_mu["avg_waiting_time"]
+        return records_from_columns(statistics, m), records_from_columns(gradients, m)
+
 
 """
 Summary
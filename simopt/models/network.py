@@ -7,7 +7,8 @@ A detailed description of the model/problem can be found
 """
 
 import numpy as np
-from ..base import Model, Problem
+from ..base import Model, Problem, NO_GRADIENTS
+from ..rng_streams import choices_block, expovariate_block, triangular_block
 
 
 class Network(Model):
@@ -157,6 +158,17 @@ class Network(Model):
         else:
             return True
 
+    def response_dtype(self):
+        """
+        Return the numpy structured dtype of the responses of a single replication.
+
+        Returns
+        -------
+        numpy dtype
+            one field per response
+        """
+        return np.dtype([("total_cost", float)])
+
     def replicate(self, rng_list):
         """
         Simulate a single replication for the current model factors.
@@ -171,8 +183,8 @@ class Network(Model):
         responses : dict
             performance measure of interest
             "total_cost": total cost spent to route all messages
-        gradients : dict of dicts
-            gradient estimates for each response
+        gradients : NoneType
+            ``base.NO_GRADIENTS``, as gradients are not estimated
         """
         # Determine total number of arrivals to simulate.
         total_arrivals = self.factors["n_messages"]
@@ -181,56 +193,36 @@ class Network(Model):
         network_rng = rng_list[1]
         transit_rng = rng_list[2]
         # Generate all interarrival, network routes, and service times before the simulation run.
-        arrival_times = [arrival_rng.expovariate(self.factors["arrival_rate"])
-                         for _ in range(total_arrivals)]
-        network_routes = network_rng.choices(range(self.factors["n_networks"]), weights=self.factors["process_prob"], k=total_arrivals)
-        service_times = [transit_rng.triangular(low=self.factors["lower_limits_transit_time"][network_routes[i]],
-                                                high=self.factors["upper_limits_transit_time"][network_routes[i]],
-                                                mode=self.factors["mode_transit_time"][network_routes[i]])
-                         for i in range(total_arrivals)]
-        # Create matrix storing times and metrics for each message:
-        #     column 0 : arrival time to queue;
-        #     column 1 : network route;
-        #     column 2 : service time;
-        #     column 3 : service completion time;
-        #     column 4 : sojourn time;
-        #     column 5 : waiting time;
-        #     column 6 : processing cost;
-        #     column 7 : time cost;
-        #     column 8 : total cost;
-        message_mat = np.zeros((total_arrivals, 9))
-        message_mat[:, 0] = np.cumsum(arrival_times)
-        message_mat[:, 1] = network_routes
-        message_mat[:, 2] = service_times
-        # Fill in entries for remaining messages' metrics.
-        # Create a list recording the index of the last customer sent to each network.
-        # Starting with -1, indicating no one is in line.
-        last_in_line = [-1 for _ in range(self.factors["n_networks"])]
-        # Start of the simulation run.
-        for i in range(total_arrivals):
-            # Identify the network that message i was routed to.
-            network = int(message_mat[i, 1])
-            # Check if there was a message in line previously sent to that network.
-            if last_in_line[network] == -1:
-                # With no message in line, message i's service completion time is its arrival time plus its service time.
-                message_mat[i, 3] = message_mat[i, 0] + message_mat[i, 2]
-            else:
-                # With a message in line, message i's service completion time will be calculated using Lindley's recursion method.
-                # We first choose the maximum between the arrival time of message i and the last in line message's service completion time.
-                # We then add message's i service time to this value.
-                message_mat[i, 3] = max(message_mat[i, 0], message_mat[last_in_line[network], 3]) + message_mat[i, 2]
-            # Calculate other statistics.
-            message_mat[i, 4] = message_mat[i, 3] - message_mat[i, 0]
-            message_mat[i, 5] = message_mat[i, 4] - message_mat[i, 2]
-            message_mat[i, 6] = self.factors["cost_process"][network]
-            message_mat[i, 7] = self.factors["cost_time"][network] * message_mat[i, 4]
-            message_mat[i, 8] = message_mat[i, 6] + message_mat[i, 7]
-            last_in_line[network] = i
-        # Compute total costs for the simulation run.
-        total_cost = sum(message_mat[:, 8])
+        arrival_times = np.cumsum(expovariate_block(arrival_rng, self.factors["arrival_rate"], total_arrivals))
+        network_routes = choices_block(network_rng, self.factors["process_prob"], total_arrivals)
+        service_times = triangular_block(transit_rng,
+                                         low=np.array(self.factors["lower_limits_transit_time"], dtype=float)[network_routes],
+                                         high=np.array(self.factors["upper_limits_transit_time"], dtype=float)[network_routes],
+                                         mode=np.array(self.factors["mode_transit_time"], dtype=float)[network_routes],
+                                         n=total_arrivals)
+        # Messages routed to different networks wait in separate FIFO queues,
+        # so simulate the queue of each network in turn.
+        order = np.argsort(network_routes, kind="stable")
+        counts = np.bincount(network_routes, minlength=self.factors["n_networks"])
+        starts = np.cumsum(counts) - counts
+        total_cost = 0
+        for network in range(self.factors["n_networks"]):
+            if counts[network] == 0:
+                continue
+            # Messages routed to the network, in order of arrival.
+            in_network = order[starts[network]:starts[network] + counts[network]]
+            arrivals = arrival_times[in_network]
+            services = service_times[in_network]
+            # Lindley's recursion, completion = max(arrival, last completion) + service,
+            # unrolled: each completion is the latest over earlier messages j of
+            # the arrival of j plus the service times of messages j through i.
+            work = np.cumsum(services)
+            completions = work + np.maximum.accumulate(arrivals - (work - services))
+            # Each message costs its processing cost plus its time cost for its sojourn time.
+            sojourn_times = completions - arrivals
+            total_cost += self.factors["cost_process"][network] * counts[network] + self.factors["cost_time"][network] * np.sum(sojourn_times)
         responses = {"total_cost": total_cost}
-        gradients = {response_key: {factor_key: np.nan for factor_key in self.specifications} for response_key in responses}
-        return responses, gradients
+        return responses, NO_GRADIENTS
 
 
 """
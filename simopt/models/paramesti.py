@@ -8,7 +8,7 @@ A detailed description of the model/problem can be found
 import numpy as np
 import math
 
-from ..base import Model, Problem
+from ..base import Model, Problem, records_from_columns, row_from_columns, NO_GRADIENTS
 
 
 class ParameterEstimation(Model):
@@ -80,6 +80,17 @@ class ParameterEstimation(Model):
         else:
             return True
 
+    def response_dtype(self):
+        """
+        Return the numpy structured dtype of the responses of a single replication.
+
+        Returns
+        -------
+        numpy dtype
+            one field per response
+        """
+        return np.dtype([("loglik", float)])
+
     def replicate(self, rng_list):
         """
         Simulate a single replication for the current model factors.
@@ -94,8 +105,8 @@ class ParameterEstimation(Model):
         responses : dict
             performance measures of interest
             "loglik" = the corresponding loglikelihood
-        gradients : dict of dicts
-            gradient estimates for each response
+        gradients : NoneType
+            ``base.NO_GRADIENTS``, as gradients are not estimated
         """
         # Designate separate random number generators.
         # Outputs will be coupled when generating Y_j's.
@@ -104,12 +115,67 @@ class ParameterEstimation(Model):
         # Generate y1 and y2 from specified gamma distributions.
         y2 = y2_rng.gammavariate(self.factors['xstar'][1], 1)
         y1 = y1_rng.gammavariate(self.factors['xstar'][0] * y2, 1)
-        # Compute Log Likelihood
-        loglik = - y1 - y2 + (self.factors['x'][0] * y2 - 1) * np.log(y1) + (self.factors['x'][1] - 1) * np.log(y2) - np.log(math.gamma(self.factors['x'][0] * y2)) - np.log(math.gamma(self.factors['x'][1]))
-        # Compose responses and gradients.
+        responses = self.loglikelihoods(np.array([y1]), np.array([y2]))
+        return row_from_columns(responses, 0), NO_GRADIENTS
+
+    def replicate_batch(self, rng_list, m, need_gradients=True):
+        """
+        Simulate `m` replications for the current model factors.
+
+        Arguments
+        ---------
+        rng_list : list of mrg32k3a.mrg32k3a.MRG32k3a objects
+            rngs for model to use when simulating the replications
+        m : int
+            number of replications to simulate
+        need_gradients : bool, default=True
+            True if gradient estimates are needed, otherwise False
+
+        Returns
+        -------
+        responses : numpy structured array
+            performance measures of interest, one row per replication
+            (see `replicate`)
+        gradients : NoneType
+            ``base.NO_GRADIENTS``, as gradients are not estimated
+        """
+        # Designate separate random number generators.
+        # Outputs will be coupled when generating Y_j's.
+        y2_rng = rng_list[0]
+        y1_rng = rng_list[1]
+        # Generate y1 and y2 for each replication from its own subsubstreams.
+        y1 = np.empty(m)
+        y2 = np.empty(m)
+        for rep in range(m):
+            y2[rep] = y2_rng.gammavariate(self.factors['xstar'][1], 1)
+            y1[rep] = y1_rng.gammavariate(self.factors['xstar'][0] * y2[rep], 1)
+            y2_rng.advance_subsubstream()
+            y1_rng.advance_subsubstream()
+        responses = self.loglikelihoods(y1, y2)
+        return records_from_columns(responses, m), NO_GRADIENTS
+
+    def loglikelihoods(self, y1, y2):
+        """
+        Compute the loglikelihood of one or more replications.
+
+        Arguments
+        ---------
+        y1 : numpy array
+            first gamma variate of each replication
+        y2 : numpy array
+            second gamma variate of each replication
+
+        Returns
+        -------
+        responses : dict
+            performance measures of interest of each replication (see `replicate`)
+        """
+        # Compute Log Likelihoods.
+        gamma_x0_y2 = np.array([math.gamma(shape) for shape in self.factors['x'][0] * y2])
+        loglik = - y1 - y2 + (self.factors['x'][0] * y2 - 1) * np.log(y1) + (self.factors['x'][1] - 1) * np.log(y2) - np.log(gamma_x0_y2) - np.log(math.gamma(self.factors['x'][1]))
+        # Compose responses.
         responses = {'loglik': loglik}
-        gradients = {response_key: {factor_key: np.nan for factor_key in self.specifications} for response_key in responses}
-        return responses, gradients
+        return responses
 
 
 """
@@ -281,6 +347,23 @@ class ParamEstiMaxLogLik(Problem):
         objectives = (response_dict["loglik"],)
         return objectives
 
+    def response_batch_to_objectives(self, responses):
+        """
+        Convert a batch of responses to a matrix of objectives.
+
+        Arguments
+        ---------
+        responses : numpy structured array
+            responses with one row per replication and one field per response
+
+        Returns
+        -------
+        objectives : numpy array
+            matrix of objectives, one row per replication
+        """
+        objectives = np.column_stack((responses["loglik"],))
+        return objectives
+
     def deterministic_objectives_and_gradients(self, x):
         """
         Compute deterministic components of objectives for a solution `x`.
@@ -8,7 +8,8 @@ A detailed description of the model/problem can be found
 """
 import numpy as np
 
-from ..base import Model, Problem
+from ..base import Model, Problem, records_from_columns, row_from_columns, NO_GRADIENTS
+from ..rng_streams import expovariate_block
 
 
 class RMITD(Model):
@@ -146,6 +147,17 @@ class RMITD(Model):
         else:
             return True
 
+    def response_dtype(self):
+        """
+        Return the numpy structured dtype of the responses of a single replication.
+
+        Returns
+        -------
+        numpy dtype
+            one field per response
+        """
+        return np.dtype([("revenue", float)])
+
     def replicate(self, rng_list):
         """
         Simulate a single replication for the current model factors.
@@ -160,8 +172,8 @@ class RMITD(Model):
         responses : dict
             performance measures of interest
             "revenue" = total revenue
-        gradients : dict of dicts
-            gradient estimates for each response
+        gradients : NoneType
+            ``base.NO_GRADIENTS``, as gradients are not estimated
         """
         # Designate separate random number generators.
         # Outputs will be coupled when generating demand.
@@ -172,24 +184,79 @@ class RMITD(Model):
         #     alpha = k = gamma_shape
         #     beta = 1/theta = 1/gamma_scale
         X = X_rng.gammavariate(alpha=self.factors["gamma_shape"], beta=1./self.factors["gamma_scale"])
-        Y = [Y_rng.expovariate(1) for _ in range(self.factors["time_horizon"])]
+        Y = expovariate_block(Y_rng, 1, self.factors["time_horizon"])
+        responses = self.revenues(np.array([X]), Y[np.newaxis])
+        return row_from_columns(responses, 0), NO_GRADIENTS
+
+    def replicate_batch(self, rng_list, m, need_gradients=True):
+        """
+        Simulate `m` replications for the current model factors.
+
+        Arguments
+        ---------
+        rng_list : list of mrg32k3a.mrg32k3a.MRG32k3a objects
+            rngs for model to use when simulating the replications
+        m : int
+            number of replications to simulate
+        need_gradients : bool, default=True
+            True if gradient estimates are needed, otherwise False
+
+        Returns
+        -------
+        responses : numpy structured array
+            performance measures of interest, one row per replication
+            (see `replicate`)
+        gradients : NoneType
+            ``base.NO_GRADIENTS``, as gradients are not estimated
+        """
+        # Designate separate random number generators.
+        # Outputs will be coupled when generating demand.
+        X_rng = rng_list[0]
+        Y_rng = rng_list[1]
+        # Generate X and Y for each replication from its own subsubstreams.
+        X = np.empty(m)
+        Y = np.empty((m, self.factors["time_horizon"]))
+        for rep in range(m):
+            X[rep] = X_rng.gammavariate(alpha=self.factors["gamma_shape"], beta=1./self.factors["gamma_scale"])
+            Y[rep] = expovariate_block(Y_rng, 1, self.factors["time_horizon"])
+            X_rng.advance_subsubstream()
+            Y_rng.advance_subsubstream()
+        responses = self.revenues(X, Y)
+        return records_from_columns(responses, m), NO_GRADIENTS
+
+    def revenues(self, X, Y):
+        """
+        Simulate the sales of one or more replications over the time horizon.
+
+        Arguments
+        ---------
+        X : numpy array
+            gamma variate scaling the demands of each replication
+        Y : numpy array
+            exponential variate scaling the demand of each replication
+            in each period, m x time_horizon
+
+        Returns
+        -------
+        responses : dict
+            performance measures of interest of each replication (see `replicate`)
+        """
+        m = len(X)
         # Track inventory over time horizon.
-        remaining_inventory = self.factors["initial_inventory"]
+        remaining_inventory = np.full(m, self.factors["initial_inventory"])
         # Append "no reservations" for decision-making in final period.
-        reservations = self.factors["reservation_qtys"]
-        reservations.append(0)
-        # Simulate over the time horizon and calculate the realized revenue.
-        revenue = 0
+        reservations = self.factors["reservation_qtys"] + [0]
+        # Simulate over the time horizon and calculate the realized revenues.
+        revenue = np.zeros(m)
         for period in range(self.factors["time_horizon"]):
-            demand = self.factors["demand_means"][period]*X*Y[period]
-            sell = min(max(remaining_inventory-reservations[period], 0), demand)
+            demand = self.factors["demand_means"][period]*X*Y[:, period]
+            sell = np.minimum(np.maximum(remaining_inventory-reservations[period], 0), demand)
             remaining_inventory = remaining_inventory - sell
             revenue += sell*self.factors["prices"][period]
         revenue -= self.factors["cost"]*self.factors["initial_inventory"]
-        # Compose responses and gradients.
+        # Compose responses.
         responses = {"revenue": revenue}
-        gradients = {response_key: {factor_key: np.nan for factor_key in self.specifications} for response_key in responses}
-        return responses, gradients
+        return responses
 
 
 """
@@ -361,6 +428,23 @@ class RMITDMaxRevenue(Problem):
         objectives = (response_dict["revenue"],)
         return objectives
 
+    def response_batch_to_objectives(self, responses):
+        """
+        Convert a batch of responses to a matrix of objectives.
+
+        Arguments
+        ---------
+        responses : numpy structured array
+            responses with one row per replication and one field per response
+
+        Returns
+        -------
+        objectives : numpy array
+            matrix of objectives, one row per replication
+        """
+        objectives = np.column_stack((responses["revenue"],))
+        return objectives
+
     def check_deterministic_constraints(self, x):
         """
         Check if a solution `x` satisfies the problem's deterministic constraints.
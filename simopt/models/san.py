@@ -7,7 +7,9 @@ A detailed description of the model/problem can be found
 """
 import numpy as np
 
-from ..base import Model, Problem
+from ..base import Model, Problem, records_from_columns, NO_GRADIENTS
+from ..lockstep import lockstep_ops
+from ..rng_streams import expovariate_block, expovariate_by_subsubstream
 
 
 class SAN(Model):
@@ -30,6 +32,9 @@ class SAN(Model):
         details of each factor (for GUI and data validation)
     check_factor_list : dict
         switch case for checking factor simulatability
+    graph_cache : tuple
+        number of nodes and arcs for which the network structure was last
+        computed, and that structure (see `graph_structure`)
 
     Arguments
     ---------
@@ -43,6 +48,7 @@ class SAN(Model):
     def __init__(self, fixed_factors=None):
         if fixed_factors is None:
             fixed_factors = {}
+        self.graph_cache = (None, None)
         self.name = "SAN"
         self.n_rngs = 1
         self.n_responses = 1
@@ -102,37 +108,46 @@ class SAN(Model):
             positive = positive & (x > 0)
         return (len(self.factors["arc_means"]) == len(self.factors["arcs"])) & positive
 
-    def replicate(self, rng_list):
+    def response_dtype(self):
         """
-        Simulate a single replication for the current model factors.
-
-        Arguments
-        ---------
-        rng_list : list of mrg32k3a.mrg32k3a.MRG32k3a
-            rngs for model to use when simulating a replication
+        Return the numpy structured dtype of the responses of a single replication.
 
         Returns
         -------
-        responses : dict
-            performance measures of interest
-            "longest_path_length" = length/duration of longest path
-        gradients : dict of dicts
-            gradient estimates for each response
+        numpy dtype
+            one field per response
         """
-        # Designate separate random number generators.
-        exp_rng = rng_list[0]
+        return np.dtype([("longest_path_length", float)])
+
+    def graph_structure(self):
+        """
+        Return the structure of the network, computed once for each
+        number of nodes and list of arcs.
 
+        Returns
+        -------
+        structure : dict
+            "topo_order" = nodes in topological order
+            "arc_index" = index of each arc in the list of arcs
+            "in_ptr" = in-arcs of the node in position i of "topo_order"
+            are "in_arcs"[in_ptr[i]:in_ptr[i + 1]]
+            "in_arcs" = indices of in-arcs, in topological order of their tails
+            "in_tails" = tails of "in_arcs", as 0-based node indices
+        """
+        key = (self.factors["num_nodes"], tuple(tuple(arc) for arc in self.factors["arcs"]))
+        if self.graph_cache[0] == key:
+            return self.graph_cache[1]
+        num_nodes, arcs = key
         # Topological sort.
-        graph_in = {node: set() for node in range(1, self.factors["num_nodes"] + 1)}
-        graph_out = {node: set() for node in range(1, self.factors["num_nodes"] + 1)}
-        for a in self.factors["arcs"]:
+        graph_in = {node: set() for node in range(1, num_nodes + 1)}
+        graph_out = {node: set() for node in range(1, num_nodes + 1)}
+        for a in arcs:
             graph_in[a[1]].add(a[0])
             graph_out[a[0]].add(a[1])
-        indegrees = [len(graph_in[n]) for n in range(1, self.factors["num_nodes"] + 1)]
-        # outdegrees = [len(graph_out[n]) for n in range(1, self.factors["num_nodes"]+1)]
+        indegrees = [len(graph_in[n]) for n in range(1, num_nodes + 1)]
         queue = []
         topo_order = []
-        for n in range(self.factors["num_nodes"]):
+        for n in range(num_nodes):
             if indegrees[n] == 0:
                 queue.append(n + 1)
         while len(queue) != 0:
@@ -142,41 +157,152 @@ class SAN(Model):
                 indegrees[n - 1] -= 1
                 if indegrees[n - 1] == 0:
                     queue.append(n)
+        arc_index = {arc: idx for idx, arc in enumerate(arcs)}
+        # List the in-arcs of each node in the order their tails are sorted,
+        # which is the order in which the arcs are relaxed.
+        position = {node: i for i, node in enumerate(topo_order)}
+        in_ptr = [0]
+        in_arcs = []
+        for node in topo_order:
+            tails = sorted(graph_in[node], key=position.get)
+            in_arcs.extend(arc_index[(tail, node)] for tail in tails)
+            in_ptr.append(len(in_arcs))
+        structure = {
+            "topo_order": topo_order,
+            "arc_index": arc_index,
+            "in_ptr": np.array(in_ptr),
+            "in_arcs": np.array(in_arcs, dtype=int),
+            "in_tails": np.array([arcs[idx][0] - 1 for idx in in_arcs], dtype=int)
+        }
+        self.graph_cache = (key, structure)
+        return structure
 
-        # Generate arc lengths.
-        arc_length = {}
-        for i in range(len(self.factors["arcs"])):
-            arc_length[str(self.factors["arcs"][i])] = exp_rng.expovariate(1 / self.factors["arc_means"][i])
-
-        # Calculate the length of the longest path.
-        T = np.zeros(self.factors["num_nodes"])
-        prev = np.zeros(self.factors["num_nodes"])
-        for i in range(1, self.factors["num_nodes"]):
-            vi = topo_order[i - 1]
-            for j in graph_out[vi]:
-                if T[j - 1] < T[vi - 1] + arc_length[str((vi, j))]:
-                    T[j - 1] = T[vi - 1] + arc_length[str((vi, j))]
-                    prev[j - 1] = vi
-        longest_path = T[self.factors["num_nodes"] - 1]
+    def longest_paths(self, arc_lengths, need_gradients=True):
+        """
+        Compute the longest paths and their IPA gradients for a batch of
+        replications.
+
+        Arguments
+        ---------
+        arc_lengths : numpy array
+            lengths of the arcs; # replications x # arcs
+        need_gradients : bool, default=True
+            True if IPA gradient estimates are needed, otherwise False
 
+        Returns
+        -------
+        longest_path : numpy array
+            length of the longest path to the last node of each replication
+        gradient : numpy array
+            IPA gradient of the longest path length w.r.t. arc means;
+            # replications x # arcs; None if `need_gradients` is False
+        """
+        structure = self.graph_structure()
+        topo_order = structure["topo_order"]
+        in_ptr = structure["in_ptr"].tolist()
+        in_arcs = structure["in_arcs"].tolist()
+        in_tails = structure["in_tails"].tolist()
+        m = arc_lengths.shape[0]
+        ops = lockstep_ops(m)
+        lengths = ops.by_step(arc_lengths)
+        # Calculate the length of the longest path to each node and the last
+        # arc of that path, visiting the nodes in topological order.
+        # Ties go to the first arc into a node.
+        T = ops.new_records(self.factors["num_nodes"], m)
+        prev_arc = ops.new_records(self.factors["num_nodes"], m, dtype=int)
+        for i, node in enumerate(topo_order):
+            for k in range(in_ptr[i], in_ptr[i + 1]):
+                arc = in_arcs[k]
+                path_length = T[in_tails[k]] + lengths[arc]
+                if k == in_ptr[i]:
+                    T[node - 1] = path_length
+                    prev_arc[node - 1] = ops.full(m, arc)
+                else:
+                    longer = path_length > T[node - 1]
+                    T[node - 1] = ops.where(longer, path_length, T[node - 1])
+                    prev_arc[node - 1] = ops.where(longer, arc, prev_arc[node - 1])
+        longest_path = np.atleast_1d(T[self.factors["num_nodes"] - 1])
+        if not need_gradients:
+            return longest_path, None
         # Calculate the IPA gradient w.r.t. arc means.
         # If an arc is on the longest path, the component of the gradient
         # is the length of the length of that arc divided by its mean.
         # If an arc is not on the longest path, the component of the gradient is zero.
-        gradient = np.zeros(len(self.factors["arcs"]))
-        current = topo_order[-1]
-        backtrack = int(prev[self.factors["num_nodes"] - 1])
-        while current != topo_order[0]:
-            idx = self.factors["arcs"].index((backtrack, current))
-            gradient[idx] = arc_length[str((backtrack, current))] / (self.factors["arc_means"][idx])
-            current = backtrack
-            backtrack = int(prev[backtrack - 1])
+        # The arcs on the longest path are found by following the last arcs
+        # back from the last node, visiting the nodes in reverse topological order.
+        arc_means = self.factors["arc_means"]
+        on_path = ops.new_records(self.factors["num_nodes"], m, dtype=bool)
+        on_path[topo_order[-1] - 1] = ops.full(m, True)
+        gradient = ops.new_records(len(self.factors["arcs"]), m)
+        for i in reversed(range(len(topo_order))):
+            node = topo_order[i]
+            for k in range(in_ptr[i], in_ptr[i + 1]):
+                arc = in_arcs[k]
+                on_arc = on_path[node - 1] & (prev_arc[node - 1] == arc)
+                gradient[arc] = ops.where(on_arc, lengths[arc] / arc_means[arc], 0.0)
+                on_path[in_tails[k]] = on_path[in_tails[k]] | on_arc
+        return longest_path, ops.by_replication(gradient)
+
+    def replicate(self, rng_list):
+        """
+        Simulate a single replication for the current model factors.
+
+        Arguments
+        ---------
+        rng_list : list of mrg32k3a.mrg32k3a.MRG32k3a
+            rngs for model to use when simulating a replication
 
+        Returns
+        -------
+        responses : dict
+            performance measures of interest
+            "longest_path_length" = length/duration of longest path
+        gradients : dict of dicts
+            gradient estimates for each response
+        """
+        # Designate separate random number generators.
+        exp_rng = rng_list[0]
+        # Generate arc lengths.
+        arc_lengths = expovariate_block(exp_rng, 1 / np.array(self.factors["arc_means"]), len(self.factors["arcs"]))
+        longest_path, gradient = self.longest_paths(arc_lengths[np.newaxis])
         # Compose responses and gradients.
+        responses = {"longest_path_length": longest_path[0]}
+        gradients = {response_key: {factor_key: np.nan for factor_key in self.specifications} for response_key in responses}
+        gradients["longest_path_length"]["arc_means"] = gradient[0]
+        return responses, gradients
+
+    def replicate_batch(self, rng_list, m, need_gradients=True):
+        """
+        Simulate `m` replications for the current model factors.
+
+        Arguments
+        ---------
+        rng_list : list of mrg32k3a.mrg32k3a.MRG32k3a
+            rngs for model to use when simulating the replications
+        m : int
+            number of replications to simulate
+        need_gradients : bool, default=True
+            True if gradient estimates are needed, otherwise False
+
+        Returns
+        -------
+        responses : numpy structured array
+            performance measures of interest, one row per replication
+            (see `replicate`)
+        gradients : numpy structured array
+            gradient estimates for each response, one row per replication;
+            ``base.NO_GRADIENTS`` if `need_gradients` is False
+        """
+        exp_rng = rng_list[0]
+        # Draw the arc lengths of each replication from its own subsubstream.
+        arc_lengths = expovariate_by_subsubstream(exp_rng, 1 / np.array(self.factors["arc_means"]), m, len(self.factors["arcs"]))
+        longest_path, gradient = self.longest_paths(arc_lengths, need_gradients)
         responses = {"longest_path_length": longest_path}
+        if not need_gradients:
+            return records_from_columns(responses, m), NO_GRADIENTS
         gradients = {response_key: {factor_key: np.nan for factor_key in self.specifications} for response_key in responses}
         gradients["longest_path_length"]["arc_means"] = gradient
-        return responses, gradients
+        return records_from_columns(responses, m), records_from_columns(gradients, m)
 
 
 """
@@ -358,6 +484,42 @@ class SANLongestPath(Problem):
         objectives = (response_dict["longest_path_length"],)
         return objectives
 
+    def response_batch_to_objectives(self, responses):
+        """
+        Convert a batch of responses to a matrix of objectives.
+
+        Arguments
+        ---------
+        responses : numpy structured array
+            responses with one row per replication and one field per response
+
+        Returns
+        -------
+        objectives : numpy array
+            matrix of objectives, one row per replication
+        """
+        objectives = np.column_stack((responses["longest_path_length"],))
+        return objectives
+
+    def gradient_batch_to_objectives_gradients(self, gradients):
+        """
+        Convert a batch of gradients w.r.t. model factors to gradients
+        of objectives w.r.t. decision variables.
+
+        Arguments
+        ---------
+        gradients : numpy structured array
+            gradients with one row per replication, one field per response
+            and one subfield per factor
+
+        Returns
+        -------
+        objectives_gradients : numpy array
+            gradients of objectives, one row per replication
+        """
+        objectives_gradients = gradients["longest_path_length"]["arc_means"].reshape(len(gradients), 1, self.dim)
+        return objectives_gradients
+
     def response_dict_to_stoch_constraints(self, response_dict):
         """
         Convert a dictionary with response keys to a vector
@@ -9,7 +9,9 @@ A detailed description of the model/problem can be found
 import numpy as np
 from math import exp, log, sqrt
 
-from ..base import Model, Problem
+from ..base import Model, Problem, NO_GRADIENTS, records_from_columns
+from ..lockstep import lockstep_ops
+from ..rng_streams import copy_rng, expovariate_block, expovariate_by_subsubstream, poissonvariates
 
 
 class SSCont(Model):
@@ -173,6 +175,24 @@ class SSCont(Model):
     def check_simulatable_factors(self):
         return self.factors["s"] < self.factors["S"]
 
+    def response_dtype(self):
+        """
+        Return the numpy structured dtype of the responses of a single replication.
+
+        Returns
+        -------
+        numpy dtype
+            one field per response
+        """
+        return np.dtype([("avg_backorder_costs", float),
+                         ("avg_order_costs", float),
+                         ("avg_holding_costs", float),
+                         ("on_time_rate", float),
+                         ("order_rate", float),
+                         ("stockout_rate", float),
+                         ("avg_stockout", float),
+                         ("avg_order", float)])
+
     def replicate(self, rng_list):
         """
         Simulate a single replication for the current model factors.
@@ -208,66 +228,171 @@ class SSCont(Model):
         demand_rng = rng_list[0]
         lead_rng = rng_list[1]
         # Generate exponential random demands.
-        demands = [demand_rng.expovariate(1/self.factors["demand_mean"]) for _ in range(self.factors["n_days"] + self.factors["warmup"])]
-        # Initialize starting and ending inventories for each period.
-        start_inv = np.zeros(self.factors["n_days"] + self.factors["warmup"])
-        start_inv[0] = self.factors["s"]  # Start with s units at period 0.
-        end_inv = np.zeros(self.factors["n_days"] + self.factors["warmup"])
-        # Initialize other quantities to track:
-        #   - Amount of product to be received in each period.
-        #   - Inventory position each period.
-        #   - Amount of product ordered in each period.
-        #   - Amount of product outstanding in each period.
-        orders_received = np.zeros(self.factors["n_days"] + self.factors["warmup"])
-        inv_pos = np.zeros(self.factors["n_days"] + self.factors["warmup"])
-        orders_placed = np.zeros(self.factors["n_days"] + self.factors["warmup"])
-        orders_outstanding = np.zeros(self.factors["n_days"] + self.factors["warmup"])
+        demands = expovariate_block(demand_rng, 1/self.factors["demand_mean"], self.factors["n_days"] + self.factors["warmup"])
         # Run simulation over time horizon.
-        for day in range(self.factors["n_days"] + self.factors["warmup"]):
+        start_inv, end_inv, orders_placed = self.simulate_days(demands[np.newaxis], [poissonvariates(lead_rng, self.factors["lead_mean"])])
+        # Calculate responses from simulation data.
+        statistics = self.inventory_statistics(demands[np.newaxis], start_inv, end_inv, orders_placed)
+        responses = {response_key: statistics[response_key][0] for response_key in statistics}
+        return responses, NO_GRADIENTS
+
+    def replicate_batch(self, rng_list, m, need_gradients=True):
+        """
+        Simulate `m` replications for the current model factors, advancing
+        the replications in lockstep one period at a time.
+
+        Arguments
+        ---------
+        rng_list : list of mrg32k3a.mrg32k3a.MRG32k3a objects
+            rngs for model to use when simulating the replications
+        m : int
+            number of replications to simulate
+        need_gradients : bool, default=True
+            True if IPA gradient estimates are needed, otherwise False
+
+        Returns
+        -------
+        responses : numpy structured array
+            performance measures of interest, one row per replication
+            (see `replicate`)
+        gradients : ``base.NO_GRADIENTS``
+            gradient estimates are not available
+        """
+        demand_rng = rng_list[0]
+        lead_rng = rng_list[1]
+        # Draw the demands of each replication from its own subsubstream.
+        demands = expovariate_by_subsubstream(demand_rng, 1/self.factors["demand_mean"], m, self.factors["n_days"] + self.factors["warmup"])
+        # Lead times are drawn only when orders are placed, so give each
+        # replication a copy of the lead-time rng at its own subsubstream.
+        lead_times = []
+        for rep in range(m):
+            lead_times.append(poissonvariates(copy_rng(lead_rng), self.factors["lead_mean"]))
+            lead_rng.advance_subsubstream()
+        start_inv, end_inv, orders_placed = self.simulate_days(demands, lead_times)
+        statistics = self.inventory_statistics(demands, start_inv, end_inv, orders_placed)
+        return records_from_columns(statistics, m), NO_GRADIENTS
+
+    def simulate_days(self, demands, lead_times):
+        """
+        Simulate the inventory of one or more replications over the time horizon.
+
+        Notes
+        -----
+        Outstanding orders are tracked with a difference array of the orders
+        due in each period: the amount outstanding changes only when an order
+        is placed or received, so each period takes constant time regardless
+        of the lead times.
+
+        Arguments
+        ---------
+        demands : numpy array
+            demands of each replication, m x (n_days + warmup)
+        lead_times : list of iterators
+            lead times of the orders placed by each replication, e.g.,
+            from ``rng_streams.poissonvariates``
+
+        Returns
+        -------
+        start_inv : numpy array
+            starting inventory of each replication in each period
+        end_inv : numpy array
+            ending inventory of each replication in each period
+        orders_placed : numpy array
+            amount of product ordered by each replication in each period
+        """
+        s = self.factors["s"]
+        S = self.factors["S"]
+        m, horizon = demands.shape
+        ops = lockstep_ops(m)
+        # Amount and number of orders received in each period.
+        orders_received = ops.new_records(horizon + 1, m)
+        n_received = ops.new_records(horizon + 1, m, int)
+        start_inv = ops.new_records(horizon, m)
+        end_inv = ops.new_records(horizon, m)
+        orders_placed = ops.new_records(horizon, m)
+        inv = ops.full(m, float(s))  # Start with s units at period 0.
+        outstanding = ops.full(m, 0.0)
+        n_outstanding = ops.full(m, 0)
+        for day, demand in enumerate(ops.by_step(demands)):
+            start_inv[day] = inv
             # Calculate end-of-period inventory on hand and inventory position.
-            end_inv[day] = start_inv[day] - demands[day]
-            inv_pos[day] = end_inv[day] + orders_outstanding[day]
-            # Place orders, keeping track of outstanding orders and when they will be received.
-            orders_placed[day] = np.max(((inv_pos[day] < self.factors["s"]) * (self.factors["S"] - inv_pos[day])), 0)
-            if orders_placed[day] > 0:
-                lead = lead_rng.poissonvariate(self.factors["lead_mean"])
-                for future_day in range(day + 1, day + lead + 1):
-                    if future_day < self.factors["n_days"] + self.factors["warmup"]:
-                        orders_outstanding[future_day] = orders_outstanding[future_day] + orders_placed[day]
-                if day + lead + 1 < self.factors["n_days"] + self.factors["warmup"]:
-                    orders_received[day + lead + 1] = orders_received[day + lead + 1] + orders_placed[day]
+            inv = inv - demand
+            end_inv[day] = inv
+            inv_pos = inv + outstanding
+            # Place orders, keeping track of when they will be received.
+            ordering = (inv_pos < s) & (S - inv_pos > 0)
+            if ops.any(ordering):
+                order = ops.where(ordering, S - inv_pos, 0.0)
+                orders_placed[day] = order
+                for rep in ops.indices(ordering):
+                    due_day = min(day + next(lead_times[rep]) + 1, horizon)
+                    ops.add_at(orders_received, due_day, rep, ops.item(order, rep))
+                    ops.add_at(n_received, due_day, rep, 1)
+                outstanding = outstanding + order
+                n_outstanding = n_outstanding + ordering
+            # Orders received next period are no longer outstanding.
+            outstanding = outstanding - orders_received[day + 1]
+            n_outstanding = n_outstanding - n_received[day + 1]
+            outstanding = ops.where(n_outstanding == 0, 0.0, outstanding)
             # Calculate starting inventory for next period.
-            if day < self.factors["n_days"] + self.factors["warmup"] - 1:
-                start_inv[day + 1] = end_inv[day] + orders_received[day + 1]
-        # Calculate responses from simulation data.
-        order_rate = np.mean(orders_placed[self.factors["warmup"]:] > 0)
-        stockout_rate = np.mean(end_inv[self.factors["warmup"]:] < 0)
-        avg_order_costs = np.mean(self.factors["fixed_cost"] * (orders_placed[self.factors["warmup"]:] > 0) +
-                                  self.factors["variable_cost"] * orders_placed[self.factors["warmup"]:])
-        avg_holding_costs = np.mean(self.factors["holding_cost"] * end_inv[self.factors["warmup"]:] * [end_inv[self.factors["warmup"]:] > 0])
-        on_time_rate = 1 - np.sum(np.min(np.vstack((demands[self.factors["warmup"]:], demands[self.factors["warmup"]:] - start_inv[self.factors["warmup"]:])), axis=0)
-                                  * ((demands[self.factors["warmup"]:] - start_inv[self.factors["warmup"]:]) > 0))/np.sum(demands[self.factors["warmup"]:])
-        avg_backorder_costs = self.factors["backorder_cost"]*(1 - on_time_rate)*np.sum(demands[self.factors["warmup"]:])/float(self.factors["n_days"])
-        if np.array(np.where(end_inv[self.factors["warmup"]:] < 0)).size == 0:
-            avg_stockout = 0
-        else:
-            avg_stockout = -np.mean(end_inv[self.factors["warmup"]:][np.where(end_inv[self.factors["warmup"]:] < 0)])
-        if np.array(np.where(orders_placed[self.factors["warmup"]:] > 0)).size == 0:
-            avg_order = 0
-        else:
-            avg_order = np.mean(orders_placed[self.factors["warmup"]:][np.where(orders_placed[self.factors["warmup"]:] > 0)])
-        # Compose responses and gradients.
-        responses = {"avg_backorder_costs": avg_backorder_costs,
-                     "avg_order_costs": avg_order_costs,
-                     "avg_holding_costs": avg_holding_costs,
-                     "on_time_rate": on_time_rate,
-                     "order_rate": order_rate,
-                     "stockout_rate": stockout_rate,
-                     "avg_stockout": avg_stockout,
-                     "avg_order": avg_order
-                     }
-        gradients = {response_key: {factor_key: np.nan for factor_key in self.specifications} for response_key in responses}
-        return responses, gradients
+            inv = inv + orders_received[day + 1]
+        return ops.by_replication(start_inv), ops.by_replication(end_inv), ops.by_replication(orders_placed)
+
+    def inventory_statistics(self, demands, start_inv, end_inv, orders_placed):
+        """
+        Calculate the responses of one or more replications from their
+        simulated inventories.
+
+        Arguments
+        ---------
+        demands : numpy array
+            demands of each replication, m x (n_days + warmup)
+        start_inv : numpy array
+            starting inventory of each replication in each period
+        end_inv : numpy array
+            ending inventory of each replication in each period
+        orders_placed : numpy array
+            amount of product ordered by each replication in each period
+
+        Returns
+        -------
+        statistics : dict
+            performance measures of interest, one entry per replication
+            (see `replicate`)
+        """
+        # Only collect statistics after the warmup periods.
+        demands = demands[:, self.factors["warmup"]:]
+        start_inv = start_inv[:, self.factors["warmup"]:]
+        end_inv = end_inv[:, self.factors["warmup"]:]
+        orders_placed = orders_placed[:, self.factors["warmup"]:]
+        order_rate = np.mean(orders_placed > 0, axis=1)
+        stockout_rate = np.mean(end_inv < 0, axis=1)
+        avg_order_costs = np.mean(self.factors["fixed_cost"] * (orders_placed > 0) + self.factors["variable_cost"] * orders_placed, axis=1)
+        avg_holding_costs = np.mean(self.factors["holding_cost"] * end_inv * (end_inv > 0), axis=1)
+        total_demand = np.sum(demands, axis=1)
+        shortfall = demands - start_inv
+        on_time_rate = 1 - np.sum(np.minimum(demands, shortfall) * (shortfall > 0), axis=1)/total_demand
+        avg_backorder_costs = self.factors["backorder_cost"]*(1 - on_time_rate)*total_demand/float(self.factors["n_days"])
+        # Average the stockouts and orders of each replication over the periods they occured.
+        avg_stockout = np.zeros(len(demands))
+        avg_order = np.zeros(len(demands))
+        for rep in range(len(demands)):
+            stockouts = end_inv[rep][end_inv[rep] < 0]
+            if stockouts.size > 0:
+                avg_stockout[rep] = -np.mean(stockouts)
+            orders = orders_placed[rep][orders_placed[rep] > 0]
+            if orders.size > 0:
+                avg_order[rep] = np.mean(orders)
+        statistics = {"avg_backorder_costs": avg_backorder_costs,
+                      "avg_order_costs": avg_order_costs,
+                      "avg_holding_costs": avg_holding_costs,
+                      "on_time_rate": on_time_rate,
+                      "order_rate": order_rate,
+                      "stockout_rate": stockout_rate,
+                      "avg_stockout": avg_stockout,
+                      "avg_order": avg_order
+                      }
+        return statistics
 
 
 """
@@ -7,7 +7,8 @@ A detailed description of the model/problem can be found
 """
 import numpy as np
 
-from ..base import Model, Problem
+from ..base import Model, Problem, NO_GRADIENTS
+from ..rng_streams import uniform_block
 
 
 class TableAllocation(Model):
@@ -145,6 +146,18 @@ class TableAllocation(Model):
         else:
             return True
 
+    def response_dtype(self):
+        """
+        Return the numpy structured dtype of the responses of a single replication.
+
+        Returns
+        -------
+        numpy dtype
+            one field per response
+        """
+        return np.dtype([("total_revenue", float),
+                         ("service_rate", float)])
+
     def replicate(self, rng_list):
         """
         Simulate a single replication for the current model factors.
@@ -177,7 +190,7 @@ class TableAllocation(Model):
         # Generate total number of arrivals in the period
         n_arrivals = arrival_rng.poissonvariate(round(self.factors["n_hours"] * sum(self.factors["lambda"])))
         # Generate arrival times in minutes
-        arrival_times = 60 * np.sort([arrival_rng.uniform(0, self.factors["n_hours"]) for _ in range(n_arrivals)])
+        arrival_times = 60 * np.sort(uniform_block(arrival_rng, 0, self.factors["n_hours"], n_arrivals))
         # Track seating rate
         found = np.zeros(n_arrivals)
         # Pass through all arrivals of groups to the restaurants.
@@ -208,8 +221,7 @@ class TableAllocation(Model):
         responses = {"total_revenue": total_rev,
                      "service_rate": sum(found) / len(found)
                      }
-        gradients = {response_key: {factor_key: np.nan for factor_key in self.specifications} for response_key in responses}
-        return responses, gradients
+        return responses, NO_GRADIENTS
 
 
 """
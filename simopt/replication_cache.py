@@ -0,0 +1,242 @@
+#!/usr/bin/env python
+"""
+Summary
+-------
+Provide an opt-in cache of simulated replications for ``base.Problem.simulate``.
+
+A replication is identified by the problem (its factors and non-decision
+model factors), the solution `x`, and the stream-substream-subsubstream
+indices of the random-number generators used to simulate it. Since each
+replication is simulated with its own subsubstreams, re-simulating an
+identified replication would reproduce the cached outputs exactly.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+
+
+class ReplicationCache(object):
+    """Least-recently-used cache of simulated replications, with an
+    optional on-disk tier.
+
+    Attributes
+    ----------
+    max_size : int
+        Maximum number of replications held in memory.
+    path : str
+        Directory of the on-disk tier; None if replications are only held in memory.
+    entries : collections.OrderedDict
+        Replications held in memory, from least to most recently used.
+    n_hits : int
+        Number of replications found in the cache.
+    n_misses : int
+        Number of replications looked up but not found in the cache.
+
+    Parameters
+    ----------
+    max_size : int, default=100000
+        Maximum number of replications held in memory.
+    path : str, optional
+        Directory of the on-disk tier; created if it does not exist.
+        The directory can be shared by several processes and runs.
+    """
+    def __init__(self, max_size=100000, path=None):
+        self.max_size = max_size
+        self.path = path
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+        self.entries = OrderedDict()
+        self.n_hits = 0
+        self.n_misses = 0
+
+    def __getstate__(self):
+        """Drop the in-memory replications when pickling, e.g., when a
+        problem is sent to worker processes; the on-disk tier is shared instead.
+
+        Returns
+        -------
+        state : dict
+            State of the cache, without in-memory replications.
+        """
+        state = self.__dict__.copy()
+        state["entries"] = OrderedDict()
+        return state
+
+    def get(self, key):
+        """Look up a replication.
+
+        Parameters
+        ----------
+        key : tuple
+            Key of the replication.
+
+        Returns
+        -------
+        value : tuple
+            Cached outputs of the replication; None if not found.
+        """
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.n_hits += 1
+            return self.entries[key]
+        if self.path is not None:
+            try:
+                with open(self.file_name(key), "rb") as file:
+                    value = pickle.load(file)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                pass
+            else:
+                self.put(key, value, write_to_disk=False)
+                self.n_hits += 1
+                return value
+        self.n_misses += 1
+        return None
+
+    def put(self, key, value, write_to_disk=True):
+        """Add a replication, evicting the least recently used one from
+        memory if the cache is full.
+
+        Parameters
+        ----------
+        key : tuple
+            Key of the replication.
+        value : tuple
+            Outputs of the replication.
+        write_to_disk : bool, default=True
+            True if the replication should also be written to the on-disk tier.
+        """
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+        if write_to_disk and self.path is not None:
+            # Write to a temporary file first so concurrent readers never see a partial file.
+            with tempfile.NamedTemporaryFile(dir=self.path, delete=False) as file:
+                pickle.dump(value, file)
+            os.replace(file.name, self.file_name(key))
+
+    def file_name(self, key):
+        """Return the name of the file holding a replication in the on-disk tier.
+
+        Parameters
+        ----------
+        key : tuple
+            Key of the replication.
+
+        Returns
+        -------
+        str
+            Path of the file.
+        """
+        return os.path.join(self.path, hashlib.sha256(repr(key).encode()).hexdigest() + ".pickle")
+
+    def clear(self):
+        """Remove all replications held in memory.
+        """
+        self.entries.clear()
+
+    def replication_keys(self, problem, solution, m):
+        """Return keys of the next `m` replications at a solution.
+
+        Parameters
+        ----------
+        problem : ``base.Problem``
+            Problem being simulated.
+        solution : ``base.Solution``
+            Solution being simulated.
+        m : int
+            Number of replications.
+
+        Returns
+        -------
+        list [tuple]
+            Keys of the replications; None if the replications cannot be
+            identified, e.g., if a random-number generator is not at the
+            start of a subsubstream.
+        """
+        for rng in solution.rng_list:
+            if tuple(rng.get_current_state()) != tuple(rng.subsubstream_start):
+                return None
+        try:
+            problem_key = problem_identity(problem)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return None
+        x = tuple(float(x_i) for x_i in solution.x)
+        rng_keys = [(tuple(int(seed) for seed in rng.ref_seed), int(rng.s_ss_sss_index[0]), int(rng.s_ss_sss_index[1]), int(rng.s_ss_sss_index[2])) for rng in solution.rng_list]
+        return [(problem_key, x, tuple(rng_key[:3] + (rng_key[3] + rep,) for rng_key in rng_keys)) for rep in range(m)]
+
+    def load(self, solution, keys):
+        """Copy cached replications into the raw data of a solution, stopping
+        at the first replication not found in the cache.
+
+        Parameters
+        ----------
+        solution : ``base.Solution``
+            Solution being simulated; its storage must hold ``len(keys)`` more replications.
+        keys : list [tuple]
+            Keys of the next replications at the solution.
+
+        Returns
+        -------
+        n_loaded : int
+            Number of replications copied.
+        """
+        n_loaded = 0
+        for key in keys:
+            value = self.get(key)
+            if value is None:
+                break
+            row = solution.n_reps + n_loaded
+            objectives, objectives_gradients, stoch_constraints = value
+            solution.objectives[row] = objectives
+            if objectives_gradients is not None and solution.objectives_gradients is not None:
+                solution.objectives_gradients[row] = objectives_gradients
+            if stoch_constraints is not None:
+                solution.stoch_constraints[row] = stoch_constraints
+            n_loaded += 1
+        return n_loaded
+
+    def store(self, solution, keys, start):
+        """Add replications from the raw data of a solution.
+
+        Parameters
+        ----------
+        solution : ``base.Solution``
+            Simulated solution.
+        keys : list [tuple]
+            Keys of the replications.
+        start : int
+            Row of the raw data holding the first replication.
+        """
+        for row, key in enumerate(keys, start=start):
+            objectives_gradients = None if solution.objectives_gradients is None else solution.objectives_gradients[row].copy()
+            stoch_constraints = None if solution.stoch_constraints is None else solution.stoch_constraints[row].copy()
+            self.put(key, (solution.objectives[row].copy(), objectives_gradients, stoch_constraints))
+
+
+def problem_identity(problem):
+    """Summarize the factors that determine a problem's replications.
+
+    Notes
+    -----
+    Uses the same factors as ``base.Problem.__eq__``, so problems that compare
+    equal share cached replications.
+
+    Parameters
+    ----------
+    problem : ``base.Problem``
+        Problem to summarize.
+
+    Returns
+    -------
+    str
+        Digest of the problem's class, factors, and non-decision model factors.
+    """
+    non_decision_factors = sorted(set(problem.model.factors.keys()) - problem.model_decision_factors)
+    identity = (type(problem).__name__,
+                sorted(problem.factors.items()),
+                [(factor, problem.model.factors[factor]) for factor in non_decision_factors])
+    return hashlib.sha256(pickle.dumps(identity)).hexdigest()
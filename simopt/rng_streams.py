@@ -0,0 +1,864 @@
+#!/usr/bin/env python
+"""
+Summary
+-------
+Provide vectorized block generation from ``mrg32k3a.mrg32k3a.MRG32k3a`` streams,
+along with cheap copying of generators and jumping ahead by several
+substreams or subsubstreams at once.
+
+Each block function returns a numpy array of `n` variates and leaves the
+generator in exactly the state that `n` scalar draws (e.g., `n` calls to
+``rng.expovariate``) would have left it in, so common random numbers and
+reproducibility are preserved. Up to floating-point rounding in the
+transforms, the variates are the same as those of the scalar draws.
+"""
+
+import itertools
+import math
+from functools import lru_cache
+
+import numpy as np
+from mrg32k3a.mrg32k3a import bsm
+
+# Parameters of the mrg32k3a recurrence.
+# P. L'Ecuyer, ``Good Parameter Sets for Combined Multiple Recursive Random Number Generators'',
+# Operations Research, 47, 1 (1999), 159--164.
+MRGM1 = 4294967087
+MRGM2 = 4294944443
+MRGA12 = 1403580
+MRGA13N = 810728
+MRGA21 = 527612
+MRGA23N = 1370589
+
+# One-step transition matrices of the two components of the recurrence.
+A1 = ((0, 1, 0), (0, 0, 1), (MRGM1 - MRGA13N, MRGA12, 0))
+A2 = ((0, 1, 0), (0, 0, 1), (MRGM2 - MRGA23N, 0, MRGA21))
+
+# Number of draws in a subsubstream and a substream, respectively.
+SUBSUBSTREAM_LENGTH = 2**47
+SUBSTREAM_LENGTH = 2**94
+
+# Below this block size, a plain loop is faster than advancing parallel lanes.
+MIN_LANES_BLOCK = 512
+
+# Coefficients of the Beasley-Springer-Moro approximation of the
+# inverse cdf of the standard normal distribution.
+BSMA = (2.50662823884, -18.61500062529, 41.39119773534, -25.44106049637)
+BSMB = (-8.47351093090, 23.08336743743, -21.06224101826, 3.13082909833)
+BSMC = (0.3374754822726147, 0.9761690190917186, 0.1607979714918209,
+        0.0276438810333863, 0.0038405729373609, 0.0003951896511919,
+        0.0000321767881768, 0.0000002888167364, 0.0000003960315187)
+
+
+def mat_mult_mod(a, b, m):
+    """Multiply two 3 x 3 matrices modulo `m` using exact integer arithmetic.
+
+    Parameters
+    ----------
+    a : tuple [tuple [int]]
+        Left 3 x 3 matrix.
+    b : tuple [tuple [int]]
+        Right 3 x 3 matrix.
+    m : int
+        Modulus.
+
+    Returns
+    -------
+    tuple [tuple [int]]
+        Product of `a` and `b` modulo `m`.
+    """
+    return tuple(tuple(sum(a[i][k] * b[k][j] for k in range(3)) % m for j in range(3)) for i in range(3))
+
+
+def mat_vec_mod(a, v, m):
+    """Multiply a 3 x 3 matrix and a vector of length 3 modulo `m`.
+
+    Parameters
+    ----------
+    a : tuple [tuple [int]]
+        3 x 3 matrix.
+    v : tuple [int]
+        Vector of length 3.
+    m : int
+        Modulus.
+
+    Returns
+    -------
+    tuple [int]
+        Product of `a` and `v` modulo `m`.
+    """
+    return tuple(sum(a[i][k] * v[k] for k in range(3)) % m for i in range(3))
+
+
+@lru_cache(maxsize=1024)
+def mat_power_mod(a, j, m):
+    """Compute a power of a 3 x 3 matrix modulo `m` by repeated squaring.
+
+    Parameters
+    ----------
+    a : tuple [tuple [int]]
+        3 x 3 matrix.
+    j : int
+        Exponent.
+    m : int
+        Modulus.
+
+    Returns
+    -------
+    tuple [tuple [int]]
+        `a` to the power `j` modulo `m`.
+    """
+    b = ((1, 0, 0), (0, 1, 0), (0, 0, 1))
+    while j > 0:
+        if j & 1:
+            b = mat_mult_mod(a, b, m)
+        a = mat_mult_mod(a, a, m)
+        j //= 2
+    return b
+
+
+def advance_state(state, steps):
+    """Advance an mrg32k3a state by a number of draws.
+
+    Parameters
+    ----------
+    state : tuple [int]
+        Current state of the generator.
+    steps : int
+        Number of draws to skip.
+
+    Returns
+    -------
+    tuple [int]
+        State after `steps` draws.
+    """
+    return (mat_vec_mod(mat_power_mod(A1, steps, MRGM1), state[:3], MRGM1)
+            + mat_vec_mod(mat_power_mod(A2, steps, MRGM2), state[3:], MRGM2))
+
+
+def copy_rng(rng):
+    """Copy a random-number generator without deep-copying its attributes.
+
+    Notes
+    -----
+    The state of an mrg32k3a generator is held in immutable tuples, so only
+    the list of stream-substream-subsubstream indices needs to be copied.
+
+    Parameters
+    ----------
+    rng : ``mrg32k3a.mrg32k3a.MRG32k3a``
+        Random-number generator to copy.
+
+    Returns
+    -------
+    new_rng : ``mrg32k3a.mrg32k3a.MRG32k3a``
+        Independent copy of `rng`, at the same position.
+    """
+    new_rng = rng.__class__.__new__(rng.__class__)
+    new_rng.__dict__.update(rng.__dict__)
+    new_rng.s_ss_sss_index = list(rng.s_ss_sss_index)
+    return new_rng
+
+
+def advance_substreams(rng, k):
+    """Advance a random-number generator to the start of the substream
+    `k` substreams after its current one.
+
+    Notes
+    -----
+    Equivalent to calling ``rng.advance_substream()`` `k` times, but uses a
+    single (cached) power of the jump matrix.
+
+    Parameters
+    ----------
+    rng : ``mrg32k3a.mrg32k3a.MRG32k3a``
+        Random-number generator to advance.
+    k : int
+        Number of substreams to advance.
+    """
+    new_state = advance_state(rng.substream_start, k * SUBSTREAM_LENGTH)
+    rng.seed(new_state)
+    rng.s_ss_sss_index[1] += k
+    rng.s_ss_sss_index[2] = 0
+    rng.substream_start = new_state
+    rng.subsubstream_start = new_state
+
+
+def start_subsubstream(rng, sss_index):
+    """Move a random-number generator to the start of a subsubstream
+    within its current substream.
+
+    Notes
+    -----
+    Equivalent to ``rng.start_fixed_s_ss_sss`` with the current stream and
+    substream indices, but jumps from the start of the current substream
+    with a single (cached) power of the jump matrix.
+
+    Parameters
+    ----------
+    rng : ``mrg32k3a.mrg32k3a.MRG32k3a``
+        Random-number generator to move.
+    sss_index : int
+        Index of the subsubstream to start at.
+    """
+    new_state = advance_state(rng.substream_start, sss_index * SUBSUBSTREAM_LENGTH)
+    rng.seed(new_state)
+    rng.s_ss_sss_index[2] = sss_index
+    rng.subsubstream_start = new_state
+
+
+def random_block(rng, n):
+    """Generate a block of standard uniform variates.
+
+    Notes
+    -----
+    Large blocks are split into about sqrt(`n`) lanes whose starting states
+    are found by jumping ahead; the lanes are then advanced together with
+    numpy integer arithmetic, which is exact because every intermediate
+    product of the recurrence is below 2**53.
+
+    Parameters
+    ----------
+    rng : ``mrg32k3a.mrg32k3a.MRG32k3a``
+        Random-number generator; advanced by `n` draws.
+    n : int
+        Number of variates to generate.
+
+    Returns
+    -------
+    numpy array
+        `n` uniform variates, equal to those of `n` calls to ``rng.random()``.
+    """
+    state = tuple(int(s) for s in rng.get_current_state())
+    if n < MIN_LANES_BLOCK:
+        s10, s11, s12, s20, s21, s22 = state
+        diffs = [0] * n
+        for i in range(n):
+            p1 = (MRGA12 * s11 - MRGA13N * s10) % MRGM1
+            p2 = (MRGA21 * s22 - MRGA23N * s20) % MRGM2
+            s10, s11, s12 = s11, s12, p1
+            s20, s21, s22 = s21, s22, p2
+            diffs[i] = p1 - p2
+        diffs = np.array(diffs, dtype=np.int64)
+        new_state = (s10, s11, s12, s20, s21, s22)
+    else:
+        lane_length = math.isqrt(n - 1) + 1
+        n_lanes = (n - 1) // lane_length + 1
+        # Find the starting state of each lane.
+        jump1 = mat_power_mod(A1, lane_length, MRGM1)
+        jump2 = mat_power_mod(A2, lane_length, MRGM2)
+        starts = [state]
+        for _ in range(n_lanes - 1):
+            starts.append(mat_vec_mod(jump1, starts[-1][:3], MRGM1) + mat_vec_mod(jump2, starts[-1][3:], MRGM2))
+        x1 = np.array([start[:3] for start in starts], dtype=np.int64).T
+        x2 = np.array([start[3:] for start in starts], dtype=np.int64).T
+        x10, x11, x12 = x1
+        x20, x21, x22 = x2
+        # The state after the last draw is reached in lane `last_lane` after `last_step` steps.
+        last_lane = (n - 1) // lane_length
+        last_step = n - last_lane * lane_length
+        diffs = np.empty((lane_length, n_lanes), dtype=np.int64)
+        for step in range(lane_length):
+            p1 = (MRGA12 * x11 - MRGA13N * x10) % MRGM1
+            p2 = (MRGA21 * x22 - MRGA23N * x20) % MRGM2
+            x10, x11, x12 = x11, x12, p1
+            x20, x21, x22 = x21, x22, p2
+            diffs[step] = p1 - p2
+            if step + 1 == last_step:
+                new_state = tuple(int(x[last_lane]) for x in (x10, x11, x12, x20, x21, x22))
+        diffs = diffs.T.reshape(-1)[:n]
+    rng.seed(new_state)
+    z = diffs % MRGM1
+    return np.where(z > 0, z / (MRGM1 + 1), MRGM1 / (MRGM1 + 1))
+
+
+def mat_vec_mod_lanes(a, x, m):
+    """Multiply a 3 x 3 matrix by many vectors modulo `m` with numpy integers.
+
+    Notes
+    -----
+    Each entry of `a` is split into 16-bit halves so that every
+    intermediate product stays below 2**63.
+
+    Parameters
+    ----------
+    a : tuple [tuple [int]]
+        3 x 3 matrix with entries in [0, `m`).
+    x : numpy array
+        3 x # vectors array of int64 entries in [0, `m`).
+    m : int
+        Modulus, below 2**32.
+
+    Returns
+    -------
+    numpy array
+        3 x # vectors array of products of `a` and the columns of `x` modulo `m`.
+    """
+    result = np.zeros_like(x)
+    for i in range(3):
+        for k in range(3):
+            a_hi, a_lo = divmod(a[i][k], 2**16)
+            term = ((a_hi * x[k]) % m * 2**16 + a_lo * x[k]) % m
+            result[i] = (result[i] + term) % m
+    return result
+
+
+def random_by_subsubstream(rng, m, n=1, return_states=False):
+    """Generate `n` standard uniform variates from each of `m` consecutive
+    subsubstreams.
+
+    Notes
+    -----
+    Equivalent to `m` repetitions of `n` calls to ``rng.random()`` followed
+    by ``rng.advance_subsubstream()``: the first row is drawn from the
+    current state and the others from the starts of the following
+    subsubstreams. These starts are found in about sqrt(`m`) lanes that
+    are advanced together, one subsubstream at a time; the `m` rows are
+    then drawn together.
+
+    Parameters
+    ----------
+    rng : ``mrg32k3a.mrg32k3a.MRG32k3a``
+        Random-number generator; left at the start of the subsubstream
+        `m` subsubstreams after its current one.
+    m : int
+        Number of subsubstreams.
+    n : int, default=1
+        Number of variates to generate from each subsubstream.
+    return_states : bool, default=False
+        True if the state of each subsubstream after its draws should
+        also be returned.
+
+    Returns
+    -------
+    numpy array
+        Uniform variates; `m` x `n`, one row per subsubstream.
+    list [tuple [int]]
+        State of each subsubstream after its draws; only returned if
+        `return_states` is True.
+    """
+    sss_index = rng.s_ss_sss_index[2]
+    starts1 = np.empty((3, m), dtype=np.int64)
+    starts2 = np.empty((3, m), dtype=np.int64)
+    state = tuple(int(s) for s in rng.get_current_state())
+    starts1[:, 0] = state[:3]
+    starts2[:, 0] = state[3:]
+    if m > 1:
+        k = m - 1
+        lane_length = math.isqrt(k - 1) + 1
+        n_lanes = (k - 1) // lane_length + 1
+        # Find the start of the first subsubstream of each lane.
+        jump1 = mat_power_mod(A1, lane_length * SUBSUBSTREAM_LENGTH, MRGM1)
+        jump2 = mat_power_mod(A2, lane_length * SUBSUBSTREAM_LENGTH, MRGM2)
+        lane_starts = [advance_state(rng.subsubstream_start, SUBSUBSTREAM_LENGTH)]
+        for _ in range(n_lanes - 1):
+            lane_starts.append(mat_vec_mod(jump1, lane_starts[-1][:3], MRGM1) + mat_vec_mod(jump2, lane_starts[-1][3:], MRGM2))
+        x1 = np.array([start[:3] for start in lane_starts], dtype=np.int64).T
+        x2 = np.array([start[3:] for start in lane_starts], dtype=np.int64).T
+        step1 = mat_power_mod(A1, SUBSUBSTREAM_LENGTH, MRGM1)
+        step2 = mat_power_mod(A2, SUBSUBSTREAM_LENGTH, MRGM2)
+        lane_states1 = np.empty((3, lane_length, n_lanes), dtype=np.int64)
+        lane_states2 = np.empty((3, lane_length, n_lanes), dtype=np.int64)
+        for step in range(lane_length):
+            lane_states1[:, step] = x1
+            lane_states2[:, step] = x2
+            if step + 1 < lane_length:
+                x1 = mat_vec_mod_lanes(step1, x1, MRGM1)
+                x2 = mat_vec_mod_lanes(step2, x2, MRGM2)
+        starts1[:, 1:] = lane_states1.transpose(0, 2, 1).reshape(3, -1)[:, :k]
+        starts2[:, 1:] = lane_states2.transpose(0, 2, 1).reshape(3, -1)[:, :k]
+    # Draw from all subsubstreams together.
+    x10, x11, x12 = starts1
+    x20, x21, x22 = starts2
+    diffs = np.empty((m, n), dtype=np.int64)
+    for step in range(n):
+        p1 = (MRGA12 * x11 - MRGA13N * x10) % MRGM1
+        p2 = (MRGA21 * x22 - MRGA23N * x20) % MRGM2
+        x10, x11, x12 = x11, x12, p1
+        x20, x21, x22 = x21, x22, p2
+        diffs[:, step] = p1 - p2
+    start_subsubstream(rng, sss_index + m)
+    z = diffs % MRGM1
+    u = np.where(z > 0, z / (MRGM1 + 1), MRGM1 / (MRGM1 + 1))
+    if return_states:
+        states = np.array([x10, x11, x12, x20, x21, x22]).T.tolist()
+        return u, [tuple(state) for state in states]
+    return u
+
+
+def bsm_block(u):
+    """Approximate quantiles of the standard normal distribution via the
+    Beasley-Springer-Moro algorithm.
+
+    Parameters
+    ----------
+    u : numpy array
+        Probability values for the desired quantiles (between 0 and 1).
+
+    Returns
+    -------
+    numpy array
+        Corresponding quantiles of the standard normal distribution.
+    """
+    y = u - 0.5
+    z = np.empty_like(y)
+    # Approximate from the center (Beasly-Springer 1977).
+    center = np.abs(y) < 0.42
+    yc = y[center]
+    r = yc ** 2
+    asum = BSMA[0] + BSMA[1] * r + BSMA[2] * r ** 2 + BSMA[3] * r ** 3
+    bsum = 1 + BSMB[0] * r + BSMB[1] * r ** 2 + BSMB[2] * r ** 3 + BSMB[3] * r ** 4
+    z[center] = yc * (asum / bsum)
+    # Approximate from the tails (Moro 1995).
+    tails = ~center
+    yt = y[tails]
+    r = np.where(yt < 0.0, u[tails], 1 - u[tails])
+    s = np.log(-np.log(r))
+    t = BSMC[0]
+    for power in range(1, 9):
+        t = t + BSMC[power] * s ** power
+    z[tails] = np.where(yt < 0.0, -t, t)
+    return z
+
+
+def uniform_block(rng, a, b, n):
+    """Generate a block of uniform variates on [`a`, `b`].
+
+    Parameters
+    ----------
+    rng : ``mrg32k3a.mrg32k3a.MRG32k3a``
+        Random-number generator; advanced by `n` draws.
+    a : float
+        Lower endpoint.
+    b : float
+        Upper endpoint.
+    n : int
+        Number of variates to generate.
+
+    Returns
+    -------
+    numpy array
+        `n` uniform variates, as from ``rng.uniform(a, b)``.
+    """
+    return a + (b - a) * random_block(rng, n)
+
+
+def expovariate_block(rng, lambd, n):
+    """Generate a block of exponential variates.
+
+    Parameters
+    ----------
+    rng : ``mrg32k3a.mrg32k3a.MRG32k3a``
+        Random-number generator; advanced by `n` draws.
+    lambd : float or numpy array
+        Rate(s) of the exponential distribution; an array gives one rate per variate.
+    n : int
+        Number of variates to generate.
+
+    Returns
+    -------
+    numpy array
+        `n` exponential variates, as from ``rng.expovariate(lambd)``.
+    """
+    return -np.log(1.0 - random_block(rng, n)) / lambd
+
+
+def expovariate_by_subsubstream(rng, lambd, m, n):
+    """Generate `n` exponential variates from each of `m` consecutive
+    subsubstreams.
+
+    Parameters
+    ----------
+    rng : ``mrg32k3a.mrg32k3a.MRG32k3a``
+        Random-number generator; left at the start of the subsubstream
+        `m` subsubstreams after its current one.
+    lambd : float or numpy array
+        Rate(s) of the exponential distribution; an array gives one rate per column.
+    m : int
+        Number of subsubstreams.
+    n : int
+        Number of variates to generate from each subsubstream.
+
+    Returns
+    -------
+    numpy array
+        Exponential variates; `m` x `n`, one row per subsubstream, as from
+        ``expovariate_block(rng, lambd, n)`` in each subsubstream.
+    """
+    return -np.log(1.0 - random_by_subsubstream(rng, m, n)) / lambd
+
+
+def normalvariate_block(rng, mu, sigma, n):
+    """Generate a block of normal variates.
+
+    Parameters
+    ----------
+    rng : ``mrg32k3a.mrg32k3a.MRG32k3a``
+        Random-number generator; advanced by `n` draws.
+    mu : float or numpy array
+        Mean(s) of the normal distribution.
+    sigma : float or numpy array
+        Standard deviation(s) of the normal distribution.
+    n : int
+        Number of variates to generate.
+
+    Returns
+    -------
+    numpy array
+        `n` normal variates, as from ``rng.normalvariate(mu, sigma)``.
+    """
+    return mu + sigma * bsm_block(random_block(rng, n))
+
+
+def lognormalvariate_block(rng, lq, uq, n):
+    """Generate a block of lognormal variates from their 2.5% and 97.5% quantiles.
+
+    Parameters
+    ----------
+    rng : ``mrg32k3a.mrg32k3a.MRG32k3a``
+        Random-number generator; advanced by `n` draws.
+    lq : float or numpy array
+        2.5% quantile(s) of the lognormal distribution.
+    uq : float or numpy array
+        97.5% quantile(s) of the lognormal distribution.
+    n : int
+        Number of variates to generate.
+
+    Returns
+    -------
+    numpy array
+        `n` lognormal variates, as from ``rng.lognormalvariate(lq, uq)``.
+    """
+    mu = (np.log(lq) + np.log(uq)) / 2
+    sigma = (np.log(uq) - mu) / 1.96
+    return np.exp(normalvariate_block(rng, mu, sigma, n))
+
+
+def gumbelvariate_block(rng, mu, beta, n):
+    """Generate a block of Gumbel variates.
+
+    Parameters
+    ----------
+    rng : ``mrg32k3a.mrg32k3a.MRG32k3a``
+        Random-number generator; advanced by `n` draws.
+    mu : float or numpy array
+        Location(s) of the mode of the Gumbel distribution.
+    beta : float or numpy array
+        Scale parameter(s) of the Gumbel distribution; > 0.
+    n : int
+        Number of variates to generate.
+
+    Returns
+    -------
+    numpy array
+        `n` Gumbel variates, as from ``rng.gumbelvariate(mu, beta)``.
+    """
+    return mu - beta * np.log(-np.log(random_block(rng, n)))
+
+
+def triangular_block(rng, low, high, mode, n):
+    """Generate a block of triangular variates.
+
+    Parameters
+    ----------
+    rng : ``mrg32k3a.mrg32k3a.MRG32k3a``
+        Random-number generator; advanced by `n` draws.
+    low : float or numpy array
+        Lower limit(s) of the triangular distribution.
+    high : float or numpy array
+        Upper limit(s) of the triangular distribution.
+    mode : float or numpy array
+        Mode(s) of the triangular distribution.
+    n : int
+        Number of variates to generate.
+
+    Returns
+    -------
+    numpy array
+        `n` triangular variates, as from ``rng.triangular(low, high, mode)``.
+    """
+    u = random_block(rng, n)
+    low = np.broadcast_to(np.asarray(low, dtype=float), (n,))
+    high = np.broadcast_to(np.asarray(high, dtype=float), (n,))
+    mode = np.broadcast_to(np.asarray(mode, dtype=float), (n,))
+    # ``random.Random.triangular`` returns `low` when the limits coincide.
+    span = high - low
+    c = np.divide(mode - low, span, out=np.zeros(n), where=span != 0)
+    # Reflect draws above the mode's quantile to sample from the upper side.
+    upper = u > c
+    u = np.where(upper, 1.0 - u, u)
+    c = np.where(upper, 1.0 - c, c)
+    low, high = np.where(upper, high, low), np.where(upper, low, high)
+    return np.where(span != 0, low + (high - low) * np.sqrt(u * c), low)
+
+
+def choices_block(rng, weights, n):
+    """Generate a block of weighted choices of indices.
+
+    Parameters
+    ----------
+    rng : ``mrg32k3a.mrg32k3a.MRG32k3a``
+        Random-number generator; advanced by `n` draws.
+    weights : list [float]
+        Relative weights of the indices.
+    n : int
+        Number of choices to generate.
+
+    Returns
+    -------
+    numpy array
+        `n` indices, as from ``rng.choices(range(len(weights)), weights=weights, k=n)``.
+    """
+    cum_weights = list(itertools.accumulate(weights))
+    total = cum_weights[-1] + 0.0
+    if total <= 0.0:
+        raise ValueError("Total of weights must be greater than zero")
+    if not math.isfinite(total):
+        raise ValueError("Total of weights must be finite")
+    choices = np.searchsorted(cum_weights, random_block(rng, n) * total, side="right")
+    return np.minimum(choices, len(cum_weights) - 1)
+
+
+def gammavariate_block(rng, alpha, beta, n):
+    """Generate a block of gamma variates.
+
+    Notes
+    -----
+    For shape parameters other than 1, ``random.Random.gammavariate`` uses
+    rejection sampling and consumes a random number of uniforms per variate,
+    so those variates are generated one at a time to keep the generator in step.
+
+    Parameters
+    ----------
+    rng : ``mrg32k3a.mrg32k3a.MRG32k3a``
+        Random-number generator.
+    alpha : float
+        Shape parameter of the gamma distribution; > 0.
+    beta : float
+        Scale parameter of the gamma distribution; > 0.
+    n : int
+        Number of variates to generate.
+
+    Returns
+    -------
+    numpy array
+        `n` gamma variates, as from ``rng.gammavariate(alpha, beta)``.
+    """
+    if alpha == 1.0:
+        return -np.log(1.0 - random_block(rng, n)) * beta
+    return np.array([rng.gammavariate(alpha, beta) for _ in range(n)])
+
+
+def poissonvariates(rng, lmbda, block_size=128, max_block_size=16384):
+    """Generate Poisson variates one at a time, from blocks of uniforms.
+
+    Notes
+    -----
+    For `lmbda` < 35, ``rng.poissonvariate(lmbda)`` multiplies uniforms
+    until their product falls below exp(-`lmbda`), consuming about `lmbda`
+    uniforms per variate. Here the uniforms are drawn in blocks and
+    multiplied in the same order, so the variates are exactly the same.
+    Blocks double in size up to `max_block_size`, so long runs of variates
+    use the faster large blocks. The generator is advanced by whole blocks,
+    so it is left past the last variate used and should not be drawn from
+    directly afterwards.
+
+    Parameters
+    ----------
+    rng : ``mrg32k3a.mrg32k3a.MRG32k3a``
+        Random-number generator.
+    lmbda : float
+        Expected value of the Poisson distribution.
+    block_size : int, default=128
+        Number of uniforms in the first block.
+    max_block_size : int, default=16384
+        Maximum number of uniforms in a block.
+
+    Yields
+    ------
+    int
+        Poisson variates, as from repeated calls to ``rng.poissonvariate(lmbda)``.
+    """
+    if lmbda >= 35:
+        # The normal approximation uses a single uniform per variate.
+        while True:
+            yield rng.poissonvariate(lmbda)
+    threshold = math.exp(-lmbda)
+    u = []
+    pos = 0
+    while True:
+        n = -1
+        p = 1.0
+        while True:
+            if pos == len(u):
+                u = random_block(rng, block_size).tolist()
+                block_size = min(2 * block_size, max_block_size)
+                pos = 0
+            p = u[pos] if n < 0 else p * u[pos]
+            pos += 1
+            n += 1
+            if p < threshold:
+                break
+        yield n
+
+
+def buffered_copy(rng, block_size=128, max_block_size=16384, uniforms=(), resume_state=None):
+    """Copy a random-number generator, serving its uniforms from blocks.
+
+    Notes
+    -----
+    The copy's ``random`` method returns the next uniform from a block
+    drawn with ``random_block``; all of its other methods, e.g.,
+    ``expovariate``, ``gammavariate`` and ``choices``, draw through
+    ``random`` and so give exactly the same variates as `rng` would.
+    Blocks double in size up to `max_block_size`. The state of the copy
+    runs ahead of the variates drawn, so it should only be used for
+    drawing; `rng` itself is not advanced.
+
+    Parameters
+    ----------
+    rng : ``mrg32k3a.mrg32k3a.MRG32k3a``
+        Random-number generator to copy.
+    block_size : int, default=128
+        Number of uniforms in the first block.
+    max_block_size : int, default=16384
+        Maximum number of uniforms in a block.
+    uniforms : list [float], optional
+        Uniforms already drawn, to serve before the first block.
+    resume_state : tuple [int], optional
+        State from which to draw the first block, i.e., the state after
+        `uniforms`; by default, the current state of `rng`.
+
+    Returns
+    -------
+    new_rng : ``mrg32k3a.mrg32k3a.MRG32k3a``
+        Copy of `rng` drawing uniforms from blocks.
+    """
+    new_rng = copy_rng(rng)
+    if resume_state is not None:
+        new_rng.seed(resume_state)
+    buffer = list(reversed(uniforms))
+    block_sizes = [block_size]
+
+    def random():
+        if not buffer:
+            buffer.extend(reversed(random_block(new_rng, block_sizes[0]).tolist()))
+            block_sizes[0] = min(2 * block_sizes[0], max_block_size)
+        return buffer.pop()
+
+    new_rng.random = random
+    return new_rng
+
+
+def buffered_copies_by_subsubstream(rng, m, n):
+    """Copy a random-number generator at each of `m` consecutive
+    subsubstreams, serving the copies' uniforms from blocks.
+
+    Notes
+    -----
+    The first `n` uniforms of all copies are drawn together with
+    ``random_by_subsubstream``; a copy that needs more continues in its
+    own subsubstream (see ``buffered_copy``).
+
+    Parameters
+    ----------
+    rng : ``mrg32k3a.mrg32k3a.MRG32k3a``
+        Random-number generator; left at the start of the subsubstream
+        `m` subsubstreams after its current one.
+    m : int
+        Number of subsubstreams.
+    n : int
+        Number of uniforms to draw together from each subsubstream.
+
+    Returns
+    -------
+    list [``mrg32k3a.mrg32k3a.MRG32k3a``]
+        Copies drawing uniforms as `rng` would from each subsubstream, the
+        first from its current state.
+    """
+    rows, states = random_by_subsubstream(rng, m, n, return_states=True)
+    return [buffered_copy(rng, block_size=max(n, 1), uniforms=row, resume_state=state)
+            for row, state in zip(rows.tolist(), states)]
+
+
+def truncated_mvnormalvariate(rng, mean_vec, chol, block_size=1):
+    """Generate a nonnegative multivariate normal vector by rejection.
+
+    Notes
+    -----
+    Candidates are drawn as by ``rng.mvnormalvariate(mean_vec, chol,
+    factorized=True)``, in blocks that double in size, until one has no
+    negative component. The generator is left just after the accepted
+    candidate, as if the candidates had been drawn one at a time.
+
+    Parameters
+    ----------
+    rng : ``mrg32k3a.mrg32k3a.MRG32k3a``
+        Random-number generator.
+    mean_vec : numpy array
+        Location parameters of the multivariate normal distribution.
+    chol : numpy array
+        Lower Cholesky factor of the covariance matrix.
+    block_size : int, default=1
+        Number of candidates in the first block.
+
+    Returns
+    -------
+    numpy array
+        First candidate with no negative component.
+    """
+    n_cols = len(chol)
+    while True:
+        state = rng.get_current_state()
+        u = random_block(rng, block_size * n_cols)
+        if len(u) < MIN_LANES_BLOCK:
+            # Plain floats are faster than numpy for small blocks.
+            z = np.array([bsm(v) for v in u.tolist()]).reshape(block_size, n_cols)
+        else:
+            z = bsm_block(u).reshape(block_size, n_cols)
+        x = z @ chol.T + mean_vec
+        accepted = np.all(x >= 0, axis=1)
+        if accepted.any():
+            k = int(np.argmax(accepted))
+            if k + 1 < block_size:
+                rng.seed(advance_state(tuple(int(s) for s in state), (k + 1) * n_cols))
+            return x[k]
+        block_size *= 2
+
+
+def truncated_mvnormal_by_subsubstream(rng, mean_vec, chol, m):
+    """Generate a nonnegative multivariate normal vector from each of `m`
+    consecutive subsubstreams, by rejection.
+
+    Notes
+    -----
+    The first candidates of all subsubstreams are drawn together; the
+    few subsubstreams whose first candidate has a negative component
+    continue with ``truncated_mvnormalvariate``.
+
+    Parameters
+    ----------
+    rng : ``mrg32k3a.mrg32k3a.MRG32k3a``
+        Random-number generator; left at the start of the subsubstream
+        `m` subsubstreams after its current one.
+    mean_vec : numpy array
+        Location parameters of the multivariate normal distribution.
+    chol : numpy array
+        Lower Cholesky factor of the covariance matrix.
+    m : int
+        Number of subsubstreams.
+
+    Returns
+    -------
+    numpy array
+        Accepted vectors; `m` x len(`mean_vec`), one row per subsubstream,
+        as from ``truncated_mvnormalvariate(rng, mean_vec, chol)`` in each
+        subsubstream.
+    """
+    u, states = random_by_subsubstream(rng, m, len(chol), return_states=True)
+    x = bsm_block(u) @ chol.T + mean_vec
+    for rep in np.flatnonzero(np.any(x < 0, axis=1)):
+        rep_rng = copy_rng(rng)
+        rep_rng.seed(states[rep])
+        x[rep] = truncated_mvnormalvariate(rep_rng, mean_vec, chol, block_size=2)
+    return x
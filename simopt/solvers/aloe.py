@@ -34,6 +34,8 @@ class ALOE(Solver):
             "discrete", "continuous", "mixed"
     gradient_needed : bool
         indicates if gradient of objective function is needed
+    gradient_used : bool
+        indicates if gradient estimates are used when the problem provides them
     factors : dict
         changeable factors (i.e., parameters) of the solver
     specifications : dict
@@ -60,6 +62,7 @@ class ALOE(Solver):
         self.constraint_type = "box"
         self.variable_type = "continuous"
         self.gradient_needed = False
+        self.gradient_used = True
         self.specifications = {
             "crn_across_solns": {
                 "description": "use CRN across solutions?",
@@ -185,7 +188,7 @@ class ALOE(Solver):
         new_solution = self.create_new_solution(problem.factors["initial_solution"], problem)
         recommended_solns.append(new_solution)
         intermediate_budgets.append(expended_budget)
-        problem.simulate(new_solution, r)
+        problem.simulate(new_solution, r, need_gradients=self.gradient_used)
         expended_budget += r
         best_solution = new_solution
 
@@ -220,7 +223,7 @@ class ALOE(Solver):
             candidate_solution = self.create_new_solution(tuple(candidate_x), problem)
 
             # Use r simulated observations to estimate the objective value.
-            problem.simulate(candidate_solution, r)
+            problem.simulate(candidate_solution, r, need_gradients=self.gradient_used)
             expended_budget += r
 
             # Check the modified Armijo condition for sufficient decrease.
@@ -250,6 +253,8 @@ class ALOE(Solver):
         FnPlusMinus = np.zeros((problem.dim, 3))
         grad = np.zeros(problem.dim)
 
+        x1_solutions = []
+        x2_solutions = []
         for i in range(problem.dim):
             # Initialization.
             x1 = list(new_x)
@@ -279,25 +284,32 @@ class ALOE(Solver):
             else:
                 FnPlusMinus[i, 2] = steph2
                 x2[i] = x2[i] - FnPlusMinus[i, 2]
-            x1_solution = self.create_new_solution(tuple(x1), problem)
+            x1_solutions.append(self.create_new_solution(tuple(x1), problem))
+            x2_solutions.append(self.create_new_solution(tuple(x2), problem))
+
+        # Simulate the perturbed solutions together.
+        perturbed_solutions = []
+        for i in range(problem.dim):
+            if BdsCheck[i] != -1:
+                perturbed_solutions.append(x1_solutions[i])
+            if BdsCheck[i] != 1:
+                perturbed_solutions.append(x2_solutions[i])
+        problem.simulate_up_to(perturbed_solutions, r, need_gradients=self.gradient_used)
+
+        for i in range(problem.dim):
             if BdsCheck[i] != -1:
-                problem.simulate_up_to([x1_solution], r)
-                fn1 = -1 * problem.minmax[0] * x1_solution.objectives_mean
                 # First column is f(x+h,y).
-                FnPlusMinus[i, 0] = fn1
-            x2_solution = self.create_new_solution(tuple(x2), problem)
+                FnPlusMinus[i, 0] = -1 * problem.minmax[0] * x1_solutions[i].objectives_mean
             if BdsCheck[i] != 1:
-                problem.simulate_up_to([x2_solution], r)
-                fn2 = -1 * problem.minmax[0] * x2_solution.objectives_mean
                 # Second column is f(x-h,y).
-                FnPlusMinus[i, 1] = fn2
+                FnPlusMinus[i, 1] = -1 * problem.minmax[0] * x2_solutions[i].objectives_mean
 
             # Calculate gradient.
             if BdsCheck[i] == 0:
-                grad[i] = (fn1 - fn2) / (2 * FnPlusMinus[i, 2])
+                grad[i] = (FnPlusMinus[i, 0] - FnPlusMinus[i, 1]) / (2 * FnPlusMinus[i, 2])
             elif BdsCheck[i] == 1:
-                grad[i] = (fn1 - fn) / FnPlusMinus[i, 2]
+                grad[i] = (FnPlusMinus[i, 0] - fn) / FnPlusMinus[i, 2]
             elif BdsCheck[i] == -1:
-                grad[i] = (fn - fn2) / FnPlusMinus[i, 2]
+                grad[i] = (fn - FnPlusMinus[i, 1]) / FnPlusMinus[i, 2]
 
         return grad
@@ -41,6 +41,8 @@ class ASTRODF(Solver):
             "discrete", "continuous", "mixed"
     gradient_needed : bool
         indicates if gradient of objective function is needed
+    gradient_used : bool
+        indicates if gradient estimates are used when the problem provides them
     factors : dict
         changeable factors (i.e., parameters) of the solver
     specifications : dict
@@ -66,6 +68,7 @@ class ASTRODF(Solver):
         self.constraint_type = "box"
         self.variable_type = "continuous"
         self.gradient_needed = False
+        self.gradient_used = False
         self.specifications = {
             "crn_across_solns": {
                 "description": "use CRN across solutions",
@@ -244,6 +247,15 @@ class ASTRODF(Solver):
                 Y = self.get_rotated_basis_interpolation_points(x_k, delta_k, problem, rotate_matrix, visited_pts_list[f_index].x)
                 Z = self.get_rotated_basis_interpolation_points(np.zeros(problem.dim), delta_k, problem, rotate_matrix,
                                                          np.array(visited_pts_list[f_index].x) - np.array(x_k))
+            # Request the pilot runs of the new interpolation points at once.
+            reuse_design_point = (norm(np.array(x_k) - np.array(visited_pts_list[f_index].x)) != 0) and reuse_points == True
+            pilot_run = ceil(max(lambda_min, min(.5 * problem.dim, lambda_max)) - 1)
+            pilot_solns = {}
+            pilot_futures = {}
+            for i in range(1, 2 * problem.dim + 1):
+                if (i > 1) or not reuse_design_point:
+                    pilot_solns[i] = self.create_new_solution(tuple(Y[i][0]), problem)
+                    pilot_futures[i] = problem.simulate_async(pilot_solns[i], pilot_run, need_gradients=self.gradient_used)
             # Evaluate the function estimate for the interpolation points
             for i in range(2 * problem.dim + 1):
                 # for x_0, we don't need to simulate the new solution
@@ -259,14 +271,14 @@ class ASTRODF(Solver):
                         if sample_size >= self.get_stopping_time(k, sig2, delta_k, kappa, problem.dim) or \
                                 sample_size >= lambda_max or expended_budget >= budget:
                             break
-                        problem.simulate(new_solution, 1)
+                        problem.simulate(new_solution, 1, need_gradients=self.gradient_used)
                         expended_budget += 1
                         sample_size += 1
                         sig2 = new_solution.objectives_var
                     fval.append(-1 * problem.minmax[0] * new_solution.objectives_mean)
                     interpolation_solns.append(new_solution)
                 # else if reuse one design point, reuse the replications
-                elif (i == 1) and (norm(np.array(x_k) - np.array(visited_pts_list[f_index].x)) != 0) and reuse_points == True:
+                elif (i == 1) and reuse_design_point:
                     sample_size = visited_pts_list[f_index].n_reps
                     sig2 = visited_pts_list[f_index].objectives_var
                     # adaptive sampling
@@ -274,7 +286,7 @@ class ASTRODF(Solver):
                         if sample_size >= self.get_stopping_time(k, sig2, delta_k, kappa, problem.dim) or \
                             sample_size >= lambda_max or expended_budget >= budget:
                             break
-                        problem.simulate(visited_pts_list[f_index], 1)
+                        problem.simulate(visited_pts_list[f_index], 1, need_gradients=self.gradient_used)
                         expended_budget += 1
                         sample_size += 1
                         sig2 = visited_pts_list[f_index].objectives_var
@@ -282,16 +294,15 @@ class ASTRODF(Solver):
                     interpolation_solns.append(visited_pts_list[f_index])
                 # for new points, run the simulation with pilot run
                 else:
-                    new_solution = self.create_new_solution(tuple(Y[i][0]), problem)
+                    new_solution = pilot_solns[i]
                     visited_pts_list.append(new_solution)
-                    pilot_run = ceil(max(lambda_min, min(.5 * problem.dim, lambda_max)) - 1)
-                    problem.simulate(new_solution, pilot_run)
+                    pilot_futures[i].result()
                     expended_budget += pilot_run
                     sample_size = pilot_run
 
                     # adaptive sampling
                     while True:
-                        problem.simulate(new_solution, 1)
+                        problem.simulate(new_solution, 1, need_gradients=self.gradient_used)
                         expended_budget += 1
                         sample_size += 1
                         sig2 = new_solution.objectives_var
@@ -400,13 +411,13 @@ class ASTRODF(Solver):
                 visited_pts_list.append(new_solution)
 
             # pilot run
-            problem.simulate(new_solution, pilot_run)
+            problem.simulate(new_solution, pilot_run, need_gradients=self.gradient_used)
             expended_budget += pilot_run
             sample_size = pilot_run
             
             # adaptive sampling
             while True:
-                problem.simulate(new_solution, 1)
+                problem.simulate(new_solution, 1, need_gradients=self.gradient_used)
                 expended_budget += 1
                 sample_size += 1
                 fn = new_solution.objectives_mean
@@ -454,11 +465,11 @@ class ASTRODF(Solver):
         visited_pts_list.append(candidate_solution)
 
         # pilot run and adaptive sampling
-        problem.simulate(candidate_solution, pilot_run)
+        problem.simulate(candidate_solution, pilot_run, need_gradients=self.gradient_used)
         expended_budget += pilot_run
         sample_size = pilot_run
         while True:
-            problem.simulate(candidate_solution, 1)
+            problem.simulate(candidate_solution, 1, need_gradients=self.gradient_used)
             expended_budget += 1
             sample_size += 1
             sig2 = candidate_solution.objectives_var
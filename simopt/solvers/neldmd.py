@@ -33,6 +33,8 @@ class NelderMead(Solver):
             "discrete", "continuous", "mixed"
     gradient_needed : bool
         indicates if gradient of objective function is needed
+    gradient_used : bool
+        indicates if gradient estimates are used when the problem provides them
     factors : dict
         changeable factors (i.e., parameters) of the solver
     specifications : dict
@@ -59,6 +61,7 @@ class NelderMead(Solver):
         self.constraint_type = "box"
         self.variable_type = "continuous"
         self.gradient_needed = False
+        self.gradient_used = False
         self.specifications = {
             "crn_across_solns": {
                 "description": "use CRN across solutions?",
@@ -199,7 +202,7 @@ class NelderMead(Solver):
         # Start Solving.
         # Evaluate solutions in initial structure.
         for solution in sol:
-            problem.simulate(solution, self.factors["r"])
+            problem.simulate(solution, self.factors["r"], need_gradients=self.gradient_used)
             budget_spent += self.factors["r"]
         # Record initial solution data.
         intermediate_budgets.append(0)
@@ -222,6 +225,7 @@ class NelderMead(Solver):
             if p_refl != p_refl_copy:
                 while p_refl != p_refl_copy:
                     p_low = sort_sol[0]
+                    shrunk_sol = []
                     for i in range(1, len(sort_sol)):
                         p_new2 = p_low
                         p_new = tuple(map(lambda i, j: i + j, tuple(self.factors["delta"] * i for i in sort_sol[i].x),
@@ -229,7 +233,10 @@ class NelderMead(Solver):
                         p_new = self.check_const(p_new, p_new2.x)
                         p_new = Solution(p_new, problem)
                         p_new.attach_rngs(rng_list=self.solution_progenitor_rngs, copy=True)
-                        problem.simulate(p_new, r)
+                        shrunk_sol.append(p_new)
+                    # Simulate the shrunk points together.
+                    problem.simulate_up_to(shrunk_sol, r, need_gradients=self.gradient_used)
+                    for i, p_new in enumerate(shrunk_sol, start=1):
                         budget_spent += r
 
                         # Update sort_sol.
@@ -249,7 +256,7 @@ class NelderMead(Solver):
             # Evaluate reflected point.
             p_refl = Solution(p_refl, problem)
             p_refl.attach_rngs(rng_list=self.solution_progenitor_rngs, copy=True)
-            problem.simulate(p_refl, r)
+            problem.simulate(p_refl, r, need_gradients=self.gradient_used)
             budget_spent += r
             refl_fn_val = tuple([-1 * i for i in problem.minmax]) * p_refl.objectives_mean
 
@@ -278,7 +285,7 @@ class NelderMead(Solver):
                 # Evaluate expansion point.
                 p_exp = Solution(p_exp, problem)
                 p_exp.attach_rngs(rng_list=self.solution_progenitor_rngs, copy=True)
-                problem.simulate(p_exp, r)
+                problem.simulate(p_exp, r, need_gradients=self.gradient_used)
                 budget_spent += r
                 exp_fn_val = tuple([-1 * i for i in problem.minmax]) * p_exp.objectives_mean
 
@@ -319,7 +326,7 @@ class NelderMead(Solver):
                 # Evaluate contraction point.
                 p_cont = Solution(p_cont, problem)
                 p_cont.attach_rngs(rng_list=self.solution_progenitor_rngs, copy=True)
-                problem.simulate(p_cont, r)
+                problem.simulate(p_cont, r, need_gradients=self.gradient_used)
                 budget_spent += r
                 cont_fn_val = tuple([-1 * i for i in problem.minmax]) * p_cont.objectives_mean
 
@@ -342,6 +349,7 @@ class NelderMead(Solver):
                     # Check for new best.
                     new_best = 0
 
+                    shrunk_sol = []
                     for i in range(1, len(sort_sol)):
                         p_new2 = p_low
                         p_new = tuple(map(lambda i, j: i + j, tuple(self.factors["delta"] * i for i in sort_sol[i].x),
@@ -349,7 +357,10 @@ class NelderMead(Solver):
                         p_new = self.check_const(p_new, p_new2.x)
                         p_new = Solution(p_new, problem)
                         p_new.attach_rngs(rng_list=self.solution_progenitor_rngs, copy=True)
-                        problem.simulate(p_new, r)
+                        shrunk_sol.append(p_new)
+                    # Simulate the shrunk points together.
+                    problem.simulate_up_to(shrunk_sol, r, need_gradients=self.gradient_used)
+                    for i, p_new in enumerate(shrunk_sol, start=1):
                         budget_spent += r
                         new_fn_val = tuple([-1 * i for i in problem.minmax]) * p_new.objectives_mean
 
@@ -28,6 +28,8 @@ class RandomSearch(Solver):
             "discrete", "continuous", "mixed"
     gradient_needed : bool
         indicates if gradient of objective function is needed
+    gradient_used : bool
+        indicates if gradient estimates are used when the problem provides them
     factors : dict
         changeable factors (i.e., parameters) of the solver
     specifications : dict
@@ -54,6 +56,7 @@ class RandomSearch(Solver):
         self.constraint_type = "stochastic"
         self.variable_type = "mixed"
         self.gradient_needed = False
+        self.gradient_used = False
         self.specifications = {
             "crn_across_solns": {
                 "description": "use CRN across solutions?",
@@ -112,7 +115,7 @@ class RandomSearch(Solver):
                 new_x = problem.get_random_solution(find_next_soln_rng)
                 new_solution = self.create_new_solution(new_x, problem)
             # Simulate new solution and update budget.
-            problem.simulate(new_solution, self.factors["sample_size"])
+            problem.simulate(new_solution, self.factors["sample_size"], need_gradients=self.gradient_used)
             expended_budget += self.factors["sample_size"]
             # Check for improvement relative to incumbent best solution.
             # Also check for feasibility w.r.t. stochastic constraints.
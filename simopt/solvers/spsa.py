@@ -5,7 +5,7 @@ Simultaneous perturbation stochastic approximation (SPSA) is an algorithm for op
 """
 import numpy as np
 
-from ..base import Solver
+from ..base import Solver, wait_all
 
 
 class SPSA(Solver):
@@ -27,6 +27,8 @@ class SPSA(Solver):
             "discrete", "continuous", "mixed"
     gradient_needed : bool
         indicates if gradient of objective function is needed
+    gradient_used : bool
+        indicates if gradient estimates are used when the problem provides them
     factors : dict
         changeable factors (i.e., parameters) of the solver
     specifications : dict
@@ -53,6 +55,7 @@ class SPSA(Solver):
         self.constraint_type = "box"
         self.variable_type = "continuous"
         self.gradient_needed = False
+        self.gradient_used = False
         self.specifications = {
             "crn_across_solns": {
                 "description": "use CRN across solutions?",
@@ -187,7 +190,7 @@ class SPSA(Solver):
         recommended_solns.append(theta_sol)
         intermediate_budgets.append(expended_budget)
         # Simulate initial solution.
-        problem.simulate(theta_sol, self.factors["n_reps"])
+        problem.simulate(theta_sol, self.factors["n_reps"], need_gradients=self.gradient_used)
         expended_budget = self.factors["n_reps"]
         # Determine initial value for the parameters c, a, and A (Aalg) (according to Section III.B of Spall (1998)).
         c = float(max((theta_sol.objectives_var / self.factors["gavg"]) ** 0.5, .0001))
@@ -208,8 +211,8 @@ class SPSA(Solver):
                 thetaplus_sol = self.create_new_solution(tuple(thetaplus), problem)
                 thetaminus_sol = self.create_new_solution(tuple(thetaminus), problem)
                 # Evaluate two points and update budget spent.
-                problem.simulate(thetaplus_sol, self.factors["n_reps"])
-                problem.simulate(thetaminus_sol, self.factors["n_reps"])
+                wait_all([problem.simulate_async(thetaplus_sol, self.factors["n_reps"], need_gradients=self.gradient_used),
+                          problem.simulate_async(thetaminus_sol, self.factors["n_reps"], need_gradients=self.gradient_used)])
                 expended_budget += 2 * self.factors["n_reps"]
                 # Estimate gradient.
                 # (-minmax is needed to cast this as a minimization problem,
@@ -236,8 +239,8 @@ class SPSA(Solver):
             thetaplus_sol = self.create_new_solution(tuple(thetaplus), problem)
             thetaminus_sol = self.create_new_solution(tuple(thetaminus), problem)
             # Evaluate two points and update budget spent.
-            problem.simulate(thetaplus_sol, self.factors["n_reps"])
-            problem.simulate(thetaminus_sol, self.factors["n_reps"])
+            wait_all([problem.simulate_async(thetaplus_sol, self.factors["n_reps"], need_gradients=self.gradient_used),
+                      problem.simulate_async(thetaminus_sol, self.factors["n_reps"], need_gradients=self.gradient_used)])
             expended_budget += 2 * self.factors["n_reps"]
             # Estimate current solution's objective funtion value by weighted average.
             ftheta = ((thetaplus_sol.objectives_mean * step_weight_minus) + (thetaminus_sol.objectives_mean * step_weight_plus)) / (step_weight_plus + step_weight_minus)
@@ -34,6 +34,8 @@ class STRONG(Solver):
             "discrete", "continuous", "mixed"
     gradient_needed : bool
         indicates if gradient of objective function is needed
+    gradient_used : bool
+        indicates if gradient estimates are used when the problem provides them
     factors : dict
         changeable factors (i.e., parameters) of the solver
     specifications : dict
@@ -60,6 +62,7 @@ class STRONG(Solver):
         self.constraint_type = "box"
         self.variable_type = "continuous"
         self.gradient_needed = False
+        self.gradient_used = False
         self.specifications = {
             "crn_across_solns": {
                 "description": "use CRN across solutions?",
@@ -202,7 +205,7 @@ class STRONG(Solver):
 
         # Start with the initial solution.
         new_solution = self.create_new_solution(problem.factors["initial_solution"], problem)
-        problem.simulate(new_solution, n0)
+        problem.simulate(new_solution, n0, need_gradients=self.gradient_used)
         expended_budget += n0
         best_solution = new_solution
         recommended_solns.append(new_solution)
@@ -238,7 +241,7 @@ class STRONG(Solver):
 
                 # Step 3: Compute the ratio.
                 # Use n_r simulated observations to estimate g_new.
-                problem.simulate(candidate_solution, n_r)
+                problem.simulate(candidate_solution, n_r, need_gradients=self.gradient_used)
                 expended_budget += n_r
                 # Find the old objective value and the new objective value.
                 g_old = -1 * problem.minmax[0] * new_solution.objectives_mean
@@ -296,7 +299,7 @@ class STRONG(Solver):
                 candidate_solution = self.create_new_solution(tuple(candidate_x), problem)
                 # Step 3: Compute the ratio.
                 # Use r simulated observations to estimate g(x_start\).
-                problem.simulate(candidate_solution, n_r)
+                problem.simulate(candidate_solution, n_r, need_gradients=self.gradient_used)
                 expended_budget += n_r
                 # Find the old objective value and the new objective value.
                 g_old = -1 * problem.minmax[0] * new_solution.objectives_mean
@@ -334,11 +337,11 @@ class STRONG(Solver):
                         try_solution = self.create_new_solution(tuple(try_x), problem)
 
                         # Step 3.
-                        problem.simulate(try_solution, int(n_r + np.ceil(sub_counter**self.factors["lambda_2"])))
+                        problem.simulate(try_solution, int(n_r + np.ceil(sub_counter**self.factors["lambda_2"])), need_gradients=self.gradient_used)
                         expended_budget += int(n_r + np.ceil(sub_counter**self.factors["lambda_2"]))
                         g_b_new = -1 * problem.minmax[0] * try_solution.objectives_mean
                         dummy_solution = new_solution
-                        problem.simulate(dummy_solution, int(np.ceil(sub_counter**self.factors["lambda_2"]) - np.ceil((sub_counter - 1)**self.factors["lambda_2"])))
+                        problem.simulate(dummy_solution, int(np.ceil(sub_counter**self.factors["lambda_2"]) - np.ceil((sub_counter - 1)**self.factors["lambda_2"])), need_gradients=self.gradient_used)
                         expended_budget += int(np.ceil(sub_counter**self.factors["lambda_2"]) - np.ceil((sub_counter - 1)**self.factors["lambda_2"]))
                         dummy = -1 * problem.minmax[0] * dummy_solution.objectives_mean
                         # Update g_old.
@@ -432,6 +435,8 @@ class STRONG(Solver):
         grad = np.zeros(problem.dim)
         Hessian = np.zeros((problem.dim, problem.dim))
 
+        x1_solutions = []
+        x2_solutions = []
         for i in range(problem.dim):
             # Initialization.
             x1 = list(new_x)
@@ -461,26 +466,33 @@ class STRONG(Solver):
             else:
                 FnPlusMinus[i, 2] = steph2
                 x2[i] = x2[i] - FnPlusMinus[i, 2]
-            x1_solution = self.create_new_solution(tuple(x1), problem)
+            x1_solutions.append(self.create_new_solution(tuple(x1), problem))
+            x2_solutions.append(self.create_new_solution(tuple(x2), problem))
+
+        # Simulate the perturbed solutions together.
+        perturbed_solutions = []
+        for i in range(problem.dim):
+            if BdsCheck[i] != -1:
+                perturbed_solutions.append(x1_solutions[i])
+            if BdsCheck[i] != 1:
+                perturbed_solutions.append(x2_solutions[i])
+        problem.simulate_up_to(perturbed_solutions, n_r, need_gradients=self.gradient_used)
+
+        for i in range(problem.dim):
             if BdsCheck[i] != -1:
-                problem.simulate_up_to([x1_solution], n_r)
-                fn1 = -1 * problem.minmax[0] * x1_solution.objectives_mean
                 # First column is f(x+h,y).
-                FnPlusMinus[i, 0] = fn1
-            x2_solution = self.create_new_solution(tuple(x2), problem)
+                FnPlusMinus[i, 0] = -1 * problem.minmax[0] * x1_solutions[i].objectives_mean
             if BdsCheck[i] != 1:
-                problem.simulate_up_to([x2_solution], n_r)
-                fn2 = -1 * problem.minmax[0] * x2_solution.objectives_mean
                 # Second column is f(x-h,y).
-                FnPlusMinus[i, 1] = fn2
+                FnPlusMinus[i, 1] = -1 * problem.minmax[0] * x2_solutions[i].objectives_mean
 
             # Calculate gradient.
             if BdsCheck[i] == 0:
-                grad[i] = (fn1 - fn2) / (2 * FnPlusMinus[i, 2])
+                grad[i] = (FnPlusMinus[i, 0] - FnPlusMinus[i, 1]) / (2 * FnPlusMinus[i, 2])
             elif BdsCheck[i] == 1:
-                grad[i] = (fn1 - fn) / FnPlusMinus[i, 2]
+                grad[i] = (FnPlusMinus[i, 0] - fn) / FnPlusMinus[i, 2]
             elif BdsCheck[i] == -1:
-                grad[i] = (fn - fn2) / FnPlusMinus[i, 2]
+                grad[i] = (fn - FnPlusMinus[i, 1]) / FnPlusMinus[i, 2]
 
         if stage == 2:
             # Diagonal in Hessian.
@@ -492,7 +504,7 @@ class STRONG(Solver):
                     x3[i] = x3[i] + FnPlusMinus[i, 2] / 2
                     x3_solution = self.create_new_solution(tuple(x3), problem)
                     # Check budget.
-                    problem.simulate_up_to([x3_solution], n_r)
+                    problem.simulate_up_to([x3_solution], n_r, need_gradients=self.gradient_used)
                     fn3 = -1 * problem.minmax[0] * x3_solution.objectives_mean
                     Hessian[i, i] = 4 * (FnPlusMinus[i, 1] - 2 * fn3 + fn) / (FnPlusMinus[i, 2]**2)
                 elif BdsCheck[i] == -1:
@@ -500,7 +512,7 @@ class STRONG(Solver):
                     x4[i] = x4[i] - FnPlusMinus[i, 2] / 2
                     x4_solution = self.create_new_solution(tuple(x4), problem)
                     # Check budget.
-                    problem.simulate_up_to([x4_solution], n_r)
+                    problem.simulate_up_to([x4_solution], n_r, need_gradients=self.gradient_used)
                     fn4 = -1 * problem.minmax[0] * x4_solution.objectives_mean
                     Hessian[i, i] = 4 * (fn - 2 * fn4 + FnPlusMinus[i, 1]) / (FnPlusMinus[i, 2]**2)
 
@@ -514,7 +526,7 @@ class STRONG(Solver):
                         x5[j] = x5[j] + FnPlusMinus[j, 2]
                         x5_solution = self.create_new_solution(tuple(x5), problem)
                         # Check budget.
-                        problem.simulate_up_to([x5_solution], n_r)
+                        problem.simulate_up_to([x5_solution], n_r, need_gradients=self.gradient_used)
                         fn5 = -1 * problem.minmax[0] * x5_solution.objectives_mean
                         # Represent f(x-h,y-k).
                         x6 = list(new_x)
@@ -522,7 +534,7 @@ class STRONG(Solver):
                         x6[j] = x6[j] - FnPlusMinus[j, 2]
                         x6_solution = self.create_new_solution(tuple(x5), problem)
                         # Check budget.
-                        problem.simulate_up_to([x6_solution], n_r)
+                        problem.simulate_up_to([x6_solution], n_r, need_gradients=self.gradient_used)
                         fn6 = -1 * problem.minmax[0] * x6_solution .objectives_mean
                         # Compute second order gradient.
                         Hessian[i, j] = (fn5 - FnPlusMinus[i, 0] - FnPlusMinus[j, 0] + 2 * fn - FnPlusMinus[i, 1] - FnPlusMinus[j, 1] + fn6) / (2 * FnPlusMinus[i, 2] * FnPlusMinus[j, 2])
@@ -535,7 +547,7 @@ class STRONG(Solver):
                         x5[j] = x5[j] + FnPlusMinus[j, 2]
                         x5_solution = self.create_new_solution(tuple(x5), problem)
                         # Check budget.
-                        problem.simulate_up_to([x5_solution], n_r)
+                        problem.simulate_up_to([x5_solution], n_r, need_gradients=self.gradient_used)
                         fn5 = -1 * problem.minmax[0] * x5_solution.objectives_mean
                         # Represent f(x+/-h,y-k).
                         x6 = list(new_x)
@@ -543,7 +555,7 @@ class STRONG(Solver):
                         x6[j] = x6[j] - FnPlusMinus[j, 2]
                         x6_solution = self.create_new_solution(tuple(x6), problem)
                         # Check budget.
-                        problem.simulate_up_to([x6_solution], n_r)
+                        problem.simulate_up_to([x6_solution], n_r, need_gradients=self.gradient_used)
                         fn6 = -1 * problem.minmax[0] * x6_solution.objectives_mean
                         # Compute second order gradient.
                         Hessian[i, j] = (fn5 - FnPlusMinus[j, 0] - fn6 + FnPlusMinus[j, 1]) / (2 * FnPlusMinus[i, 2] * FnPlusMinus[j, 2] * BdsCheck[i])
@@ -556,7 +568,7 @@ class STRONG(Solver):
                         x5[j] = x5[j] + BdsCheck[j] * FnPlusMinus[j, 2]
                         x5_solution = self.create_new_solution(tuple(x5), problem)
                         # Check budget.
-                        problem.simulate_up_to([x5_solution], n_r)
+                        problem.simulate_up_to([x5_solution], n_r, need_gradients=self.gradient_used)
                         fn5 = -1 * problem.minmax[0] * x5_solution.objectives_mean
                         # Represent f(x-h,y+/-k).
                         x6 = list(new_x)
@@ -564,7 +576,7 @@ class STRONG(Solver):
                         x6[j] = x6[j] + BdsCheck[j] * FnPlusMinus[j, 2]
                         x6_solution = self.create_new_solution(tuple(x6), problem)
                         # Check budget.
-                        problem.simulate_up_to([x6_solution], n_r)
+                        problem.simulate_up_to([x6_solution], n_r, need_gradients=self.gradient_used)
                         fn6 = -1 * problem.minmax[0] * x6_solution.objectives_mean
                         # Compute second order gradient.
                         Hessian[i, j] = (fn5 - FnPlusMinus[i, 0] - fn6 + FnPlusMinus[i, 1]) / (2 * FnPlusMinus[i, 2] * FnPlusMinus[j, 2] * BdsCheck[j])
@@ -577,7 +589,7 @@ class STRONG(Solver):
                             x5[j] = x5[j] + FnPlusMinus[j, 2]
                             x5_solution = self.create_new_solution(tuple(x5), problem)
                             # Check budget.
-                            problem.simulate_up_to([x5_solution], n_r)
+                            problem.simulate_up_to([x5_solution], n_r, need_gradients=self.gradient_used)
                             fn5 = -1 * problem.minmax[0] * x5_solution.objectives_mean
                             # Compute second order gradient.
                             Hessian[i, j] = (fn5 - FnPlusMinus[i, 0] - FnPlusMinus[j, 0] + fn) / (FnPlusMinus[i, 2] * FnPlusMinus[j, 2])
@@ -589,7 +601,7 @@ class STRONG(Solver):
                             x5[j] = x5[j] - FnPlusMinus[j, 2]
                             x5_solution = self.create_new_solution(tuple(x5), problem)
                             # Check budget.
-                            problem.simulate_up_to([x5_solution], n_r)
+                            problem.simulate_up_to([x5_solution], n_r, need_gradients=self.gradient_used)
                             fn5 = -1 * problem.minmax[0] * x5_solution.objectives_mean
                             # Compute second order gradient.
                             Hessian[i, j] = (FnPlusMinus[i, 0] - fn5 - fn + FnPlusMinus[j, 1]) / (FnPlusMinus[i, 2] * FnPlusMinus[j, 2])
@@ -602,7 +614,7 @@ class STRONG(Solver):
                             x5[j] = x5[j] + FnPlusMinus[j, 2]
                             x5_solution = self.create_new_solution(tuple(x5), problem)
                             # Check budget
-                            problem.simulate_up_to([x5_solution], n_r)
+                            problem.simulate_up_to([x5_solution], n_r, need_gradients=self.gradient_used)
                             fn5 = -1 * problem.minmax[0] * x5_solution.objectives_mean
                             # Compute second order gradient.
                             Hessian[i, j] = (FnPlusMinus[j, 0] - fn - fn5 + FnPlusMinus[i, 1]) / (FnPlusMinus[i, 2] * FnPlusMinus[j, 2])
@@ -614,7 +626,7 @@ class STRONG(Solver):
                             x5[j] = x5[j] - FnPlusMinus[j, 2]
                             x5_solution = self.create_new_solution(tuple(x5), problem)
                             # Check budget.
-                            problem.simulate_up_to([x5_solution], n_r)
+                            problem.simulate_up_to([x5_solution], n_r, need_gradients=self.gradient_used)
                             fn5 = -1 * problem.minmax[0] * x5_solution.objectives_mean
                             # Compute second order gradient.
                             Hessian[i, j] = (fn - FnPlusMinus[j, 1] - FnPlusMinus[i, 1] + fn5) / (FnPlusMinus[i, 2] * FnPlusMinus[j, 2])